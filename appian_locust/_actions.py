@@ -1,12 +1,16 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 from requests.models import Response
 
 from . import logger
 from ._base import _Base
+from ._catalog import ActionEntry
+from ._form_templates import share_form_template
 from ._interactor import _Interactor
 from ._locust_error_handler import log_locust_error
+from ._sail_json import decode_response
+from ._sampling import AccessDistribution, SampleSet, UniformAccess
 from .helper import format_label
 from .uiform import SailUiForm
 
@@ -34,6 +38,13 @@ class _Actions(_Base):
         self._actions: Dict[str, Any] = dict()
         self._errors: int = 0
 
+        # Actions are cached as compact entries, set this to also keep their full JSON
+        self.keep_full_json: bool = False
+
+        # How actions are picked when visiting one without a name, and the names to pick from along with the actions they were built from
+        self._access_distribution: AccessDistribution = UniformAccess()
+        self._action_names: Optional[Tuple[Dict[str, Any], SampleSet[str]]] = None
+
     def get_all(self, search_string: str = None) -> Dict[str, Any]:
         """
         Retrieves all the available "actions" and associated metadata from "Appian-Tempo-Actions"
@@ -59,12 +70,12 @@ class _Actions(_Base):
         error_key_string = "ERROR::"
         error_key_count = 0
         try:
-            json_resp = resp.json()[0]
+            json_resp = decode_response(resp)[0]
             for current_action in json_resp["actions"]:
                 try:
                     key = current_action["displayLabel"] + \
                         "::" + current_action["opaqueId"]
-                    self._actions[key] = current_action
+                    self._actions[key] = ActionEntry(current_action, self.keep_full_json)
                 except Exception as e:
                     error_key_count += 1
                     self._actions[error_key_string + str(error_key_count)] = {}
@@ -104,13 +115,41 @@ class _Actions(_Base):
                 action_name, exact_match)))
         return current_action
 
-    def visit(self, action_name: str, exact_match: bool = False, label: str = "") -> Dict[str, Any]:
+    def set_access_distribution(self, distribution: AccessDistribution) -> None:
+        """
+        Sets how actions are picked when visiting an action without giving its name, by default all actions are equally likely
+
+        Args:
+            distribution (AccessDistribution): Distribution to pick actions with, in the order they are listed
+
+        Examples:
+
+            >>> from appian_locust._sampling import ZipfAccess
+            >>> self.appian.actions.set_access_distribution(ZipfAccess(exponent=1.2))
+
+        """
+        self._access_distribution = distribution
+
+    def get_random_action_name(self) -> str:
+        """
+        Picks the full name of an action with the access distribution of the actions, retrieving the actions if needed
+
+        Returns (str): Name of the action, "displayLabel::opaqueId"
+        """
+        if not self._actions:
+            self.get_all()
+        names = self._action_names
+        if names is None or names[0] is not self._actions or len(names[0]) != len(self._actions):
+            names = self._action_names = (self._actions, SampleSet(key for key in self._actions if not key.startswith("ERROR::")))
+        return self._access_distribution.pick(names[1].items, self.interactor.random)
+
+    def visit(self, action_name: str = "", exact_match: bool = False, label: str = "") -> Dict[str, Any]:
         """
         This function calls the API for the specific action to get its "form" data
 
         Args:
             action_name (str): Name of the action to be called. Name of the action will be in the below pattern.
-                         "displayLabel::opaquqId"
+                         "displayLabel::opaquqId". If not specified, an action is picked with the access distribution of the actions.
             exact_match (bool, optional): Should action name match exactly or to be partial match. Default : True
 
         Returns (dict): Response of actions's Get UI call in dictionary
@@ -127,6 +166,8 @@ class _Actions(_Base):
             >>> self.appian.action.visit("actio")
 
         """
+        if not action_name:
+            action_name, exact_match = self.get_random_action_name(), True
 
         action_under_test = self.get_action(action_name, exact_match)
 
@@ -142,20 +183,22 @@ class _Actions(_Base):
             headers=headers,
             label=label,
         )
-        return resp.json()
+        return share_form_template(decode_response(resp))
 
-    def visit_and_get_form(self, action_name: str, exact_match: bool = False) -> SailUiForm:
+    def visit_and_get_form(self, action_name: str = "", exact_match: bool = False) -> SailUiForm:
         """
         Gets the action by name and returns the corresponding SailUiForm to interact with
 
         If the action is activity chained, this will attempt to start the process and retrieve the chained SAIL form.
 
         Args:
-            action_name (str): Name of the action
+            action_name (str): Name of the action. If not specified, an action is picked with the access distribution of the actions
             exact_match (bool): Should action name match exactly or to be partial match. Default : True
 
         Returns: SailUiForm
         """
+        if not action_name:
+            action_name, exact_match = self.get_random_action_name(), True
         initial_action_resp: dict = self.get_action(action_name, exact_match)
         form_url = urlparse(initial_action_resp[KEY_FORM_HREF]).path
         action_key = format_label(action_name, "::", 0)
@@ -166,7 +209,7 @@ class _Actions(_Base):
         if form_json.get('empty') == 'true':
             resp: Response = self.start_action(action_name, exact_match=exact_match)
             resp.raise_for_status()
-            form_json = resp.json()
+            form_json = decode_response(resp)
 
         breadcrumb = f'Actions.SailUi.{action_key}'
         return SailUiForm(self.interactor, form_json, form_url, breadcrumb=breadcrumb)
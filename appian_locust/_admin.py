@@ -1,5 +1,6 @@
 from ._interactor import _Interactor
 from ._locust_error_handler import raises_locust_error
+from ._sail_json import decode_response
 from .uiform import SailUiForm
 
 ADMIN_URI_PATH: str = "/suite/rest/a/applications/latest/app/admin"
@@ -27,4 +28,4 @@ class Admin:
         label = "Admin.MainMenu"
         response = self.interactor.get_page(ADMIN_URI_PATH, headers=headers, label=label)
         response.raise_for_status()
-        return SailUiForm(self.interactor, response.json(), ADMIN_URI_PATH, breadcrumb=f'{label}.SailUi')
+        return SailUiForm(self.interactor, decode_response(response), ADMIN_URI_PATH, breadcrumb=f'{label}.SailUi')
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 from . import logger
 from ._interactor import _Interactor
 from ._locust_error_handler import raises_locust_error
+from ._sail_json import decode_response
 from .helper import extract_all_by_label, find_component_by_attribute_in_dict
 from .uiform import SailUiForm
 
@@ -33,7 +34,7 @@ class AppImporter:
         label = "Design.LandingPage"
         response = self.interactor.get_page(DESIGN_URI_PATH, headers=headers, label=label)
         response.raise_for_status()
-        initial_form = SailUiForm(self.interactor, response.json(), DESIGN_URI_PATH, breadcrumb=f'{label}.SailUi')
+        initial_form = SailUiForm(self.interactor, decode_response(response), DESIGN_URI_PATH, breadcrumb=f'{label}.SailUi')
 
         # Open the import modal
         modal_form = initial_form.click_button("Import")
@@ -1,15 +1,35 @@
-from .helper import list_filter
-from . import logger
-from typing import Any
+import time
+from typing import Any, Dict, Optional, Tuple
 
+from . import logger
+from ._form_memory import estimate_size
+from ._locust_error_handler import report_custom_metric
+from ._polling import is_polling
+from .helper import list_filter
 
 log = logger.getLogger(__name__)
 
+# Number of missed lookups remembered before the expired ones are dropped
+_MAX_MISSED_LOOKUPS = 1024
+
 
 class _Base():
     """
     Base class for classes ``_Actions``, ``_News``, ``_Records``, ``_Reports``, ``_Tasks``, ``Sites``
     """
+    # Seconds during which a name that could not be found, even after refreshing, does not refresh the items again.
+    # Set it to 0 on a catalog for items created during the test to be looked up as soon as they exist
+    negative_lookup_ttl: float = 30.0
+    # Minimum seconds between two refreshes caused by lookups that missed, per search string
+    min_refresh_interval: float = 1.0
+
+    # Number of lookups that refreshed the items, and of lookups that missed without refreshing them
+    forced_refreshes: int = 0
+    skipped_refreshes: int = 0
+
+    # Lookups state, created on first use since subclasses do not call this class' constructor
+    _missed_lookups: Optional[Dict[Tuple[str, bool, Optional[str]], float]] = None
+    _last_refreshes: Optional[Dict[Optional[str], float]] = None
 
     def get_all(self, search_string: str = None) -> Any:
         """
@@ -23,6 +43,15 @@ class _Base():
         Common Get function to get the specific component from dictionary of items. If item is not found, it calls
         get_all function to update itself and retry.
 
+        A name that still cannot be found after refreshing is remembered for ``negative_lookup_ttl`` seconds, during which
+        looking it up again does not refresh the items, and refreshes are at least ``min_refresh_interval`` seconds apart.
+        Every refresh is reported as a "<class name>.Refresh" entry of the "CATALOG_REFRESH" type in the statistics.
+
+        This means an item created after it was looked up and missed, such as a new task or news entry, stays invisible
+        for up to ``negative_lookup_ttl`` seconds, 30 by default. Lookups retried by ``poll_until`` are exempt, they always
+        refresh the items as the poll already spaces them out. To always refresh, set ``negative_lookup_ttl`` and
+        ``min_refresh_interval`` to 0 on the catalog, for example ``self.appian.tasks.negative_lookup_ttl = 0``.
+
         Warning: Internal function, should never be called directly.
 
         Args:
@@ -41,11 +70,11 @@ class _Base():
         if len(current_item) == 0:
             if ignore_retry:
                 return None, None
+            elif not is_polling() and not self._should_refresh((item_name, exact_match, search_string)):
+                self.skipped_refreshes += 1
+                return None, None
             else:
-                if search_string:
-                    items_in_dict = self.get_all(search_string)
-                else:
-                    items_in_dict = self.get_all()
+                items_in_dict = self._refresh(search_string)
 
         current_item = list_filter(
             list(items_in_dict.keys()), item_name, exact_match)
@@ -55,4 +84,54 @@ class _Base():
                     "More than one item matches the given name, returning the first match")
             return current_item[0], items_in_dict[current_item[0]]
         else:
+            if self.negative_lookup_ttl > 0 and not is_polling():
+                self._remember_missed_lookup((item_name, exact_match, search_string))
             return None, None
+
+    def footprint(self) -> int:
+        """
+        Estimates the memory taken by the items cached by the catalog, not counting the interactor shared with the user
+
+        Returns (int): Estimated size in bytes
+        """
+        interactor = getattr(self, "interactor", None)
+        seen = {id(interactor)}
+        return sum(estimate_size(value, seen) for value in vars(self).values() if value is not interactor)
+
+    def _should_refresh(self, lookup: Tuple[str, bool, Optional[str]]) -> bool:
+        if self._missed_lookups is None or self._last_refreshes is None:
+            self._missed_lookups = dict()
+            self._last_refreshes = dict()
+        now = time.monotonic()
+        expiry = self._missed_lookups.get(lookup)
+        if expiry is not None:
+            if now < expiry:
+                return False
+            del self._missed_lookups[lookup]
+        last_refresh = self._last_refreshes.get(lookup[2])
+        return last_refresh is None or now - last_refresh >= self.min_refresh_interval
+
+    def _remember_missed_lookup(self, lookup: Tuple[str, bool, Optional[str]]) -> None:
+        now = time.monotonic()
+        missed_lookups = self._missed_lookups
+        if missed_lookups is None:
+            return
+        if len(missed_lookups) >= _MAX_MISSED_LOOKUPS:
+            for expired in [key for key, expiry in missed_lookups.items() if expiry <= now]:
+                del missed_lookups[expired]
+        missed_lookups[lookup] = now + self.negative_lookup_ttl
+
+    def _refresh(self, search_string: Optional[str]) -> dict:
+        self.forced_refreshes += 1
+        start = time.monotonic()
+        try:
+            if search_string:
+                return self.get_all(search_string)
+            else:
+                return self.get_all()
+        finally:
+            end = time.monotonic()
+            if self._last_refreshes is not None:
+                self._last_refreshes[search_string] = end
+            client = getattr(getattr(self, "interactor", None), "client", None)
+            report_custom_metric(client, "CATALOG_REFRESH", f"{type(self).__name__}.Refresh", (end - start) * 1000)
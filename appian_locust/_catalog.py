@@ -0,0 +1,153 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Sentinel used to tell "field not present" apart from a stored ``None``
+_MISSING = object()
+
+_FieldSpec = Tuple[str, Tuple[str, ...], Optional[Callable[[Any], Any]]]
+
+# Only links that the news visit paths follow are kept
+_NEWS_LINK_RELS = ('related-records-properties', 'share', 'edit')
+
+
+def _intern(value: Any) -> Any:
+    # Values such as site url stubs or dashboards repeat for every entry, share a single copy of them
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _CatalogEntry(Mapping):
+    """
+    Compact, read-only representation of a single item cached by the ``_Records``, ``_Actions`` and ``_News``
+    catalogs. Only the fields the visit paths actually need are copied out of the raw JSON and stored in
+    ``__slots__``, so the (often very large) raw item can be garbage collected once the catalog is built.
+
+    Entries behave like read-only dictionaries, so existing ``entry["label"]`` style lookups keep working.
+    The full JSON is only retained when explicitly requested with ``keep_full_json``, in which case keys that
+    are not part of the compact representation are looked up in it.
+
+    Warning: Internal class, entries are created by the catalogs and should never be created directly.
+    """
+    __slots__ = ('_full_json',)
+    _full_json: Optional[Dict[str, Any]]
+
+    # Subclasses declare (field name, path into the raw JSON, optional converter) for every slot they keep
+    _FIELDS: Tuple[_FieldSpec, ...] = ()
+
+    def __init__(self, item: Dict[str, Any], keep_full_json: bool = False) -> None:
+        """
+        Args:
+            item (dict): Raw JSON of the catalog item
+            keep_full_json (bool, optional): Whether to retain the raw JSON alongside the compact fields. Default : False
+        """
+        for name, path, converter in self._FIELDS:
+            value: Any = item
+            for path_key in path:
+                if not isinstance(value, dict) or path_key not in value:
+                    value = _MISSING
+                    break
+                value = value[path_key]
+            if value is not _MISSING:
+                object.__setattr__(self, name, converter(value) if converter else value)
+        object.__setattr__(self, '_full_json', item if keep_full_json else None)
+
+    @property
+    def full_json(self) -> Optional[Dict[str, Any]]:
+        """
+        The raw JSON of the item, only available if the catalog was built with ``keep_full_json`` enabled
+        """
+        return self._full_json
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, _MISSING) if key in self._slot_names() else _MISSING
+        if value is not _MISSING:
+            return value
+        if self._full_json is not None and key in self._full_json:
+            return self._full_json[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._slot_names():
+            if hasattr(self, name):
+                yield name
+        if self._full_json is not None:
+            for key in self._full_json:
+                if key not in self._slot_names():
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    @classmethod
+    def _slot_names(cls) -> Tuple[str, ...]:
+        return cls.__slots__  # type: ignore
+
+
+class _LinkEntry(_CatalogEntry):
+    """
+    Link of a news entry, only keeping what is needed to follow it
+    """
+    __slots__ = ('rel', 'href')
+    _FIELDS = (
+        ('rel', ('rel',), _intern),
+        ('href', ('href',), None),
+    )
+
+
+def _to_link_entries(links: Any) -> Tuple[_LinkEntry, ...]:
+    return tuple(_LinkEntry(link) for link in links if isinstance(link, dict) and link.get('rel') in _NEWS_LINK_RELS)
+
+
+class RecordEntry(_CatalogEntry):
+    """
+    Record instance, as found in a "RecordLink" component of a record list
+    """
+    __slots__ = ('_recordRef', 'siteUrlStub', 'label', 'dashboard')
+    _FIELDS = (
+        ('_recordRef', ('_recordRef',), None),
+        ('siteUrlStub', ('siteUrlStub',), _intern),
+        ('label', ('label',), None),
+        ('dashboard', ('dashboard',), _intern),
+    )
+
+
+class RecordTypeEntry(_CatalogEntry):
+    """
+    Record type, as found in the feed items of the Tempo records page
+    """
+    __slots__ = ('title', 'urlstub')
+    _FIELDS = (
+        ('title', ('title',), None),
+        ('urlstub', ('link', 'value', 'urlstub'), None),
+    )
+
+
+class ActionEntry(_CatalogEntry):
+    """
+    Action, as returned by the Tempo available actions endpoint
+    """
+    __slots__ = ('displayLabel', 'opaqueId', 'formHref', 'initiateActionHref')
+    _FIELDS = (
+        ('displayLabel', ('displayLabel',), None),
+        ('opaqueId', ('opaqueId',), None),
+        ('formHref', ('formHref',), None),
+        ('initiateActionHref', ('initiateActionHref',), None),
+    )
+
+
+class NewsEntry(_CatalogEntry):
+    """
+    News entry, as returned by the Tempo news feed
+    """
+    __slots__ = ('id', 'title', 'links')
+    _FIELDS = (
+        ('id', ('id',), None),
+        ('title', ('title',), None),
+        ('links', ('links',), _to_link_entries),
+    )
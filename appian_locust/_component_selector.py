@@ -0,0 +1,231 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import InvalidSelectorException
+from .helper import _JSON_CONTAINERS
+
+_TYPE = re.compile(r'\*|[A-Za-z_]\w*')
+_ATTRIBUTE = re.compile(r'''\[\s*(?P<path>[\w#]+(?:\.[\w#]+)*)\s*'''
+                        r'''(?:(?P<op>=|!=|\^=|\$=|\*=)\s*'''
+                        r'''(?P<value>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^\]\s]+)\s*)?\]''')
+_NTH = re.compile(r':nth\(\s*(?P<nth>\d+)\s*\)')
+_COMBINATOR = re.compile(r'\s*>\s*')
+_WHITESPACE = re.compile(r'\s*')
+
+_MISSING = object()
+
+
+def _resolve(component: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    value: Any = component
+    for key in path:
+        if type(value) is not dict or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _parse_value(raw_value: str) -> Any:
+    if raw_value[0] == '"':
+        return json.loads(raw_value)
+    if raw_value[0] == "'":
+        return re.sub(r"\\(.)", r"\1", raw_value[1:-1])
+    # Unquoted values can be numbers, booleans or null, anything else is taken as a string
+    try:
+        return json.loads(raw_value)
+    except ValueError:
+        return raw_value
+
+
+def _compile_attribute(path: Tuple[str, ...], op: Optional[str], value: Any) -> Callable[[Dict[str, Any]], bool]:
+    if op is None:
+        return lambda component: _resolve(component, path) is not _MISSING
+    if op == '=':
+        return lambda component: _resolve(component, path) == value
+    if op == '!=':
+        return lambda component: _resolve(component, path) != value
+    text = str(value)
+    string_test: Callable[[str, str], bool] = {
+        '^=': str.startswith,
+        '$=': str.endswith,
+        '*=': lambda actual, expected: expected in actual,
+    }[op]
+
+    def string_condition(component: Dict[str, Any]) -> bool:
+        actual = _resolve(component, path)
+        return actual is not _MISSING and string_test(str(actual), text)
+    return string_condition
+
+
+class _Step:
+    """
+    One compound of a selector, i.e. a component type followed by attribute conditions and an optional ``:nth``
+    """
+    __slots__ = ('component_type', 'conditions', 'nth')
+
+    def __init__(self, component_type: Optional[str], conditions: List[Callable[[Dict[str, Any]], bool]], nth: Optional[int]) -> None:
+        self.component_type = component_type
+        self.conditions = conditions
+        self.nth = nth
+
+    def matches(self, component: Dict[str, Any]) -> bool:
+        if self.component_type is not None:
+            component_type = component['#t']
+            # Types can be namespaced, like {http://www.appian.com/ae/types/2009}CustomLink
+            if component_type != self.component_type and not (type(component_type) is str and component_type.endswith('}' + self.component_type)):
+                return False
+        for condition in self.conditions:
+            if not condition(component):
+                return False
+        return True
+
+
+class ComponentSelector:
+    """
+    Compiled form of a component selector, see ``compile_selector`` for the syntax.
+    Matching components are found in a single walk of the form, in document order.
+    """
+
+    def __init__(self, selector: str, steps: Tuple[_Step, ...]) -> None:
+        self.selector = selector
+        self._steps = steps
+
+    def __repr__(self) -> str:
+        return f"ComponentSelector({self.selector!r})"
+
+    def select(self, tree: Any) -> List[Dict[str, Any]]:
+        """
+        Args:
+            tree: JSON of the form to search
+
+        Returns:
+            All components matching the selector, in document order
+        """
+        return self._select(tree, first_only=False)
+
+    def first(self, tree: Any) -> Optional[Dict[str, Any]]:
+        """
+        Args:
+            tree: JSON of the form to search
+
+        Returns:
+            The first component matching the selector, or None. The walk stops at the first match.
+        """
+        found = self._select(tree, first_only=True)
+        return found[0] if found else None
+
+    def _select(self, tree: Any, first_only: bool) -> List[Dict[str, Any]]:
+        steps = self._steps
+        last_step = len(steps) - 1
+        # Stop as soon as the single component the last :nth allows for is found
+        stop_on_match = first_only or steps[last_step].nth is not None
+        nth_counts = [0] * len(steps)
+        results: List[Dict[str, Any]] = []
+        if type(tree) not in _JSON_CONTAINERS:
+            return results
+
+        # Each entry holds a node along with the indices of the steps matched by its ancestors,
+        # -1 standing for "nothing matched yet" which is always possible as selectors are not anchored
+        stack: List[Tuple[Any, Tuple[int, ...]]] = [(tree, (-1,))]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, matched_steps = pop()
+            if type(node) is dict:
+                if '#t' in node:
+                    # Steps are matched, and counted for :nth, once per node: matched_steps never holds
+                    # the same index twice, even when nested ancestors match the same step
+                    newly_matched: Tuple[int, ...] = ()
+                    for matched_step in matched_steps:
+                        step_index = matched_step + 1
+                        step = steps[step_index]
+                        if not step.matches(node):
+                            continue
+                        if step.nth is not None:
+                            nth_counts[step_index] += 1
+                            if nth_counts[step_index] != step.nth:
+                                continue
+                        if step_index == last_step:
+                            results.append(node)
+                            if stop_on_match:
+                                return results
+                        elif step_index not in matched_steps:
+                            newly_matched += (step_index,)
+                    if newly_matched:
+                        matched_steps = matched_steps + newly_matched
+                inner_items: Any = reversed(list(node.values()))
+            else:
+                inner_items = reversed(node)
+            for inner in inner_items:
+                if type(inner) in _JSON_CONTAINERS:
+                    push((inner, matched_steps))
+        return results
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> ComponentSelector:
+    """
+    Compiles a component selector, compiled selectors are cached so the same selector is only parsed once.
+
+    A selector is a list of compounds separated by ``>``, where ``A > B`` matches components matching ``B``
+    nested anywhere within a component matching ``A``. Each compound is made of, in this order:
+
+    - an optional component type (``#t``), namespaced types match on their local name, ``*`` matches any type
+    - any number of attribute conditions, ``[label]`` for presence or ``[label="Orders"]`` with one of the
+      operators ``=``, ``!=``, ``^=`` (starts with), ``$=`` (ends with), ``*=`` (contains). Nested attributes
+      can be reached with dots, ``[link.label="Home"]``. Unquoted values are parsed as JSON when possible,
+      so ``[index=2]`` or ``[disabled=true]`` compare against a number and a boolean.
+    - an optional ``:nth(n)``, keeping only the n-th (starting from 1) component matching the selector up to there
+
+    Args:
+        selector (str): Selector to compile
+
+    Returns:
+        The compiled selector
+
+    Example:
+        >>> compile_selector('GridField[label="Orders"] > RecordLink:nth(3)').first(form.state)
+
+        returns the third record link in the grid labeled "Orders"
+
+    """
+    steps: List[_Step] = []
+    position = _WHITESPACE.match(selector, 0).end()  # type: ignore
+    while True:
+        start = position
+        component_type: Optional[str] = None
+        conditions: List[Callable[[Dict[str, Any]], bool]] = []
+        nth: Optional[int] = None
+        type_match = _TYPE.match(selector, position)
+        if type_match:
+            component_type = None if type_match.group() == '*' else type_match.group()
+            position = type_match.end()
+        while True:
+            attribute_match = _ATTRIBUTE.match(selector, position)
+            if attribute_match:
+                path = tuple(attribute_match.group('path').split('.'))
+                raw_value = attribute_match.group('value')
+                value = _parse_value(raw_value) if raw_value is not None else None
+                conditions.append(_compile_attribute(path, attribute_match.group('op'), value))
+                position = attribute_match.end()
+                continue
+            nth_match = _NTH.match(selector, position)
+            if nth_match and nth is None:
+                nth = int(nth_match.group('nth'))
+                if nth < 1:
+                    raise InvalidSelectorException(f"Invalid selector '{selector}': :nth() starts from 1")
+                position = nth_match.end()
+                continue
+            break
+        if position == start:
+            raise InvalidSelectorException(f"Invalid selector '{selector}': unexpected '{selector[position:]}' at position {position}")
+        steps.append(_Step(component_type, conditions, nth))
+
+        position = _WHITESPACE.match(selector, position).end()  # type: ignore
+        if position == len(selector):
+            break
+        combinator_match = _COMBINATOR.match(selector, position)
+        if not combinator_match:
+            raise InvalidSelectorException(f"Invalid selector '{selector}': expected '>' at position {position}")
+        position = combinator_match.end()
+    return ComponentSelector(selector, tuple(steps))
@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from ._component_selector import ComponentSelector
+from .helper import JsonVisitor
+
+CID_KEY = "_cId"
+
+# Called with the form and the changed component, as it is in the new state of the form
+ComponentCallback = Callable[[Any, Dict[str, Any]], None]
+
+
+class ComponentSubscription:
+    """
+    Interest in the changes of some components of a form, see ``SailUiForm.subscribe``
+    """
+    __slots__ = ('callback', 'component_ids', 'selector')
+
+    def __init__(self, callback: ComponentCallback, component_ids: FrozenSet[str], selector: Optional[ComponentSelector]) -> None:
+        """
+        Args:
+            callback (Callable): Called with the form and each changed component
+            component_ids (FrozenSet[str]): cIds of the components to watch
+            selector (ComponentSelector, optional): Selector the cIds were resolved from, resolved again when the whole UI changes
+        """
+        self.callback = callback
+        self.component_ids = component_ids
+        self.selector = selector
+
+
+class ComponentSubscriptions:
+    """
+    Subscriptions of a form, indexed by cId so that a response only looks up the components it modified
+
+    Warning: Internal class, subscriptions are managed through ``SailUiForm.subscribe`` and ``SailUiForm.unsubscribe``
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: List[ComponentSubscription] = []
+        self._by_component_id: Dict[str, List[ComponentSubscription]] = dict()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def add(self, subscription: ComponentSubscription) -> None:
+        self._subscriptions.append(subscription)
+        self._index(subscription)
+
+    def remove(self, subscription: ComponentSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._unindex(subscription)
+
+    def notify(self, form: Any, state: Dict[str, Any], modified_components: Optional[Dict[str, Any]]) -> None:
+        """
+        Calls back the subscriptions to the changed components
+
+        Args:
+            form (SailUiForm): Form whose state changed
+            state (dict): New state of the form
+            modified_components (dict, optional): Components modified by a delta, by cId. None if the whole UI changed,
+                                                  in which case every watched component still in the form is considered changed
+        """
+        if modified_components is None:
+            modified_components = self._resolve(state)
+        # Listed first, so that callbacks can subscribe or unsubscribe
+        notifications = [(subscription, component)
+                         for component_id, component in modified_components.items()
+                         for subscription in self._by_component_id.get(component_id, ())]
+        for subscription, component in notifications:
+            subscription.callback(form, component)
+
+    def _resolve(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        # Components that selectors watch may have changed along with the whole UI
+        for subscription in self._subscriptions:
+            if subscription.selector is not None:
+                self._unindex(subscription)
+                subscription.component_ids = frozenset(component[CID_KEY] for component in subscription.selector.select(state)
+                                                       if CID_KEY in component)
+                self._index(subscription)
+
+        # Finds all the watched components in a single walk
+        components: Dict[str, Any] = dict()
+
+        def on_component(component: Dict[str, Any], _: List[Any]) -> bool:
+            components.setdefault(component[CID_KEY], component)
+            return False
+
+        visitor = JsonVisitor()
+        for component_id in self._by_component_id:
+            visitor.on(CID_KEY, component_id, on_component)
+        visitor.visit(state)
+        return components
+
+    def _index(self, subscription: ComponentSubscription) -> None:
+        for component_id in subscription.component_ids:
+            self._by_component_id.setdefault(component_id, []).append(subscription)
+
+    def _unindex(self, subscription: ComponentSubscription) -> None:
+        for component_id in subscription.component_ids:
+            subscriptions = self._by_component_id.get(component_id)
+            if subscriptions is not None and subscription in subscriptions:
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._by_component_id[component_id]
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import weakref
+import zlib
+from typing import Any
+
+# Favors speed, contexts are compressed on every form update
+_COMPRESSION_LEVEL = 1
+
+
+class CompressedContext:
+    """
+    SAIL context of a form, held as compressed JSON rather than as Python objects.
+
+    In stateless mode, the server sends the whole state of the form back and forth as the context, which can take far more
+    memory as Python objects than as compressed bytes. Identical contexts, such as the initial context of a form
+    opened by every user, are shared, see :func:`compress_context`.
+
+    Warning: Internal class, contexts are compressed by ``SailUiForm`` in stateless mode
+    """
+    __slots__ = ('_data', 'size', '__weakref__')
+
+    def __init__(self, data: bytes, size: int) -> None:
+        """
+        Args:
+            data (bytes): Compressed JSON of the context
+            size (int): Size of the JSON before compression
+        """
+        self._data = data
+        self.size = size
+
+    @property
+    def compressed_size(self) -> int:
+        return len(self._data)
+
+    def get(self) -> Any:
+        """
+        Returns the context, decompressed to new Python objects on every call
+        """
+        return json.loads(zlib.decompress(self._data))
+
+
+# Contexts in use, by digest of their JSON, dropped once no form holds them anymore
+_INTERNED_CONTEXTS: 'weakref.WeakValueDictionary[bytes, CompressedContext]' = weakref.WeakValueDictionary()
+
+
+def compress_context(context: Any) -> CompressedContext:
+    """
+    Compresses a context, returning the already compressed context if an identical one is held by another form
+
+    Args:
+        context: Context of the form, as decoded from the JSON response
+
+    Returns (CompressedContext): The compressed context
+    """
+    raw = json.dumps(context, separators=(',', ':')).encode()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    compressed = _INTERNED_CONTEXTS.get(digest)
+    if compressed is None:
+        compressed = _INTERNED_CONTEXTS[digest] = CompressedContext(zlib.compress(raw, _COMPRESSION_LEVEL), len(raw))
+    return compressed
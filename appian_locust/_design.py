@@ -1,5 +1,6 @@
 from ._interactor import _Interactor
 from ._locust_error_handler import raises_locust_error
+from ._sail_json import decode_response
 from .uiform import SailUiForm
 
 DESIGN_URI_PATH: str = "/suite/rest/a/applications/latest/app/design"
@@ -26,7 +27,7 @@ class Design:
         label = "Design.ApplicationList"
         response = self.interactor.get_page(DESIGN_URI_PATH, headers=headers, label=label)
         response.raise_for_status()
-        return SailUiForm(self.interactor, response.json(), DESIGN_URI_PATH, breadcrumb=f'{label}.SailUi')
+        return SailUiForm(self.interactor, decode_response(response), DESIGN_URI_PATH, breadcrumb=f'{label}.SailUi')
 
     @raises_locust_error
     def visit_object(self, opaque_id: str) -> 'SailUiForm':
@@ -46,7 +47,7 @@ class Design:
         label = "Design.SelectedObject." + opaque_id[0:10]
         response = self.interactor.get_page(uri, headers=headers, label=label)
         response.raise_for_status()
-        return SailUiForm(self.interactor, response.json(), uri, breadcrumb=f'{label}.SailUi')
+        return SailUiForm(self.interactor, decode_response(response), uri, breadcrumb=f'{label}.SailUi')
 
     @raises_locust_error
     def visit_app(self, app_id: str) -> 'SailUiForm':
@@ -66,7 +67,7 @@ class Design:
         label = f"Design.SelectedApplication.{app_id}"
         response = self.interactor.get_page(uri, headers=headers, label=label)
         response.raise_for_status()
-        return SailUiForm(self.interactor, response.json(), uri, breadcrumb=f'{label}.SailUi')
+        return SailUiForm(self.interactor, decode_response(response), uri, breadcrumb=f'{label}.SailUi')
 
     def create_application(self, application_name: str) -> 'SailUiForm':
         """
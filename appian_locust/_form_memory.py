@@ -0,0 +1,234 @@
+import json
+import sys
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
+
+from ._locust_error_handler import report_custom_metric
+from ._sail_json import loads_sail
+
+# Favors speed, states are compressed while users wait on them
+_COMPRESSION_LEVEL = 1
+
+# Type of the spill and rehydration entries in the statistics
+FORM_MEMORY_REQUEST_TYPE = "FORM_MEMORY"
+
+
+class SpilledState:
+    """
+    State of a form that was evicted from memory, held as compressed JSON until the form is used again
+
+    Warning: Internal class, states are spilled by the :class:`FormStateBudget`
+    """
+    __slots__ = ('_data', 'size')
+
+    def __init__(self, state: Dict[str, Any]) -> None:
+        """
+        Args:
+            state (dict): State to compress
+        """
+        raw = json.dumps(state, separators=(',', ':')).encode()
+        self.size = len(raw)
+        self._data = zlib.compress(raw, _COMPRESSION_LEVEL)
+
+    @property
+    def compressed_size(self) -> int:
+        return len(self._data)
+
+    def load(self) -> Dict[str, Any]:
+        # Decoded the same way as responses, so the rehydrated state shares its interned strings with the other forms
+        return loads_sail(zlib.decompress(self._data))
+
+
+class FormStateBudget:
+    """
+    Process wide budget for the states of the open ``SailUiForm`` objects. Once the states of all forms take more than
+    the budget, the states of the forms that have been used least recently are spilled to compressed bytes, and loaded
+    back the next time these forms are used.
+
+    Sizes are measured as the length of the states serialized to JSON, the Python objects of a state take several times more.
+    Measuring a state serializes it, so the budget is disabled by default.
+
+    Every spill and every rehydration is reported in the statistics as "SailUiForm.Spill" and "SailUiForm.Rehydrate"
+    entries of the "FORM_MEMORY" type, with the time it took and the size of the state.
+    """
+
+    def __init__(self, max_bytes: int = None) -> None:
+        """
+        Args:
+            max_bytes (int, optional): Total size of the states kept in memory, None to keep every state in memory. Default : None
+        """
+        self.max_bytes = max_bytes
+        self.bytes_in_memory = 0
+        self.spills = 0
+        self.rehydrations = 0
+        # Forms whose state is in memory, least recently used first, by id
+        self._forms: 'OrderedDict[int, weakref.ref]' = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes is not None
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def touch(self, form: Any) -> None:
+        """
+        Marks a form as used, so it is the last one to be spilled
+        """
+        key = id(form)
+        if key in self._forms:
+            self._forms.move_to_end(key)
+
+    def update(self, form: Any, state: Dict[str, Any]) -> None:
+        """
+        Accounts for the new state of a form, spilling the states of other forms if the budget is exceeded
+
+        Args:
+            form (SailUiForm): Form that the state belongs to
+            state (dict): New state of the form
+        """
+        key = id(form)
+        size = len(json.dumps(state, separators=(',', ':')))
+        self.bytes_in_memory += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+        if key in self._forms:
+            self._forms.move_to_end(key)
+        else:
+            self._forms[key] = weakref.ref(form, self._make_release(key))
+        self._enforce(keep=key)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns (dict): Counters of the budget, number of forms and bytes of state in memory, spills and rehydrations so far
+        """
+        return {
+            "forms_in_memory": len(self._forms),
+            "bytes_in_memory": self.bytes_in_memory,
+            "spills": self.spills,
+            "rehydrations": self.rehydrations
+        }
+
+    def release(self, form: Any) -> None:
+        """
+        Stops accounting for the state of a form, once it is spilled or no longer used
+        """
+        self._release(id(form))
+
+    def reset(self) -> None:
+        self.bytes_in_memory = 0
+        self.spills = 0
+        self.rehydrations = 0
+        self._forms.clear()
+        self._sizes.clear()
+
+    def spill(self, form: Any) -> None:
+        start = time.perf_counter()
+        size = self._sizes.get(id(form), 0)
+        form._spill_state()
+        self._release(id(form))
+        self.spills += 1
+        self._report(form, "SailUiForm.Spill", start, size)
+
+    def rehydrate(self, form: Any, load: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        state = load()
+        self.rehydrations += 1
+        self.update(form, state)
+        self._report(form, "SailUiForm.Rehydrate", start, self._sizes.get(id(form), 0))
+        return state
+
+    def _enforce(self, keep: int) -> None:
+        if self.max_bytes is None:
+            return
+        while self.bytes_in_memory > self.max_bytes and len(self._forms) > 1:
+            key, form_ref = next(iter(self._forms.items()))
+            if key == keep:
+                # The form being updated is always kept, spill the next least recently used one
+                self._forms.move_to_end(key)
+                continue
+            form = form_ref()
+            if form is None:
+                self._release(key)
+            else:
+                self.spill(form)
+
+    def _release(self, key: int) -> None:
+        self._forms.pop(key, None)
+        self.bytes_in_memory -= self._sizes.pop(key, 0)
+
+    def _make_release(self, key: int) -> Callable[[Any], None]:
+        # Only holds a weak reference to the budget, so the callback does not keep it alive
+        budget_ref = weakref.ref(self)
+
+        def release(form_ref: Any) -> None:
+            budget = budget_ref()
+            if budget is not None and budget._forms.get(key) is form_ref:
+                budget._release(key)
+        return release
+
+    def _report(self, form: Any, name: str, start: float, size: int) -> None:
+        client = getattr(getattr(form, "interactor", None), "client", None)
+        report_custom_metric(client, FORM_MEMORY_REQUEST_TYPE, name, (time.perf_counter() - start) * 1000, response_length=size)
+
+
+# Shared by every user of the process
+FORM_STATE_BUDGET = FormStateBudget()
+
+
+def set_form_state_budget(max_bytes: Optional[int]) -> None:
+    """
+    Sets the total size of the form states kept in memory by the process, see :class:`FormStateBudget`
+
+    Args:
+        max_bytes (int): Budget in bytes of JSON, None to keep every state in memory
+
+    Example:
+
+    .. code-block:: python
+
+        from appian_locust._form_memory import set_form_state_budget
+
+        set_form_state_budget(512 * 1024 * 1024)
+
+    """
+    FORM_STATE_BUDGET.max_bytes = max_bytes
+    if max_bytes is None:
+        FORM_STATE_BUDGET.reset()
+
+
+def estimate_size(obj: Any, _seen: Set[int] = None) -> int:
+    """
+    Estimates the memory taken by an object and everything it references, counting shared objects once.
+    Walks the whole object graph, so it is only meant for occasional reporting.
+
+    Args:
+        obj: Object to measure
+
+    Returns (int): Estimated size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    # Iterative, states can be deeper than the recursion limit
+    pending = [obj]
+    size = 0
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, (type, weakref.ref)) or callable(current):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, bool)) and current is not None:
+            if hasattr(current, '__dict__'):
+                pending.append(vars(current))
+            for slot in getattr(type(current), '__slots__', ()):
+                if slot != '__weakref__' and hasattr(current, slot):
+                    pending.append(getattr(current, slot))
+    return size
@@ -0,0 +1,161 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Keys of a form state that are specific to each opened form, never worth sharing
+_PER_FORM_KEYS = frozenset(("context", "uuid"))
+
+DEFAULT_MAX_TEMPLATE_NODES = 1000000
+
+
+class FormTemplateCache:
+    """
+    Shares identical parts of the forms opened by the users of the process. Users opening the same action, record type or
+    site page get structurally identical forms that only differ by their context and uuid, so every object and array of
+    a new form that is identical to one already cached is replaced by the cached one (hash consing), and the form only
+    takes the memory of what differs.
+
+    Shared parts must be treated as read only, forms never change their state in place: the ``UiReconciler`` copies
+    the objects on the path to the components a response modifies, and leaves the rest shared.
+
+    The cache holds on to every distinct object it has seen, up to ``max_nodes`` of them. Past that, new forms
+    are still deduplicated against the cached objects but no new object is added.
+    """
+
+    def __init__(self, max_nodes: int = None) -> None:
+        """
+        Args:
+            max_nodes (int, optional): Number of distinct objects and arrays to keep, None to disable sharing. Default : None
+        """
+        self.max_nodes = max_nodes
+        self.shared_nodes = 0
+        self.cached_nodes = 0
+        # Cached objects and arrays, by hash of their contents. Children are compared by identity, as they are cached first
+        self._nodes: Dict[int, List[Any]] = dict()
+        # Identities of the cached objects and arrays, which the cache keeps alive so identities are not reused
+        self._node_ids: Set[int] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_nodes is not None
+
+    def clear(self) -> None:
+        self.shared_nodes = 0
+        self.cached_nodes = 0
+        self._nodes.clear()
+        self._node_ids.clear()
+
+    def is_shared(self, node: Any) -> bool:
+        """
+        Returns (bool): Whether the object is one of the cached, read only, parts of the forms
+        """
+        return id(node) in self._node_ids
+
+    def share(self, state: Any) -> Any:
+        """
+        Replaces the parts of a form state that are identical to cached ones with the cached ones, in place
+
+        Args:
+            state (dict): State of a newly opened form, as decoded from the response. It must not be held anywhere else
+
+        Returns (dict): The state, whose parts are now shared with the other forms
+        """
+        if not self.enabled or not isinstance(state, dict):
+            return state
+        for key, value in state.items():
+            if key not in _PER_FORM_KEYS and isinstance(value, (dict, list)):
+                state[key] = self._share_tree(value)
+        return state
+
+    def _share_tree(self, root: Any) -> Any:
+        # Children are shared before their parents, without recursion since forms can be deeper than the recursion limit
+        shared: Dict[int, Any] = dict()
+        stack: List[Tuple[Any, bool]] = [(root, False)]
+        while stack:
+            node, children_shared = stack.pop()
+            if children_shared:
+                shared[id(node)] = self._share_node(node, shared)
+                continue
+            stack.append((node, True))
+            for child in (node.values() if isinstance(node, dict) else node):
+                if isinstance(child, (dict, list)) and id(child) not in shared:
+                    stack.append((child, False))
+        return shared[id(root)]
+
+    def _share_node(self, node: Any, shared: Dict[int, Any]) -> Any:
+        if isinstance(node, dict):
+            for key, child in node.items():
+                if isinstance(child, (dict, list)):
+                    node[key] = shared[id(child)]
+            signature: Any = (dict, tuple((key, _signature(child)) for key, child in node.items()))
+        else:
+            for index, child in enumerate(node):
+                if isinstance(child, (dict, list)):
+                    node[index] = shared[id(child)]
+            signature = (list, tuple(_signature(child) for child in node))
+
+        candidates = self._nodes.get(hash(signature))
+        if candidates is not None:
+            for candidate in candidates:
+                if _same_node(candidate, node):
+                    self.shared_nodes += 1
+                    return candidate
+        if self.max_nodes is not None and self.cached_nodes < self.max_nodes:
+            self._nodes.setdefault(hash(signature), []).append(node)
+            self._node_ids.add(id(node))
+            self.cached_nodes += 1
+        return node
+
+
+def _signature(value: Any) -> Any:
+    # Shared children are identified by identity, values by type as well, so that 1, 1.0 and True are told apart
+    if isinstance(value, (dict, list)):
+        return id(value)
+    return (value.__class__, value)
+
+
+def _same_node(cached: Any, node: Any) -> bool:
+    if cached.__class__ is not node.__class__ or len(cached) != len(node):
+        return False
+    if isinstance(node, dict):
+        pairs: Any = zip(cached.items(), node.items())
+        return all(cached_key == key and _same_value(cached_value, value)
+                   for (cached_key, cached_value), (key, value) in pairs)
+    return all(_same_value(cached_value, value) for cached_value, value in zip(cached, node))
+
+
+def _same_value(cached: Any, value: Any) -> bool:
+    if isinstance(value, (dict, list)):
+        return cached is value
+    return cached.__class__ is value.__class__ and cached == value
+
+
+# Shared by every user of the process
+FORM_TEMPLATE_CACHE = FormTemplateCache()
+
+
+def set_form_template_cache(max_nodes: Optional[int] = DEFAULT_MAX_TEMPLATE_NODES) -> None:
+    """
+    Enables sharing the identical parts of the forms opened through ``_Actions.visit``, ``_Records.visit_record_type``
+    and ``_Sites.visit_and_get_form``, see :class:`FormTemplateCache`
+
+    Args:
+        max_nodes (int, optional): Number of distinct objects and arrays to cache, None to stop sharing. Default : 1000000
+
+    Example:
+
+    .. code-block:: python
+
+        from appian_locust._form_templates import set_form_template_cache
+
+        set_form_template_cache()
+
+    """
+    FORM_TEMPLATE_CACHE.max_nodes = max_nodes
+    if max_nodes is None:
+        FORM_TEMPLATE_CACHE.clear()
+
+
+def share_form_template(state: Any) -> Any:
+    """
+    Shares the identical parts of a newly opened form with the other forms if the cache is enabled, see :meth:`FormTemplateCache.share`
+    """
+    return FORM_TEMPLATE_CACHE.share(state)
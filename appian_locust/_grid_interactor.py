@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 
-from .helper import extract_values, find_component_by_attribute_in_dict
+from .helper import JsonVisitor, find_component_by_attribute_in_dict
 from . import logger
 
 log = logger.getLogger(__name__)
@@ -21,10 +21,19 @@ class GridInteractor:
         return grid
 
     def find_grid_by_index(self, index: int, form: Dict[str, Any]) -> Dict[str, Any]:
-        grids = extract_values(form, '#t', "GridField")
+        grids: List[Dict[str, Any]] = []
+
+        def on_grid(grid: Dict[str, Any], _: List[Any]) -> bool:
+            grids.append(grid)
+            # No need to walk the rest of the form once the requested grid is found
+            return 0 <= index < len(grids)
+
+        visitor = JsonVisitor()
+        visitor.on('#t', "GridField", on_grid)
+        visitor.visit(form)
         if not grids:
             raise Exception("No paging grids found in form")
-        if len(grids) < index:
+        if len(grids) <= index:
             raise Exception(f"Index {index} out of range, only found {len(grids)} grid(s) in form")
         return grids[index]
 
@@ -77,6 +86,21 @@ class GridInteractor:
         grid_data['sort_info'] = new_sort_info
         return self._to_save_data(grid_data, paging_grid)
 
+    def get_columns(self, paging_grid: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """
+        Turns the columns of a grid into a dictionary of column name to the cell values of the current page.
+        Columns are named after their label, falling back to their field or position, and typed values
+        such as ``{"#t": "string", "#v": "Manual"}`` are unwrapped. Other cells, like links or images, are left as is.
+        """
+        columns: Dict[str, List[Any]] = {}
+        for position, column in enumerate(paging_grid.get("columns", [])):
+            name = column.get("label") or column.get("field") or str(position)
+            if name in columns:
+                name = f"{name}_{position}"
+            columns[name] = [cell["#v"] if type(cell) is dict and "#v" in cell else cell
+                             for cell in column.get("data", [])]
+        return columns
+
     def validate_sort(self, field_name: str, paging_grid: Dict[str, Any]) -> None:
         possible_field_names = [col.get("field") for col in paging_grid.get("columns", [])]
         if field_name not in possible_field_names:
@@ -0,0 +1,413 @@
+"""
+Compiles a browser HAR capture of an Appian session into an ``AppianTaskSequence`` that replays it with the
+appian-locust API, rather than with raw requests.
+
+Run from a shell with:
+
+    python -m appian_locust._har_compiler capture.har -o locustfile.py
+"""
+import argparse
+import datetime
+import json
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from . import logger
+from ._synthetic_documents import _FILE_SIGNATURES
+from ._ui_reconciler import UiReconciler
+from .helper import find_component_by_attribute_in_dict
+
+log = logger.getLogger(__name__)
+
+# Gaps between steps shorter than this are treated as client side processing rather than user think time
+DEFAULT_MIN_THINK_TIME = 0.5
+
+_ACTIONS_LIST = re.compile(r'/suite/api/tempo/open-a-case/available-actions')
+_TASKS_FEED = re.compile(r'/suite/api/feed/tempo')
+_TASK = re.compile(r'/suite/rest/a/task/latest/(\w+)/(attributes|status|form)$')
+_SITE_PAGE = re.compile(r'/suite/rest/a/sites/latest/([\w-]+)/pages?/([\w-]+)/(nav|report|action|record)$')
+_START_PROCESS = re.compile(r'/startProcess/([\w-]+)$')
+_RECORD_VIEW = re.compile(r'/record(?:s/item)?/([\w-]+)/view/(\w+)$')
+_UPLOAD = re.compile(r'/suite/api/tempo/file$')
+_UPLOAD_FILE_NAME = re.compile(r'filename="([^"]*)"')
+
+_TEXT_FIELDS = {"TextField", "ParagraphField", "EncryptedTextField", "IntegerField", "DecimalField"}
+_LINKS = {"DynamicLink", "ProcessTaskLink", "SafeLink", "DocumentDownloadLink"}
+
+
+class _HarEntry:
+    __slots__ = ('method', 'path', 'started', 'ended', 'request_body', 'request_size', 'response')
+
+    def __init__(self, method: str, path: str, started: float, ended: float, request_body: str,
+                 request_size: int, response: Any) -> None:
+        self.method = method
+        self.path = path
+        self.started = started
+        self.ended = ended
+        self.request_body = request_body
+        self.request_size = request_size
+        self.response = response
+
+
+class _Step:
+    """
+    One user interaction, along with the requests it was made of.
+    Steps that open a new form start a new task in the generated code.
+    """
+    __slots__ = ('code', 'name', 'opens_form', 'started', 'ended')
+
+    def __init__(self, code: str, entry: _HarEntry, name: str = "", opens_form: bool = False) -> None:
+        self.code = code
+        self.name = name
+        self.opens_form = opens_form
+        self.started = entry.started
+        self.ended = entry.ended
+
+
+def load_har(har_path: str) -> Dict[str, Any]:
+    with open(har_path, encoding="utf-8") as har_file:
+        return json.load(har_file)
+
+
+def compile_har(har: Dict[str, Any], class_name: str = "RecordedTaskSequence",
+                min_think_time: float = DEFAULT_MIN_THINK_TIME) -> str:
+    """
+    Compiles a HAR capture into the source of a locustfile
+
+    Args:
+        har (dict): Parsed HAR capture, as saved by the browser developer tools
+        class_name (str, optional): Name of the generated ``AppianTaskSequence``. Default : "RecordedTaskSequence"
+        min_think_time (float, optional): Shortest gap between two interactions that is kept as a think time, in seconds. Default : 0.5
+
+    Returns (str): Source of a locustfile replaying the capture
+
+    Examples:
+
+        >>> source = compile_har(load_har("capture.har"))
+    """
+    entries = _read_entries(har)
+    steps = _HarCompiler().compile(entries)
+    title = har.get("log", {}).get("pages", [{}])[0].get("title", "")
+    return _render(steps, class_name, min_think_time, title, _read_host(har))
+
+
+def _read_host(har: Dict[str, Any]) -> str:
+    for raw_entry in har.get("log", {}).get("entries", []):
+        url = urlparse(raw_entry.get("request", {}).get("url", ""))
+        if "/suite/" in url.path:
+            return f"{url.scheme}://{url.netloc}"
+    return ""
+
+
+def _read_entries(har: Dict[str, Any]) -> List[_HarEntry]:
+    entries = []
+    for raw_entry in har.get("log", {}).get("entries", []):
+        request = raw_entry.get("request", {})
+        path = urlparse(request.get("url", "")).path
+        if "/suite/" not in path:
+            continue
+        started = datetime.datetime.fromisoformat(raw_entry["startedDateTime"].replace("Z", "+00:00")).timestamp()
+        post_data = request.get("postData", {})
+        entries.append(_HarEntry(
+            method=request.get("method", "GET").upper(),
+            path=path,
+            started=started,
+            ended=started + max(raw_entry.get("time", 0), 0) / 1000,
+            request_body=post_data.get("text", ""),
+            request_size=max(request.get("bodySize", 0), len(post_data.get("text", ""))),
+            response=_parse_json(raw_entry.get("response", {}).get("content", {}).get("text", "")),
+        ))
+    entries.sort(key=lambda entry: entry.started)
+    return entries
+
+
+def _parse_json(text: str) -> Any:
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+class _HarCompiler:
+    """
+    Walks the entries of a capture in order, keeping track of the SAIL form the user is on so that every update
+    can be translated to the ``SailUiForm`` method for the component it changed.
+    """
+
+    def __init__(self) -> None:
+        self.state: Optional[Dict[str, Any]] = None
+        self.reconciler = UiReconciler()
+        self.action_labels: Dict[str, str] = {}
+        # Actions that chain into their first form are started with an extra request
+        self.action_start_paths: Dict[str, str] = {}
+        self.task_titles: Dict[str, str] = {}
+        self.uploads: List[Tuple[str, int]] = []
+        self.site_page: Tuple[str, str] = ("", "")
+        self.site_nav_started: Optional[float] = None
+        self.steps: List[_Step] = []
+        # What the last step opened, so that follow up requests (a task /attributes call followed by its /form) are merged into it
+        self.step_key = ""
+
+    def compile(self, entries: List[_HarEntry]) -> List[_Step]:
+        for entry in entries:
+            self._compile_entry(entry)
+        return self.steps
+
+    def _add_step(self, entry: _HarEntry, code: str, name: str = "", opens_form: bool = False, key: str = "") -> None:
+        self.steps.append(_Step(code, entry, name, opens_form))
+        self.step_key = key
+
+    def _extend_step(self, entry: _HarEntry) -> None:
+        if self.steps:
+            self.steps[-1].ended = max(self.steps[-1].ended, entry.ended)
+
+    def _compile_entry(self, entry: _HarEntry) -> None:
+        path = entry.path
+        if _ACTIONS_LIST.search(path):
+            self._read_actions(entry.response)
+            return
+        if _TASKS_FEED.search(path):
+            self._read_tasks(entry.response)
+            return
+        if _UPLOAD.search(path):
+            file_name = _UPLOAD_FILE_NAME.search(entry.request_body)
+            self.uploads.append((file_name.group(1) if file_name else "document.bin", entry.request_size))
+            self._extend_step(entry)
+            return
+
+        request_json = _parse_json(entry.request_body) if entry.method == "POST" else None
+        action_label = self.action_labels.get(path)
+        task_match = _TASK.search(path)
+        site_match = _SITE_PAGE.search(path)
+        # SAIL updates are posted back to the URL of the form, which can look like any of the navigation URLs
+        if isinstance(request_json, dict) and "updates" in request_json:
+            self._compile_updates(entry, request_json["updates"])
+        elif action_label is not None:
+            self._add_step(entry, f"form = self.appian.actions.visit_and_get_form({action_label!r}, exact_match=False)",
+                           f"action_{action_label}", opens_form=True, key=f"action:{action_label}")
+        elif path in self.action_start_paths and self.step_key == f"action:{self.action_start_paths[path]}":
+            self._extend_step(entry)
+        elif task_match:
+            task_id = task_match.group(1)
+            if self.step_key == f"task:{task_id}":
+                self._extend_step(entry)
+            else:
+                title = self.task_titles.get(task_id, task_id)
+                self._add_step(entry, f"form = self.appian.tasks.visit_and_get_form({title!r}, exact_match=False)",
+                               f"task_{title}", opens_form=True, key=f"task:{task_id}")
+        elif site_match:
+            site_name, page_name = site_match.group(1), site_match.group(2)
+            if site_match.group(3) == "nav":
+                # Sites load the navigation of the page first, the page itself comes next
+                self.site_nav_started = entry.started
+                return
+            self._add_step(entry, f"form = self.appian.sites.visit_and_get_form({site_name!r}, {page_name!r})",
+                           f"site_{site_name}_{page_name}", opens_form=True)
+            if self.site_nav_started is not None:
+                self.steps[-1].started = min(self.steps[-1].started, self.site_nav_started)
+                self.site_nav_started = None
+            self.site_page = (site_name, page_name)
+        elif _START_PROCESS.search(path):
+            self._compile_start_process(entry, _START_PROCESS.search(path).group(1))  # type: ignore
+        elif _RECORD_VIEW.search(path) and entry.method == "GET":
+            self._compile_record_link(entry, _RECORD_VIEW.search(path).group(1))  # type: ignore
+        elif "/suite/rest/a/" in path:
+            self._add_step(entry, f"# Unrecognized request: {entry.method} {path}")
+        else:
+            # Static resources, feature flags and the like, made by the browser along the way
+            return
+        self._update_state(entry.response)
+
+    def _read_actions(self, response: Any) -> None:
+        if not isinstance(response, list):
+            return
+        for group in response:
+            for action in group.get("actions", []) if isinstance(group, dict) else []:
+                form_path = urlparse(action.get("formHref", "")).path
+                if form_path:
+                    self.action_labels[form_path] = action.get("displayLabel", "")
+                    self.action_start_paths[urlparse(action.get("initiateActionHref", "")).path] = action.get("displayLabel", "")
+
+    def _read_tasks(self, response: Any) -> None:
+        if not isinstance(response, dict):
+            return
+        for entry in response.get("feed", {}).get("entries", []):
+            if entry.get("id", "").startswith("t-"):
+                self.task_titles[entry["id"][2:]] = entry.get("title", "")
+
+    def _update_state(self, response: Any) -> None:
+        if not isinstance(response, dict) or not ("ui" in response or response.get("#t") == "UiConfig"):
+            return
+        if self.state is None:
+            self.state = response
+        else:
+            self.state = self.reconciler.reconcile_ui(self.state, response)
+
+    def _find_component(self, attribute: str, value: Any) -> Optional[Dict[str, Any]]:
+        if self.state is None:
+            return None
+        return find_component_by_attribute_in_dict(attribute, value, self.state)
+
+    def _compile_start_process(self, entry: _HarEntry, process_model_id: str) -> None:
+        link = self._find_component("processModelOpaqueId", process_model_id)
+        if link and link.get("label"):
+            site_name, page_name = self.site_page
+            self._add_step(entry, f"form = form.click_start_process_link({link['label']!r}, {site_name!r}, {page_name!r})")
+        else:
+            self._add_step(entry, f"# Unrecognized start process link: {entry.method} {entry.path}")
+
+    def _compile_record_link(self, entry: _HarEntry, record_ref: str) -> None:
+        link = self._find_component("_recordRef", record_ref)
+        if link and link.get("label"):
+            self._add_step(entry, f"form = form.click_record_link({link['label']!r})")
+        else:
+            self._add_step(entry, f"# Unrecognized record link: {entry.method} {entry.path}")
+
+    def _compile_updates(self, entry: _HarEntry, updates: Any) -> None:
+        save_requests = updates.get("#v", []) if isinstance(updates, dict) else updates
+        if isinstance(save_requests, dict):
+            save_requests = [save_requests]
+        for save_request in save_requests or []:
+            component = self._find_component("_cId", save_request.get("_cId"))
+            self._add_step(entry, self._compile_update(component, save_request.get("value")))
+
+    def _compile_update(self, component: Optional[Dict[str, Any]], value: Any) -> str:
+        if component is None:
+            return "# Update of a component that is not on the captured form"
+        component_type = component.get("#t", "")
+        label = component.get("label") or ""
+        if not label:
+            return f"# Update of a {component_type} without a label"
+        if component_type in _TEXT_FIELDS:
+            return f"form = form.fill_text_field({label!r}, {str(_unwrap(value))!r})"
+        if component_type == "ButtonWidget" or component_type == "ButtonWidgetSubmit":
+            return f"form = form.click_button({label!r})"
+        if component_type in _LINKS:
+            return f"form = form.click({label!r})"
+        if component_type == "DropdownField":
+            choice = _choice_label(component, _unwrap(value))
+            return f"form = form.select_dropdown_item({label!r}, {choice!r})"
+        if component_type == "MultipleDropdownField":
+            choices = [_choice_label(component, index) for index in _as_list(_unwrap(value))]
+            return f"form = form.select_multi_dropdown_item({label!r}, {choices!r})"
+        if component_type == "CheckboxField":
+            return f"form = form.check_checkbox_by_label({label!r}, {_as_list(_unwrap(value))!r})"
+        if component_type == "RadioButtonField":
+            return f"form = form.select_radio_button_by_label({label!r}, {_unwrap(value)!r})"
+        if component_type == "DatePickerField":
+            date = str(_unwrap(value))[:10]
+            return f"form = form.fill_date_field({label!r}, datetime.date.fromisoformat({date!r}))"
+        if component_type == "FileUploadWidget":
+            return f"form = form.upload_document_to_upload_field({label!r}, {self._upload_source()})"
+        return f"# Unsupported update of {component_type} {label!r}"
+
+    def _upload_source(self) -> str:
+        file_name, size = self.uploads.pop(0) if self.uploads else ("document.bin", 0)
+        extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+        if extension in _FILE_SIGNATURES:
+            # Replayed with a generated document of the same size and type, so the locustfile runs anywhere
+            return f"generate_document({size}, {extension!r})"
+        return repr(file_name)
+
+
+def _unwrap(value: Any) -> Any:
+    # Typed values are sent as {"#t": type, "#v": value}
+    if isinstance(value, dict) and "#v" in value:
+        return value["#v"]
+    return value
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _choice_label(component: Dict[str, Any], index: Any) -> str:
+    choices = component.get("choices", [])
+    if isinstance(index, int) and 0 < index <= len(choices):
+        return choices[index - 1]
+    return str(index)
+
+
+def _method_name(index: int, name: str) -> str:
+    slug = re.sub(r'\W+', '_', name.lower()).strip('_')[:40]
+    return f"step_{index}_{slug}" if slug else f"step_{index}"
+
+
+def _render(steps: List[_Step], class_name: str, min_think_time: float, title: str, host: str) -> str:
+    uses_dates = any("datetime.date" in step.code for step in steps)
+    uses_documents = any("generate_document(" in step.code for step in steps)
+    lines = [
+        '"""',
+        f"Replays a recorded Appian session{f' ({title})' if title else ''}.",
+        "Generated by appian_locust._har_compiler, review labels and values before running it at scale.",
+        '"""',
+    ]
+    if uses_dates:
+        lines.append("import datetime")
+    lines.append("import time")
+    lines.append("")
+    lines.append("from locust import HttpUser, constant, task")
+    lines.append("")
+    lines.append("from appian_locust import AppianTaskSequence")
+    if uses_documents:
+        lines.append("from appian_locust._synthetic_documents import generate_document")
+    lines += ["", "", f"class {class_name}(AppianTaskSequence):"]
+
+    task_count = 0
+    previous: Optional[_Step] = None
+    has_form = False
+    for step in steps:
+        if step.opens_form or task_count == 0:
+            task_count += 1
+            lines += ["", "    @task", f"    def {_method_name(task_count, step.name)}(self) -> None:"]
+            has_form = False
+        if previous is not None:
+            think_time = step.started - previous.ended
+            if think_time >= min_think_time:
+                lines.append(f"        time.sleep({think_time:.3f})")
+        code = step.code
+        if code.startswith("form = form.") and not has_form:
+            code = f"# Not replayed, happened on a form opened before the capture started: {code}"
+        lines.append(f"        {code}")
+        has_form = has_form or step.opens_form
+        previous = step
+
+    if not task_count:
+        lines += ["    @task", "    def replay(self) -> None:", "        pass"]
+    lines += [
+        "",
+        "",
+        f"class {class_name}User(HttpUser):",
+        f"    tasks = [{class_name}]",
+        f"    host = {host!r}",
+        '    auth = ["username", "password"]',
+        "    # Think times from the capture are part of the tasks",
+        "    wait_time = constant(0)",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compiles a HAR capture of an Appian session into an appian-locust task sequence")
+    parser.add_argument("har", help="Path to the HAR capture")
+    parser.add_argument("-o", "--output", help="Path of the generated locustfile, printed if not provided")
+    parser.add_argument("--class-name", default="RecordedTaskSequence", help="Name of the generated task sequence")
+    parser.add_argument("--min-think-time", type=float, default=DEFAULT_MIN_THINK_TIME,
+                        help="Shortest gap between two interactions kept as a think time, in seconds")
+    args = parser.parse_args(argv)
+
+    source = compile_har(load_har(args.har), class_name=args.class_name, min_think_time=args.min_think_time)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(source)
+        log.info(f"Wrote {args.output}")
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,22 @@ import os
 import sys
 import urllib.parse
 from datetime import date, datetime, timedelta
-from re import match, search
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from locust.clients import HttpSession, ResponseContextManager
 from requests import Response
 
 from . import logger
 from ._locust_error_handler import log_locust_error, test_response_for_error
+from ._pacing import PacingEngine
+from ._sampling import create_user_random
+from ._sail_json import decode_response
 from ._save_request_builder import save_builder
+from ._transactions import Transaction
+from ._upload_cache import UPLOAD_CACHE, DocumentIdReusePolicy, MultipartFileBody, UploadCache, UploadSource, read_upload_source
 from .exceptions import BadCredentialsException, MissingCsrfTokenException, ComponentNotFoundException
 from .helper import find_component_by_attribute_in_dict, get_username
-from .records_helper import get_url_stub_from_record_list_post_request_url
+from .records_helper import RecordLinkRoute, get_record_link_route, get_url_stub_from_record_list_post_request_url
 
 log = logger.getLogger(__name__)
 
@@ -42,10 +46,36 @@ class _Interactor:
         self.record_mode = True if hasattr(self.client, "record_mode") else False
         self.datatype_cache = DataTypeCache()
         self.user_agent = ""
+        # Opt-in, see enable_upload_cache
+        self.upload_cache: Optional[UploadCache] = None
+        self.document_id_reuse = DocumentIdReusePolicy()
+        # Random generator of the user, seeded from the run seed if one is set, see _sampling.set_run_seed
+        self.random = create_user_random()
+        # Whether the server keeps the state of SAIL forms (stateful) or the client sends it with every request (stateless)
+        self.stateless = False
+        # Open business transactions of the user, innermost last, see transaction
+        self.transactions: List[Transaction] = []
+        # Think time between the interactions with forms, opt-in, see AppianClient.set_pacing
+        self.pacing: Optional[PacingEngine] = None
         # Set to default as desktop request.
         self.set_user_agent_to_desktop()
 
     # GENERIC UTILITY METHODS
+    def transaction(self, name: str) -> Transaction:
+        """
+        Groups the requests sent within it into a business transaction, reported as a single entry in the statistics
+
+        Args:
+            name (str): Name of the entry in the statistics
+
+        Returns (Transaction): Context manager of the transaction, see :class:`Transaction`
+        """
+        return Transaction(self, name)
+
+    def _record_in_transactions(self, resp: Response) -> None:
+        for transaction in self.transactions:
+            transaction.record_response(resp)
+
     def set_user_agent_to_desktop(self) -> None:
         self.user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_12_6) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/61.0.3163.100 Safari/537.36"
 
@@ -83,7 +113,7 @@ class _Interactor:
             "DNT": "1",
             "X-APPIAN-CSRF-TOKEN": self.client.cookies.get("__appianCsrfToken", ""),
             "X-APPIAN-MP-CSRF-TOKEN": self.client.cookies.get("__appianMultipartCsrfToken", ""),
-            "X-Appian-Ui-State": "stateful",
+            "X-Appian-Ui-State": "stateless" if self.stateless else "stateful",
             "X-Appian-Features": self.client.feature_flag,
             "X-Appian-Features-Extended": self.client.feature_flag_extended,
             "x-libraries-suppress-www-authenticate": "true",
@@ -118,7 +148,7 @@ class _Interactor:
 
         Args:
             uri: API URI to be called
-            payload: Body of the API request. Can be either JSON or text input to allow for different payload types.
+            payload: Body of the API request. Can be either JSON, text, bytes or a streamed multipart body to allow for different payload types.
             headers: header for the REST API Call
             label: the label to be displayed by locust
 
@@ -131,17 +161,21 @@ class _Interactor:
 
         uri = self.replace_base_path_if_appropriate(uri)
         username = get_username(self.auth)
+        post_payload: Any
         if files:  # When a file is specified, don't send any data in the 'data' field
             post_payload = None
         elif isinstance(payload, dict):
             post_payload = json.dumps(payload).encode()
         elif isinstance(payload, str):
             post_payload = payload.encode()
+        elif isinstance(payload, (bytes, MultipartFileBody)):
+            post_payload = payload
         else:
-            log_locust_error(Exception("Cannot POST a payload that is not of type dict or string"))
+            log_locust_error(Exception("Cannot POST a payload that is not of type dict, string, bytes or multipart body"))
             sys.exit(1)
         with self.client.post(uri, data=post_payload, headers=headers, name=label, files=files,
                               catch_response=True) as resp:  # type: ResponseContextManager
+            self._record_in_transactions(resp)
             try:
                 test_response_for_error(resp, uri, raise_error=check_login, username=username)
             except Exception as e:
@@ -242,6 +276,7 @@ class _Interactor:
         if headers is not None:
             kwargs['headers'] = headers
         with self.client.get(uri, **kwargs) as resp:  # type: ResponseContextManager
+            self._record_in_transactions(resp)
             if check_login:
                 self.check_login(resp)
             test_response_for_error(resp, uri, raise_error=check_login, username=username)
@@ -280,34 +315,74 @@ class _Interactor:
         resp = self.get_page(uri, headers=headers, label=label)
         return resp
 
-    def upload_document_to_server(self, file_path: str, is_encrypted: bool = False) -> int:
+    def enable_upload_cache(self, document_id_uses: int = 1, cache: UploadCache = None) -> None:
+        """
+        Serves uploaded documents from a content-addressed cache, so that files are read from disk once per process
+        rather than on every upload. Optionally lets the document id returned by an upload be reused for the
+        next uploads of the same content, which should only be used when upload throughput is not being measured.
+
+        Args:
+            document_id_uses (int, optional): Number of uses of a document id before the content is uploaded again, 1 disables reuse. Default : 1
+            cache (UploadCache, optional): Cache to use, defaults to the one shared by the whole process
+
+        Examples:
+
+            >>> self.appian.interactor.enable_upload_cache(document_id_uses=10)
+        """
+        self.upload_cache = cache if cache is not None else UPLOAD_CACHE
+        self.document_id_reuse = DocumentIdReusePolicy(document_id_uses)
+
+    def disable_upload_cache(self) -> None:
+        """
+        Goes back to reading and uploading documents on every call
+        """
+        self.upload_cache = None
+        self.document_id_reuse = DocumentIdReusePolicy()
+
+    def upload_document_to_server(self, file_path: Union[str, UploadSource], is_encrypted: bool = False) -> int:
         '''
         Uploads a document to the server, so that it can be used in upload fields
         Args:
             uri: API URI to be called
-            file_path: Path to the file to be uploaded
+            file_path: Path to the file to be uploaded, or an in-memory document such as a generated one
 
         Returns: Document Id that can be used for upload fields
         ''',
 
+        if isinstance(file_path, UploadSource):
+            source, file_name = file_path, file_path.name
+        else:
+            source = read_upload_source(file_path) if self.upload_cache is None else self.upload_cache.get(file_path)
+            file_name = os.path.basename(file_path)
+
+        if self.upload_cache is None:
+            return self._post_document(file_name, source, is_encrypted)
+        doc_id = self.document_id_reuse.checkout(source.digest, is_encrypted)
+        if doc_id is None:
+            doc_id = self._post_document(file_name, source, is_encrypted)
+            self.document_id_reuse.record(source.digest, doc_id, is_encrypted)
+        return doc_id
+
+    def _post_document(self, file_name: str, source: UploadSource, is_encrypted: bool) -> int:
         # Override default headers to avoid sending SAIL headers here
         headers = self.setup_request_headers()
         if is_encrypted:
             headers['encrypted'] = 'true'
-        with open(file_path, 'rb') as f:
-            resp_label = "Document.Upload." + os.path.basename(file_path).strip(" .")
-            files = {"file": f}
-            response = self.post_page(
-                "/suite/api/tempo/file?validateExtension=false",
-                headers=headers,
-                label=resp_label,
-                files=files)
-            if self.record_mode:
-                self.write_response_to_lib_folder(resp_label, response)
-            else:
-                response.raise_for_status()
-            doc_id = response.json()[0]["id"]
-            return doc_id
+        # The multipart body is streamed from the source, instead of being encoded by requests on every upload
+        body = source.multipart_body(file_name)
+        headers['Content-Type'] = body.content_type
+        resp_label = "Document.Upload." + file_name.strip(" .")
+        response = self.post_page(
+            "/suite/api/tempo/file?validateExtension=false",
+            payload=body,
+            headers=headers,
+            label=resp_label)
+        if self.record_mode:
+            self.write_response_to_lib_folder(resp_label, response)
+        else:
+            response.raise_for_status()
+        doc_id = decode_response(response)[0]["id"]
+        return doc_id
 
     def write_response_to_lib_folder(self, label: Optional[str], response: Response) -> None:
         """
@@ -335,7 +410,8 @@ class _Interactor:
             log.info(cleaned_label + ' | X-Trace-Id: ' + response.headers['X-Trace-Id'])
 
     def click_record_link(self, get_url: str, component: Dict[str, Any], context: Dict[str, Any],
-                          label: str = None, headers: Dict[str, Any] = None, locust_label: str = "") -> Dict[str, Any]:
+                          label: str = None, headers: Dict[str, Any] = None, locust_label: str = "",
+                          route: RecordLinkRoute = None) -> Dict[str, Any]:
         '''
         Use this function to interact specifically with record links, which represent links to new sail forms.
         Args:
@@ -344,6 +420,7 @@ class _Interactor:
             context: the Sail context parsed from the json response
             label: the label to be displayed by locust for this action
             headers: header for the REST API call
+            route: route of the record links on the form at get_url, worked out from get_url if not provided
 
         Returns: the response of get RecordLink operation as json
         '''
@@ -358,41 +435,17 @@ class _Interactor:
         dashboard = component.get('dashboard', "")
         if not dashboard:
             dashboard = "summary"
-        record_view_url_stub = f"/view/{dashboard}"
         if not record_ref:
             e = Exception("Cannot find _recordRef attribute in RecordLink component.")
             log_locust_error(e, raise_error=True)
-        record_link_url_suffix = record_ref + record_view_url_stub
-
-        # Logic to construct record link URL in tempo and sites
-        if "tempo" in get_url:
-            record_link_url = "/suite/tempo/records/item/" + record_link_url_suffix
-        elif "sites" in get_url and "/record/" in get_url:
-            parse_pattern = "/record/"
-            record_link_url = get_url[:get_url.index(parse_pattern) + len(parse_pattern)] + record_link_url_suffix
-        elif match(r'.*\/page\/\w+$', get_url):
-            record_link_url = get_url + "/record/" + record_link_url_suffix
-        # Support record links on site pages
-        elif "sites" in get_url and "/report" in get_url and "/pages/" in get_url:
-            page_search = search(r'(?<=\/pages\/)\w+', get_url)
-            if page_search:
-                page_name = page_search.group()
-            else:
-                e = Exception("Unexpected record link URL - couldn't find page name after /pages/")
-                log_locust_error(e, raise_error=True)
-            parse_pattern = page_name + "/report"
-            url_prefix_index = get_url.index(parse_pattern) + len(page_name)
-            # record_link_url = get_url[:get_url.index(parse_pattern) + len(page_name)].replace("/pages/",
-            record_link_url = get_url[:url_prefix_index].replace("/pages/",
-                                                                 "/page/") + "/record/" + record_link_url_suffix
-        # Support record view links from a record within a site
-        elif "record" in get_url:
-            site_name = component.get('siteUrlStub', "")
-            page_name = component.get('pageUrlStub', "")
-            record_link_url = f"/suite/rest/a/sites/latest/{site_name}/page/{page_name}/record/{record_link_url_suffix}"
-        else:
-            e = Exception("Unexpected record link URL")
-            log_locust_error(e, raise_error=True)
+
+        if route is None:
+            try:
+                route = get_record_link_route(get_url)
+            except Exception as route_error:
+                log_locust_error(route_error, raise_error=True)
+                raise
+        record_link_url = route.build_url(record_ref, dashboard, component)
 
         if not get_url or not record_link_url:
             e = Exception("Cannot make Record Link request.")
@@ -406,7 +459,7 @@ class _Interactor:
         resp = self.get_page(
             self.host + record_link_url, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def click_start_process_link(self, component: Dict[str, Any], process_model_opaque_id: str,
                                  cache_key: str, site_name: str, page_name: str, is_mobile: bool = False,
@@ -435,7 +488,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + spl_link_url, payload={}, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def click_related_action(self, component: Dict[str, Any], record_type_stub: str, opaque_record_id: str,
                              opaque_related_action_id: str, locust_request_label: str = "") -> Dict[str, Any]:
@@ -460,7 +513,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + related_action_link_url, payload={}, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     # COMPONENT RELATED METHODS
 
@@ -481,22 +534,21 @@ class _Interactor:
             Returns: the response of post operation as json
         '''
         if "link" in component:
-            wrapper_label = component["label"]
-            component = component["link"]
-            component["label"] = wrapper_label
+            # Copied, since the components of a form can be shared with other forms
+            component = {**component["link"], "label": component["label"]}
 
         payload = save_builder() \
             .component(component) \
             .context(context) \
             .uuid(uuid) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Click \'{component["label"]}\' Component'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     # Aliases for click_component to preserve backwards compatibiltiy and increase readability
     click_button = click_component
@@ -531,14 +583,14 @@ class _Interactor:
             .uuid(uuid) \
             .value(new_value) \
             .record_url_stub(url_stub) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Select \'{dropdown["label"]}\' Dropdown'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def send_multiple_dropdown_update(self, post_url: str, multi_dropdown: Dict[str, Any], context: Dict[str, Any],
                                       uuid: str, index: List[int], label: str = None, url_stub: str = None) -> Dict[str, Any]:
@@ -569,14 +621,14 @@ class _Interactor:
             .uuid(uuid) \
             .value(new_value) \
             .record_url_stub(url_stub) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Select \'{multi_dropdown["label"]}\' Dropdown'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def get_primary_button_payload(self, page_content_in_json: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -588,8 +640,7 @@ class _Interactor:
         Returns: payload of the primary button
 
         """
-        primary_button = page_content_in_json["ui"]["contents"][0]["buttons"]["primaryButtons"][0]
-        primary_button["#t"] = "ButtonWidget"
+        primary_button = {**page_content_in_json["ui"]["contents"][0]["buttons"]["primaryButtons"][0], "#t": "ButtonWidget"}
         context = page_content_in_json["context"]
         uuid = page_content_in_json["uuid"]
         payload = save_builder() \
@@ -621,14 +672,14 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Fill \'{text_field["label"]}\' TextField'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def fill_pickerfield_text(self, post_url: str, picker_field: Dict[str, Any], text: str,
                               context: Dict[str, Any], uuid: str, label: str = None) -> Dict[str, Any]:
@@ -655,14 +706,14 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Fill \'{picker_field["label"]}\' PickerField'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def select_pickerfield_suggestion(self, post_url: str, picker_field: Dict[str, Any], selection: Dict[str, Any],
                                       context: Dict[str, Any], uuid: str, label: str = None) -> Dict[str, Any]:
@@ -692,14 +743,14 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = label or f'Fill \'{picker_field["label"]}\' PickerField'
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def select_checkbox_item(self, post_url: str, checkbox: Dict[str, Any],
                              context: Dict[str, Any], uuid: str, indices: list,
@@ -727,7 +778,7 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = context_label or "Checking boxes for " + checkbox.get("testLabel",
                                                                              checkbox.get("label", "label-not-found"))
@@ -735,7 +786,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def click_selected_tab(self, post_url: str, tab_group_component: Dict[str, Any], tab_label: str,
                            context: Dict[str, Any], uuid: str) -> Dict[str, Any]:
@@ -772,14 +823,14 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = f"Selecting tab with label: '{tab_label}' inside TabButtonGroup component"
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def select_radio_button(self, post_url: str, buttons: Dict[str, Any], context: Dict[str, Any],
                             uuid: str, index: int, context_label: str = None) -> Dict[str, Any]:
@@ -806,12 +857,12 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         resp = self.post_page(
             self.host + post_url, payload=payload, label=context_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def upload_document_to_field(self, post_url: str, upload_field: Dict[str, Any],
                                  context: Dict[str, Any], uuid: str, doc_id: int,
@@ -840,7 +891,7 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = locust_label or "Uploading Document to " + \
             upload_field.get("label", upload_field.get("testLabel", "Generic FileUpload"))
@@ -850,7 +901,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=payload, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def update_date_field(self, post_url: str, date_field_component: Dict[str, Any],
                           date_input: date, context: Dict[str, Any], uuid: str,
@@ -877,7 +928,7 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = locust_label or "Filling Date Field for " + \
             date_field_component.get("label", date_field_component.get("testLabel", "DateField"))
@@ -887,7 +938,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=payload, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def update_datetime_field(self, post_url: str, datetime_field: Dict[str, Any],
                               datetime_input: datetime, context: Dict[str, Any], uuid: str,
@@ -915,7 +966,7 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_value) \
-            .build()
+            .build_json()
 
         locust_label = locust_label or "Filling Date Time Field for " + \
             datetime_field.get("label", datetime_field.get("testLabel", "DateField"))
@@ -925,7 +976,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=payload, headers=headers, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def update_grid_from_sail_form(self, post_url: str,
                                    grid_component: Dict[str, Any], new_grid_save_value: Dict[str, Any],
@@ -949,13 +1000,13 @@ class _Interactor:
             .context(context) \
             .uuid(uuid) \
             .value(new_grid_save_value) \
-            .build()
+            .build_json()
 
         locust_label = context_label or "Updating Grid " + grid_component.get("label", "")
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def interact_with_record_grid(self, post_url: str,
                                   grid_component: Dict[str, Any],
@@ -986,7 +1037,7 @@ class _Interactor:
             self.host + post_url, payload=payload, label=locust_label
         )
         resp.raise_for_status()
-        return resp.json()
+        return decode_response(resp)
 
     def refresh_after_record_action(self, post_url: str, record_action_component: Dict[str, Any],
                                     record_action_trigger_component: Dict[str, Any],
@@ -1029,7 +1080,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=record_action_payload, label=label
         )
-        return resp.json()
+        return decode_response(resp)
 
     def click_record_search_button(self, post_url: str, component: Dict[str, Any], context: Dict[str, Any],
                                    uuid: str, label: str = None) -> Dict[str, Any]:
@@ -1074,7 +1125,7 @@ class _Interactor:
         resp = self.post_page(
             self.host + post_url, payload=payload, label=locust_label
         )
-        return resp.json()
+        return decode_response(resp)
 
 
 class DataTypeCache(object):
@@ -126,6 +126,36 @@ def log_locust_error(e: Exception, error_desc: str = 'No description', location:
         raise e
 
 
+def report_custom_metric(client: Any, request_type: str, name: str, response_time: float,
+                         response_length: int = 0, exception: Optional[Exception] = None) -> None:
+    """
+    Reports a measurement that is not a single HTTP request, such as the duration of a multi request workflow,
+    to the locust statistics, where it shows up as its own entry next to the requests.
+
+    Args:
+        client: Locust session/client object, its request event is used if it has one
+        request_type (str): Type shown for the entry in the statistics, for example "TASK_PIPELINE"
+        name (str): Name of the entry in the statistics
+        response_time (float): Measured duration, in milliseconds
+        response_length (int): Size to report for the entry. Default : 0
+        exception (Exception): Reports the measurement as a failure if set
+
+    Returns:
+        None
+
+    Example:
+
+    .. code-block:: python
+
+        start = time.perf_counter()
+        form = form.click_button("Submit")
+        report_custom_metric(self.client, "WORKFLOW", "Submit", (time.perf_counter() - start) * 1000)
+    """
+    request_event = getattr(client, "request_event", None) or ENV.events.request
+    request_event.fire(request_type=request_type, name=name, response_time=response_time,
+                       response_length=response_length, response=None, context={}, exception=exception)
+
+
 def raises_locust_error(func: Callable) -> Callable:
     """Indicates that the below method should log a locust error
 
@@ -1,12 +1,16 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from appian_locust import logger
 from appian_locust._base import _Base
+from appian_locust._catalog import NewsEntry
 from appian_locust._interactor import _Interactor
 from appian_locust._locust_error_handler import log_locust_error
+from appian_locust._sail_json import decode_response
 
 log = logger.getLogger(__name__)
 
+ERROR_KEY_STRING = "ERROR::"
+
 
 class _News(_Base):
     def __init__(self, interactor: _Interactor) -> None:
@@ -27,11 +31,23 @@ class _News(_Base):
         self._news: Dict[str, Any] = dict()
         self._errors: int = 0
 
+        # News entries are cached as compact entries, set this to also keep their full JSON
+        self.keep_full_json: bool = False
+
+        # Keys of the cached entries by entry id, so that refreshed entries replace the cached ones
+        self._keys_by_id: Dict[str, str] = dict()
+        # Search string of the cached feed, along with its links to newer and older entries
+        self._feed_search_string: Optional[str] = None
+        self._newer_entries_uri: Optional[str] = None
+        self._older_entries_uri: Optional[str] = None
+
     def get_all(self, search_string: str = None) -> Dict[str, Any]:
         """
         Retrieves all the available "news" and associated metadata from "Appian-Tempo-News"
 
-        Note: All the retrieved data about news is stored in the private variable self._news
+        Note: All the retrieved data about news is stored in the private variable self._news. Only the first page of the feed is
+        requested, further calls for the same search string only request the entries that are newer than the ones already retrieved.
+        Older entries are loaded with ``load_next_page``, or by ``get_news`` when looking for an entry that has not been loaded yet.
 
         Args:
             search_string(str, optional): results will be filtered based on the search string.
@@ -50,29 +66,82 @@ class _News(_Base):
             uri = "/suite/api/feed/tempo?t=e,x,b&m=menu-news&st=o"
             label = "News.Feed"
 
+        # The same feed was loaded before, only request the entries that are newer than the ones cached
+        if self._newer_entries_uri and search_string == self._feed_search_string:
+            feed = decode_response(self.interactor.get_page(uri=self._newer_entries_uri, label=label + ".Refresh")).get('feed', {})
+            self._add_entries(feed, self._newer_entries_uri, newer=True)
+            self._newer_entries_uri = self._get_feed_link(feed, "previous") or self._newer_entries_uri
+            return self._news
+
         self._news = dict()
-        error_key_string = "ERROR::"
-        error_key_count = 0
+        self._keys_by_id = dict()
+        self._errors = 0
 
         # request the list of feeds
-        response = self.interactor.get_page(uri=uri, label=label)
+        feed = decode_response(self.interactor.get_page(uri=uri, label=label)).get('feed', {})
+        self._add_entries(feed, uri)
+        self._feed_search_string = search_string
+        self._newer_entries_uri = self._get_feed_link(feed, "previous")
+        self._older_entries_uri = self._get_feed_link(feed, "next")
+
+        if len(self._news) == 0:
+            log.warning(f"News search failed for keyword: '{search_string}'")
+        return self._news
+
+    def load_next_page(self) -> bool:
+        """
+        Loads the next page of older entries of the last retrieved feed, adding them to the cached news
 
-        for current_item in response.json().get('feed', {}).get('entries', []):
+        Returns (bool): Whether there was a page to load
+
+        Examples:
+
+            >>> self.appian.news.get_all()
+            >>> while self.appian.news.load_next_page():
+            ...     pass
+
+        """
+        if not self._older_entries_uri:
+            return False
+        uri = self._older_entries_uri
+        label = "News.Search." + self._feed_search_string if self._feed_search_string else "News.Feed"
+        feed = decode_response(self.interactor.get_page(uri=uri, label=label + ".Page")).get('feed', {})
+        self._add_entries(feed, uri)
+        self._older_entries_uri = self._get_feed_link(feed, "next")
+        return True
+
+    def _add_entries(self, feed: Dict[str, Any], uri: str, newer: bool = False) -> None:
+        entries: Dict[str, Any] = dict()
+        for current_item in feed.get('entries', []):
             try:
                 if isinstance(current_item, dict) and 'title' in current_item:
                     title = current_item['title'].strip()
                     news_id = current_item['id'].strip()
                     key = news_id + "::" + title
-                    self._news[key] = current_item
+                    entries[key] = NewsEntry(current_item, self.keep_full_json)
+                    # An entry that changed since it was cached, its title may be different
+                    previous_key = self._keys_by_id.pop(news_id, None)
+                    if previous_key is not None:
+                        self._news.pop(previous_key, None)
+                    self._keys_by_id[news_id] = key
             except Exception as e:
-                error_key_count += 1
-                self._news[error_key_string + str(error_key_count)] = {}
+                self._errors += 1
+                entries[ERROR_KEY_STRING + str(self._errors)] = {}
                 log_locust_error(e, error_desc="Corrupt News Error", location=uri, raise_error=False)
-        self._errors = error_key_count
 
-        if len(self._news) == 0:
-            log.warning(f"News search failed for keyword: '{search_string}'")
-        return self._news
+        if newer:
+            # Keep the feed order, newest entries first
+            entries.update(self._news)
+            self._news = entries
+        else:
+            self._news.update(entries)
+
+    def _get_feed_link(self, feed: Dict[str, Any], rel: str) -> Optional[str]:
+        for link in feed.get('links', []):
+            if isinstance(link, dict) and link.get('rel') == rel and link.get('href'):
+                href: str = link['href']
+                return href[len(self.interactor.host):] if href.startswith(self.interactor.host) else href
+        return None
 
     def get_news(self, news_name: str, exact_match: bool = True, search_string: str = None) -> Dict[str, Any]:
         """
@@ -99,6 +168,9 @@ class _News(_Base):
         """
         _, current_news = super().get(self._news, news_name,
                                       exact_match=exact_match, search_string=search_string)
+        # Older entries are only loaded when looking for one that is not in the pages loaded so far
+        while not current_news and self.load_next_page():
+            _, current_news = super().get(self._news, news_name, exact_match=exact_match, ignore_retry=True)
         if not current_news:
             raise (Exception("There is no news with name {} in the system under test (Exact match = {})".format(
                 news_name, exact_match)))
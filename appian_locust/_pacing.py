@@ -0,0 +1,179 @@
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+import gevent  # type: ignore
+
+from ._locust_error_handler import report_custom_metric
+
+# Interactions a user thinks before, see PacingEngine
+TYPING = "typing"
+SELECTING = "selecting"
+CLICKING = "clicking"
+READING_GRID = "reading_grid"
+
+# Type of the arrival entries in the statistics
+PACING_REQUEST_TYPE = "PACING"
+
+
+class ThinkTime:
+    """
+    Time a user takes before an interaction: a random number of seconds between ``minimum`` and ``maximum``, plus
+    ``per_character`` seconds for every character typed
+    """
+    __slots__ = ('minimum', 'maximum', 'per_character')
+
+    def __init__(self, minimum: float, maximum: float, per_character: float = 0.0) -> None:
+        """
+        Args:
+            minimum (float): Fewest seconds taken
+            maximum (float): Most seconds taken, before typing
+            per_character (float, optional): Seconds taken to type each character. Default : 0.0
+        """
+        if minimum < 0 or maximum < minimum or per_character < 0:
+            raise Exception(f"Invalid think time between {minimum} and {maximum} seconds, plus {per_character} per character")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.per_character = per_character
+
+    def sample(self, rng: random.Random, characters: int = 0) -> float:
+        """
+        Returns (float): Seconds taken before an interaction that types the given number of characters
+        """
+        return self.minimum + rng.random() * (self.maximum - self.minimum) + self.per_character * characters
+
+
+# Typing at about 60 words per minute, glancing at a field before selecting from it and reading a page of a grid
+DEFAULT_THINK_TIMES: Dict[str, ThinkTime] = {
+    TYPING: ThinkTime(0.5, 1.5, per_character=0.2),
+    SELECTING: ThinkTime(1.0, 3.0),
+    CLICKING: ThinkTime(0.5, 2.0),
+    READING_GRID: ThinkTime(3.0, 8.0)
+}
+
+
+class PacingEngine:
+    """
+    Think time between the interactions of a user with a form. Without it, chained calls such as
+    ``form.fill_text_field("Title", "My New Novel").click_button("Submit")`` are sent back to back, faster than any person
+    could fill the form, so the server sees more requests per user than it would in production.
+
+    Once set with ``AppianClient.set_pacing``, every ``SailUiForm`` interaction first waits for the think time of its type:
+    typing for text fields, selecting for dropdowns, checkboxes, radio buttons, dates and uploads, clicking for buttons,
+    links and tabs, and reading a grid before paging or sorting it. Think time is not part of the response times.
+    """
+
+    def __init__(self, think_times: Dict[str, ThinkTime] = None, scale: float = 1.0) -> None:
+        """
+        Args:
+            think_times (Dict[str, ThinkTime], optional): Think time of each interaction type, overriding the defaults. Default : None
+            scale (float, optional): Factor applied to every think time, for example 0.5 for expert users. Default : 1.0
+        """
+        self.think_times: Dict[str, ThinkTime] = {**DEFAULT_THINK_TIMES, **(think_times or {})}
+        self.scale = scale
+
+    def get_think_time(self, interaction: str, rng: random.Random, text: Any = None) -> float:
+        """
+        Returns (float): Seconds to think before an interaction of the given type, no time for unknown types
+        """
+        think_time = self.think_times.get(interaction)
+        if think_time is None:
+            return 0.0
+        characters = len(text) if isinstance(text, str) else 0
+        return think_time.sample(rng, characters) * self.scale
+
+    def pause(self, interaction: str, rng: random.Random, text: Any = None) -> float:
+        """
+        Waits for the think time of an interaction
+
+        Args:
+            interaction (str): Type of the interaction, such as ``TYPING``
+            rng (random.Random): Random generator of the user
+            text (str, optional): Text typed by the interaction. Default : None
+
+        Returns (float): Seconds waited
+        """
+        seconds = self.get_think_time(interaction, rng, text)
+        if seconds > 0:
+            gevent.sleep(seconds)
+        return seconds
+
+
+class ArrivalRate:
+    """
+    Open model pacing, where iterations of the tasks start at a constant rate however long they take, so that throughput
+    stays constant as response times degrade. Users are a pool that picks up the next arrival when free: if every user is
+    still busy when an arrival is due, the next free user starts it late, and arrivals later than ``max_lateness`` are dropped.
+
+    Dropped arrivals are reported as failures of the "Arrival.Dropped" entry of the "PACING" type, so that the statistics
+    show when there were too few users to sustain the rate. The rate is per process, divide it by the number of workers
+    in distributed mode.
+    """
+
+    def __init__(self, per_second: float, poisson: bool = False, max_lateness: float = 1.0, rng: random.Random = None) -> None:
+        """
+        Args:
+            per_second (float): Iterations started per second by the users of the process
+            poisson (bool, optional): Whether arrivals are random, as independent users arrive, rather than evenly spaced. Default : False
+            max_lateness (float, optional): Seconds after which an arrival no user was free to start is dropped. Default : 1.0
+            rng (random.Random, optional): Random generator of the arrivals. Default : a new generator
+        """
+        if per_second <= 0:
+            raise Exception(f"Invalid arrival rate of {per_second} per second")
+        self.per_second = per_second
+        self.poisson = poisson
+        self.max_lateness = max_lateness
+        self.dropped_arrivals = 0
+        self._rng = rng or random.Random()
+        self._next_arrival: Optional[float] = None
+
+    def __call__(self, instance: Any = None) -> float:
+        """
+        Claims the next arrival, called by Locust as ``wait_time`` after every task
+
+        Returns (float): Seconds to wait before the arrival
+        """
+        now = time.monotonic()
+        if self._next_arrival is None:
+            self._next_arrival = now
+        arrival = self._claim()
+        dropped = 0
+        while arrival < now - self.max_lateness:
+            dropped += 1
+            arrival = self._claim()
+        if dropped:
+            self.dropped_arrivals += dropped
+            client = getattr(instance, "client", None)
+            report_custom_metric(client, PACING_REQUEST_TYPE, "Arrival.Dropped", (now - arrival) * 1000,
+                                 exception=Exception(f"{dropped} arrivals dropped, every user was busy"))
+        return max(0.0, arrival - now)
+
+    def _claim(self) -> float:
+        arrival = self._next_arrival or 0.0
+        interval = self._rng.expovariate(self.per_second) if self.poisson else 1 / self.per_second
+        self._next_arrival = arrival + interval
+        return arrival
+
+
+def arrival_rate(per_second: float, poisson: bool = False, max_lateness: float = 1.0) -> Callable[..., float]:
+    """
+    Returns a Locust ``wait_time`` that starts the tasks of all the users of the class at a constant rate, see :class:`ArrivalRate`
+
+    Args:
+        per_second (float): Iterations started per second by the users of the process
+        poisson (bool, optional): Whether arrivals are random rather than evenly spaced. Default : False
+        max_lateness (float, optional): Seconds after which an arrival no user was free to start is dropped. Default : 1.0
+
+    Example:
+
+    .. code-block:: python
+
+        from appian_locust._pacing import arrival_rate
+
+        class UserActor(HttpUser):
+            tasks = [OrdersTaskSet]
+            # Enough users to absorb slow responses, 5 orders per second however long they take
+            wait_time = arrival_rate(5)
+
+    """
+    return ArrivalRate(per_second, poisson=poisson, max_lateness=max_lateness)
@@ -0,0 +1,133 @@
+import random
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import gevent  # type: ignore
+from gevent.local import local  # type: ignore
+
+from ._locust_error_handler import report_custom_metric
+
+T = TypeVar('T')
+
+# Type of the end to end latency entries in the statistics
+POLL_REQUEST_TYPE = "POLL"
+
+# Weight of the latest latency in the running estimate of each poll
+_LATENCY_SMOOTHING = 0.3
+# Share of the estimated latency waited for before the first check
+_FIRST_CHECK_RATIO = 0.8
+
+# Running estimates of how long each poll takes for its result to be visible, shared by every user of the process
+_latency_estimates: Dict[str, float] = dict()
+
+# Number of polls the current greenlet, that is the current user, is checking for, see is_polling
+_polls = local()
+
+# Shared by the users that do not pass their own random generator
+_RANDOM = random.Random()
+
+
+def poll_until(check: Callable[[], Optional[T]], name: str, timeout: float = 60.0, started_at: float = None,
+               initial_interval: float = 0.5, max_interval: float = 10.0, backoff: float = 1.5, jitter: float = 0.25,
+               client: Any = None, rng: random.Random = None, adaptive_first_check: bool = False) -> T:
+    """
+    Calls check until it returns a result, for example to wait for the record or task created by a process.
+
+    The interval between two checks starts at ``initial_interval`` and grows by ``backoff`` after every miss, up to
+    ``max_interval``, so that slow results do not flood the server. Intervals are randomly shortened or lengthened by up to
+    ``jitter`` of their length, so that users started together do not poll together.
+
+    With ``adaptive_first_check``, the first check waits for most of the time previous polls with the same name took,
+    rather than checking right away for a result that is not there yet. This saves requests, but the reported latency
+    can then not be lower than that wait, so leave it off when the latency itself is measured.
+
+    The time from ``started_at`` to the result being visible is reported as a single ``name`` entry of the "POLL" type
+    in the statistics, or as a failure if no result is visible by the deadline.
+
+    Args:
+        check (Callable): Returns the result once it is visible, None or another falsy value until then
+        name (str): Name of the entry in the statistics
+        timeout (float, optional): Seconds from started_at after which polling stops. Default : 60.0
+        started_at (float, optional): Value of ``time.monotonic()`` when the process was started. Default : now
+        initial_interval (float, optional): Seconds between the first two checks. Default : 0.5
+        max_interval (float, optional): Maximum seconds between two checks. Default : 10.0
+        backoff (float, optional): Factor by which the interval grows after every miss. Default : 1.5
+        jitter (float, optional): Share of each interval randomly added or removed. Default : 0.25
+        client (optional): Client of the user, to report the latency with. Default : the shared Locust environment
+        rng (random.Random, optional): Random generator of the user, such as ``interactor.random``. Default : a shared generator
+        adaptive_first_check (bool, optional): Whether to wait for most of the usual latency before the first check. Default : False
+
+    Returns: The result returned by check
+
+    Raises:
+        If no result is visible by the deadline, Exception will be raised
+
+    Example:
+
+        >>> started_at = time.monotonic()
+        >>> form.click_start_process_link("Submit Order")
+        >>> poll_until(lambda: next((task for name, task in self.appian.tasks.get_all().items() if name.startswith("Review Order")), None),
+        ...            "Order.Review.Visible", started_at=started_at, rng=self.appian.interactor.random)
+
+    """
+    if started_at is None:
+        started_at = time.monotonic()
+    rng = rng or _RANDOM
+    deadline = started_at + timeout
+    interval = initial_interval
+
+    estimate = _latency_estimates.get(name)
+    # A result found by a check that waited for it only tells that the latency was at most that wait
+    waited_for_first_check = adaptive_first_check and estimate is not None
+    if waited_for_first_check:
+        _sleep_until(min(started_at + estimate * _FIRST_CHECK_RATIO, deadline))  # type: ignore
+
+    first_check = True
+    while True:
+        _polls.depth = getattr(_polls, "depth", 0) + 1
+        try:
+            result = check()
+        except Exception as e:
+            _report(client, name, started_at, e)
+            raise
+        finally:
+            _polls.depth -= 1
+        now = time.monotonic()
+        if result:
+            if not (first_check and waited_for_first_check):
+                latency = now - started_at
+                _latency_estimates[name] = latency if estimate is None else \
+                    estimate + _LATENCY_SMOOTHING * (latency - estimate)
+            _report(client, name, started_at)
+            return result
+        if now >= deadline:
+            exception = Exception(f"No result for '{name}' after {timeout} seconds")
+            _report(client, name, started_at, exception)
+            raise exception
+        _sleep_until(min(now + interval * (1 + jitter * (2 * rng.random() - 1)), deadline))
+        interval = min(interval * backoff, max_interval)
+        first_check = False
+
+
+def get_latency_estimate(name: str) -> Optional[float]:
+    """
+    Returns (float): Running estimate, in seconds, of how long polls with this name take for their result to be visible
+    """
+    return _latency_estimates.get(name)
+
+
+def is_polling() -> bool:
+    """
+    Returns (bool): Whether the current user is checking for the result of a poll, see :func:`poll_until`
+    """
+    return getattr(_polls, "depth", 0) > 0
+
+
+def _sleep_until(wake_up_at: float) -> None:
+    delay = wake_up_at - time.monotonic()
+    if delay > 0:
+        gevent.sleep(delay)
+
+
+def _report(client: Any, name: str, started_at: float, exception: Exception = None) -> None:
+    report_custom_metric(client, POLL_REQUEST_TYPE, name, (time.monotonic() - started_at) * 1000, exception=exception)
@@ -1,13 +1,15 @@
-import json
-import random
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
 from appian_locust import logger
 
 from ._base import _Base
+from ._catalog import RecordTypeEntry
+from ._form_templates import share_form_template
 from ._interactor import _Interactor
+from ._sail_json import decode_response, loads_sail
+from ._sampling import AccessDistribution, SampleSet, UniformAccess, WeightedSampleSet
 from .helper import format_label
 from .records_helper import (get_all_records_from_json,
                              get_record_summary_view_response)
@@ -15,6 +17,9 @@ from .uiform import SailUiForm
 
 log = logger.getLogger(__name__)
 
+# Prefix of the keys of the records that could not be parsed, see get_all_records_from_json
+ERROR_KEY_STRING = "ERROR::"
+
 
 class _Records(_Base):
     def __init__(self, interactor: _Interactor) -> None:
@@ -36,6 +41,16 @@ class _Records(_Base):
         self._records: Dict[str, Any] = dict()
         self._errors: int = 0
 
+        # Record types and records are cached as compact entries, set this to also keep their full JSON
+        self.keep_full_json: bool = False
+
+        # Names to pick random records from, built once per list of records (the list they were built from, and its size, are kept alongside)
+        self._record_samples: Dict[str, Tuple[Dict[str, Any], int, SampleSet[str]]] = dict()
+        self._record_type_sample: Optional[SampleSet[str]] = None
+        self._record_type_weights: Optional[WeightedSampleSet[str]] = None
+        # How records are picked within a record type when visiting one without a name
+        self._access_distribution: AccessDistribution = UniformAccess()
+
     def get_all(self, search_string: str = None) -> Dict[str, Any]:
         """
         Retrieves all available "records types" and "records" and associated metadata from "Appian-Tempo-Records"
@@ -68,15 +83,16 @@ class _Records(_Base):
         headers['X-Appian-Features-Extended'] = 'e4bc'
         headers["Accept"] = "application/vnd.appian.tv.ui+json"
         response = self.interactor.get_page(uri=uri, headers=headers, label="Records")
-        json_response = response.json()
+        json_response = decode_response(response)
 
         if not(self._is_response_good(response.text)):
             raise(Exception("Unexpected response on Get call of All Records"))
 
         for current_record_type in json_response["ui"]["contents"][0]["feedItems"]:
             title = current_record_type['title'].strip()
-            self._record_types[title] = current_record_type
+            self._record_types[title] = RecordTypeEntry(current_record_type, self.keep_full_json)
             self._records[title] = dict()
+        self._record_type_sample = None
 
         return self._record_types
 
@@ -96,7 +112,7 @@ class _Records(_Base):
 
         json_response, _ = self._record_type_list_request(record_type)
 
-        self._records[record_type], self._errors = get_all_records_from_json(json_response)
+        self._records[record_type], self._errors = get_all_records_from_json(json_response, self.keep_full_json)
 
         return self._records
 
@@ -114,7 +130,7 @@ class _Records(_Base):
         """
         json_response, _ = self._record_type_list_request(record_type, is_mobile=True)
 
-        self._records[record_type], self._errors = get_all_records_from_json(json_response)
+        self._records[record_type], self._errors = get_all_records_from_json(json_response, self.keep_full_json)
 
         return self._records
 
@@ -243,7 +259,7 @@ class _Records(_Base):
 
         uri = f"/suite/rest/a/sites/latest/{tempo_site_url_stub}/page/records/record/{opaque_id}/view/{view_url_stub}"
         resp = self.interactor.get_page(uri=uri, headers=headers, label=label)
-        return resp.json(), uri
+        return decode_response(resp), uri
 
     # Alias for the above function to allow backwards compatability
     visit = visit_record_instance
@@ -267,7 +283,8 @@ class _Records(_Base):
         if not record_type:
             record_type = self._get_random_record_type()
 
-        return self._record_type_list_request(record_type, is_mobile=is_mobile)
+        json_response, uri = self._record_type_list_request(record_type, is_mobile=is_mobile)
+        return share_form_template(json_response), uri
 
     def visit_record_instance_and_get_feed_form(self, record_type: str = "", record_name: str = "", exact_match: bool = True) -> SailUiForm:
         """
@@ -325,7 +342,7 @@ class _Records(_Base):
         # SAIL Code for the Record Summary View is embedded within the response.
         embedded_record_resp = get_record_summary_view_response(form_json)
         breadcrumb = f'Records.{record_type}.{format_label(record_name, "::", 0)}.SailUi'
-        return SailUiForm(self.interactor, json.loads(embedded_record_resp), form_uri, breadcrumb=breadcrumb)
+        return SailUiForm(self.interactor, loads_sail(embedded_record_resp), form_uri, breadcrumb=breadcrumb)
 
     visit_and_get_form = visit_record_instance_and_get_form
 
@@ -366,24 +383,67 @@ class _Records(_Base):
     def _is_response_good(self, response_text: str) -> bool:
         return ('"rel":"x-web-bookmark"' in response_text or '"#t":"CardLayout"' in response_text)
 
+    def set_record_type_weights(self, weights: Optional[Dict[str, float]]) -> None:
+        """
+        Sets how often each record type is picked when visiting a random record or record type,
+        by default all record types are equally likely
+
+        Args:
+            weights (Dict[str, float]): Relative weight of each record type, record types that are not listed are never picked.
+                                        None to pick all record types equally again
+
+        Examples:
+
+            >>> self.appian.records.set_record_type_weights({"Customers": 8, "Orders": 2})
+
+        """
+        self._record_type_weights = WeightedSampleSet(weights) if weights is not None else None
+
+    def set_access_distribution(self, distribution: AccessDistribution) -> None:
+        """
+        Sets how records are picked within a record type when visiting a record without giving its name,
+        by default all records are equally likely
+
+        Args:
+            distribution (AccessDistribution): Distribution to pick records with, in the order they are listed
+
+        Examples:
+
+            >>> from appian_locust._sampling import HotSetAccess
+            >>> self.appian.records.set_access_distribution(HotSetAccess(hot_fraction=0.1, hot_probability=0.9))
+
+        """
+        self._access_distribution = distribution
+
     def _get_random_record_instance(self, record_type: str = "") -> Tuple[str, str]:
         if not self._records or not self._record_types:
             self.get_all()
         if not record_type:
             record_type = self._get_random_record_type()
-        record_name = random.choice(list(self._records[record_type].keys()))
+        records = self._records[record_type]
+        samples = self._record_samples.get(record_type)
+        if samples is None or samples[0] is not records or samples[1] != len(records):
+            # Records that could not be parsed are listed under placeholder keys, they are never picked
+            names = SampleSet(key for key in records if not key.startswith(ERROR_KEY_STRING))
+            samples = self._record_samples[record_type] = (records, len(records), names)
+        record_name = self._access_distribution.pick(samples[2].items, self.interactor.random)
         return record_type, record_name
 
     def _get_random_record_type(self) -> str:
         if not self._records or not self._record_types:
             self.get_all()
-        return random.choice(list(self._records.keys()))
+        if self._record_type_weights is not None:
+            return self._record_type_weights.sample(self.interactor.random)
+        sample = self._record_type_sample
+        if sample is None or len(sample) != len(self._records):
+            sample = self._record_type_sample = SampleSet(self._records)
+        return sample.sample(self.interactor.random)
 
     def _record_type_list_request(self, record_type: str, is_mobile: bool = False) -> Tuple[Dict[str, Any], str]:
         if record_type not in self._record_types:
             raise Exception(f"There is no record type with name {record_type} in the system under test")
         record_type_component = self._record_types[record_type]
-        record_type_url_stub = record_type_component['link']['value']['urlstub']
+        record_type_url_stub = record_type_component['urlstub']
 
         if is_mobile:
             uri = self._get_mobile_records_uri(record_type_url_stub)
@@ -395,7 +455,7 @@ class _Records(_Base):
         headers = self.interactor.setup_request_headers()
         headers["Accept"] = "application/vnd.appian.tv.ui+json"
         response = self.interactor.get_page(uri=uri, headers=headers, label=label)
-        json_response = response.json()
+        json_response = decode_response(response)
 
         return json_response, uri
 
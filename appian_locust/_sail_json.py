@@ -0,0 +1,53 @@
+import json
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+from requests import Response
+
+# Longer strings are mostly user data that is not repeated across forms, such as labels, values and identifiers
+_MAX_INTERNED_VALUE_LENGTH = 32
+
+_intern = sys.intern
+
+
+def _intern_pairs(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Object hook of the SAIL decoder, builds each object with interned keys and short string values
+    """
+    obj = {}
+    for key, value in pairs:
+        if value.__class__ is str and len(value) <= _MAX_INTERNED_VALUE_LENGTH:
+            value = _intern(value)
+        obj[_intern(key)] = value
+    return obj
+
+
+_DECODER = json.JSONDecoder(object_pairs_hook=_intern_pairs)
+
+
+def loads_sail(document: Union[str, bytes]) -> Any:
+    """
+    Decodes a SAIL JSON document. Keys and short string values, such as the ``#t`` type of each component, are interned,
+    so that the strings repeated throughout every form are stored once in the process, whatever the number of forms open.
+
+    Args:
+        document (str or bytes): JSON document to decode
+
+    Returns: Decoded document
+    """
+    if isinstance(document, (bytes, bytearray)):
+        document = document.decode(json.detect_encoding(document))
+    return _DECODER.decode(document)
+
+
+def decode_response(response: Response) -> Any:
+    """
+    Decodes the JSON body of a response to a SAIL request, see :func:`loads_sail`
+
+    Args:
+        response (Response): Response to decode
+
+    Returns: Decoded body
+    """
+    # Lets requests work out the encoding of the body, as ``Response.json`` does
+    return response.json(object_pairs_hook=_intern_pairs)
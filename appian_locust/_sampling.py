@@ -0,0 +1,320 @@
+import itertools
+import os
+import random
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Collection, Dict, Generic, Iterable, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Number of random picks that can hit excluded items before falling back to filtering them out
+_MAX_REJECTED_PICKS = 16
+
+# Number of catalog sizes a Zipf distribution keeps an alias table for, catalogs such as record types share the distribution
+_MAX_ZIPF_TABLES = 16
+
+# Seed of the whole run, every user generator is derived from it when set
+_run_seed: Optional[int] = None
+_user_indexes = itertools.count()
+
+
+def set_run_seed(seed: Optional[int]) -> None:
+    """
+    Sets the seed from which the random generators of the users created afterwards are derived, so that a run
+    picks the same items in the same order as a previous run with the same seed and spawn pattern.
+
+    Args:
+        seed (int): Seed of the run, None to seed users from the operating system again
+
+    Example:
+
+    .. code-block:: python
+
+        from appian_locust._sampling import set_run_seed
+
+        set_run_seed(1234)
+
+    """
+    global _run_seed, _user_indexes
+    _run_seed = seed
+    _user_indexes = itertools.count()
+
+
+def get_run_seed() -> Optional[int]:
+    return _run_seed
+
+
+def create_user_random(user_index: int = None) -> random.Random:
+    """
+    Creates the random generator of a user. If a run seed is set, the generator is seeded from it and the index
+    of the user, users are numbered in the order they are created if no index is given.
+
+    Args:
+        user_index (int, optional): Index of the user, for example to number users across distributed workers
+
+    Returns (random.Random): Random generator of the user
+    """
+    if user_index is None:
+        user_index = next(_user_indexes)
+    if _run_seed is None:
+        # A single system call per user, rather than one per pick
+        return random.Random(os.urandom(16))
+    # String seeds are hashed deterministically, unlike tuples
+    return random.Random(f"{_run_seed}:{user_index}")
+
+
+class SampleSet(Generic[T]):
+    """
+    Items to pick from at random, stored once in an array so that each pick is O(1)
+
+    Excluded items are skipped by picking again, so picks stay O(1) as long as most items are not excluded.
+    If too many picks hit excluded items, the remaining items are filtered out instead.
+    """
+    __slots__ = ('items',)
+
+    def __init__(self, items: Iterable[T]) -> None:
+        """
+        Args:
+            items (Iterable): Items to pick from
+        """
+        self.items: Tuple[T, ...] = tuple(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: random.Random, exclude: Collection[Any] = ()) -> T:
+        """
+        Picks an item at random
+
+        Args:
+            rng (random.Random): Random generator to pick with
+            exclude (Collection, optional): Items not to pick, use a set for O(1) membership checks
+
+        Returns: Randomly picked item
+
+        Raises:
+            In case of no item to pick, Exception will be raised
+        """
+        return sample_item(self.items, rng, exclude)
+
+
+def sample_item(items: Sequence[T], rng: random.Random, exclude: Collection[Any] = ()) -> T:
+    """
+    Picks an item of a sequence at random, see :meth:`SampleSet.sample`
+    """
+    if items and not exclude:
+        return items[int(rng.random() * len(items))]
+    if items:
+        for _ in range(_MAX_REJECTED_PICKS):
+            item = items[int(rng.random() * len(items))]
+            if item not in exclude:
+                return item
+        candidates = [item for item in items if item not in exclude]
+        if candidates:
+            return candidates[int(rng.random() * len(candidates))]
+    raise Exception("There is no item to select randomly")
+
+
+class AliasTable:
+    """
+    Walker's alias table, picks an index in proportion to its weight with a single random number, in O(1)
+    whatever the number of weights. Building the table is O(n), so it is meant to be built once and sampled often.
+    """
+    __slots__ = ('_probabilities', '_aliases')
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Args:
+            weights (Sequence[float]): Relative weight of each index, indexes with a weight of 0 are never picked
+        """
+        if any(weight < 0 for weight in weights):
+            raise Exception("Weights must not be negative")
+        total_weight = sum(weights)
+        if total_weight <= 0:
+            raise Exception("At least one weight must be positive")
+
+        size = len(weights)
+        scaled = [weight * size / total_weight for weight in weights]
+        probabilities = [0.0] * size
+        aliases = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        # What is left is only off from 1 because of rounding
+        heaviest = max(range(size), key=weights.__getitem__)
+        for index in small + large:
+            probabilities[index] = 1.0 if weights[index] > 0 else 0.0
+            aliases[index] = index if weights[index] > 0 else heaviest
+        self._probabilities = probabilities
+        self._aliases = aliases
+
+    def __len__(self) -> int:
+        return len(self._probabilities)
+
+    def sample_index(self, rng: random.Random) -> int:
+        """
+        Picks an index at random, in proportion to its weight
+
+        Args:
+            rng (random.Random): Random generator to pick with
+
+        Returns (int): Randomly picked index
+        """
+        # The integer part picks a column of the table, the fractional part picks between it and its alias
+        position = rng.random() * len(self._probabilities)
+        index = int(position)
+        return index if position - index < self._probabilities[index] else self._aliases[index]
+
+
+class WeightedSampleSet(Generic[T]):
+    """
+    Items to pick from at random, each with its own relative weight, each pick is O(1)
+
+    Items with a weight of 0 are never picked.
+    """
+    __slots__ = ('items', '_table')
+
+    def __init__(self, weights: Dict[T, float]) -> None:
+        """
+        Args:
+            weights (Dict): Relative weight of each item
+        """
+        self.items: Tuple[T, ...] = tuple(weights)
+        self._table = AliasTable(list(weights.values()))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: random.Random) -> T:
+        """
+        Picks an item at random, in proportion to its weight
+
+        Args:
+            rng (random.Random): Random generator to pick with
+
+        Returns: Randomly picked item
+        """
+        return self.items[self._table.sample_index(rng)]
+
+
+class AccessDistribution(ABC):
+    """
+    How often each item of a catalog is accessed when items are picked at random. Items are ranked in catalog order,
+    distributions that favor some items favor the first ones.
+
+    Subclasses implement :meth:`sample_index`, distributions are configured on a catalog with ``set_access_distribution``.
+    """
+
+    @abstractmethod
+    def sample_index(self, rng: random.Random, size: int) -> int:
+        """
+        Picks the index of the next item to access
+
+        Args:
+            rng (random.Random): Random generator to pick with
+            size (int): Number of items, at least 1
+
+        Returns (int): Index of the item, between 0 and size - 1
+        """
+
+    def pick(self, items: Sequence[T], rng: random.Random) -> T:
+        """
+        Picks the next item to access
+
+        Args:
+            items (Sequence): Items to pick from
+            rng (random.Random): Random generator to pick with
+
+        Returns: Picked item
+
+        Raises:
+            In case of no item to pick, Exception will be raised
+        """
+        if not items:
+            raise Exception("There is no item to select randomly")
+        return items[self.sample_index(rng, len(items))]
+
+
+class UniformAccess(AccessDistribution):
+    """
+    Every item is equally likely to be accessed
+    """
+
+    def sample_index(self, rng: random.Random, size: int) -> int:
+        return int(rng.random() * size)
+
+
+class ZipfAccess(AccessDistribution):
+    """
+    Zipf distribution, the item of rank k is accessed in proportion to 1 / k^exponent, so a few items get most of the accesses.
+    An alias table is built once per catalog size, the tables of the most recently used sizes are kept.
+    """
+
+    def __init__(self, exponent: float = 1.0) -> None:
+        """
+        Args:
+            exponent (float, optional): Skew of the distribution, 0 is uniform and higher values are more skewed. Default : 1.0
+        """
+        if exponent < 0:
+            raise Exception(f"Zipf exponent must not be negative, was {exponent}")
+        self.exponent = exponent
+        self._tables: 'OrderedDict[int, AliasTable]' = OrderedDict()
+
+    def sample_index(self, rng: random.Random, size: int) -> int:
+        tables = self._tables
+        table = tables.get(size)
+        if table is None:
+            table = tables[size] = AliasTable([rank ** -self.exponent for rank in range(1, size + 1)])
+            if len(tables) > _MAX_ZIPF_TABLES:
+                tables.popitem(last=False)
+        else:
+            tables.move_to_end(size)
+        return table.sample_index(rng)
+
+
+class HotSetAccess(AccessDistribution):
+    """
+    Hot set and cold set: a fraction of the items, the first ones, gets a larger share of the accesses,
+    items are equally likely within each set
+    """
+
+    def __init__(self, hot_fraction: float = 0.2, hot_probability: float = 0.8) -> None:
+        """
+        Args:
+            hot_fraction (float, optional): Share of the items in the hot set. Default : 0.2
+            hot_probability (float, optional): Share of the accesses that go to the hot set. Default : 0.8
+        """
+        if not 0 < hot_fraction <= 1 or not 0 <= hot_probability <= 1:
+            raise Exception(f"hot_fraction must be in (0, 1] and hot_probability in [0, 1], were {hot_fraction} and {hot_probability}")
+        self.hot_fraction = hot_fraction
+        self.hot_probability = hot_probability
+
+    def sample_index(self, rng: random.Random, size: int) -> int:
+        hot_size = max(1, round(size * self.hot_fraction))
+        # Pick the set first, then an item within it
+        if hot_size == size or rng.random() < self.hot_probability:
+            return int(rng.random() * hot_size)
+        return hot_size + int(rng.random() * (size - hot_size))
+
+
+class SequentialAccess(AccessDistribution):
+    """
+    Sequential scan, items are accessed one after the other in catalog order, starting over after the last one
+    """
+
+    def __init__(self, start: int = 0) -> None:
+        """
+        Args:
+            start (int, optional): Index of the first item to access. Default : 0
+        """
+        self._next_index = start
+
+    def sample_index(self, rng: random.Random, size: int) -> int:
+        index = self._next_index % size
+        self._next_index = index + 1
+        return index
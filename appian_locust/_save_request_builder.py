@@ -1,11 +1,79 @@
+import json
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
+from ._form_templates import FORM_TEMPLATE_CACHE
+
+# Number of components whose save request template is kept, shared by every user of the process
+MAX_SAVE_PAYLOAD_TEMPLATES = 512
+
+_PAYLOAD_HEAD = b'{"#t": "UiConfig", "context": '
+_PAYLOAD_UUID = b', "uuid": '
+
 
 def save_builder() -> '_SaveRequestBuilder':
     builder = _SaveRequestBuilder()
     return builder
 
 
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value).encode()
+
+
+class SavePayloadTemplate:
+    """
+    Save request for a component, with the parts that only depend on the component serialized once.
+    Rendering it only serializes the context, the uuid and the value, and gives the same bytes as serializing
+    the payload built by :meth:`_SaveRequestBuilder.build`.
+
+    Templates are looked up by identity of the component, so they are only used for the read only components shared
+    by the forms, see :class:`appian_locust._form_templates.FormTemplateCache`.
+    """
+    __slots__ = ('component', '_updates_head', '_updates_tail')
+
+    def __init__(self, component: Dict[str, Any], save_into: Any) -> None:
+        """
+        Args:
+            component (dict): Component to save a value into
+            save_into: Save into of the component
+        """
+        self.component = component
+        self._updates_head = b''.join((b', "updates": {"#t": "SaveRequest?list", "#v": [{"_cId": ', _dumps(component["_cId"]),
+                                       b', "model": ', _dumps(component), b', "value": '))
+        self._updates_tail = b''.join((b', "saveInto": ', _dumps(save_into), b', "saveType": "PRIMARY"}]}}'))
+
+    def render(self, context: Any, uuid: str, value: Any) -> bytes:
+        """
+        Args:
+            context: Context of the form
+            uuid (str): uuid of the form
+            value: Value to save into the component
+
+        Returns (bytes): JSON body of the save request
+        """
+        return b''.join((_PAYLOAD_HEAD, _dumps(context), _PAYLOAD_UUID, _dumps(uuid),
+                         self._updates_head, _dumps(value), self._updates_tail))
+
+
+# Templates by id of their component, least recently used first. Templates hold their component, so ids are not reused
+_SAVE_PAYLOAD_TEMPLATES: 'OrderedDict[int, SavePayloadTemplate]' = OrderedDict()
+
+
+def get_save_payload_template(component: Dict[str, Any], save_into: Any) -> SavePayloadTemplate:
+    """
+    Returns the template of the save requests of a component, compiling it the first time
+    """
+    key = id(component)
+    template = _SAVE_PAYLOAD_TEMPLATES.get(key)
+    if template is not None and template.component is component:
+        _SAVE_PAYLOAD_TEMPLATES.move_to_end(key)
+        return template
+    template = _SAVE_PAYLOAD_TEMPLATES[key] = SavePayloadTemplate(component, save_into)
+    if len(_SAVE_PAYLOAD_TEMPLATES) > MAX_SAVE_PAYLOAD_TEMPLATES:
+        _SAVE_PAYLOAD_TEMPLATES.popitem(last=False)
+    return template
+
+
 class _SaveRequestBuilder:
     """
     Builds a save request, that can be used to trigger saves on the UI
@@ -39,26 +107,7 @@ class _SaveRequestBuilder:
         return self
 
     def build(self) -> Dict[str, Any]:
-        if self._component is None:
-            raise Exception("Component not set")
-        if self._uuid is None:
-            raise Exception("uuid not set")
-        if self._context is None:
-            raise Exception("context not set")
-
-        if self._value is None:
-            self._value = self._component["value"]
-
-        if 'saveInto' not in self._component:
-            # Support onSubmitSaveInto
-            if 'onSubmitSaveInto' in self._component:
-                save_into = self._component['onSubmitSaveInto']
-            elif 'saveInto' not in self._component.get('contents', {}):
-                raise Exception("saveInto not set")
-            else:
-                save_into = self._component['contents']['saveInto']
-        else:
-            save_into = self._component['saveInto']
+        save_into = self._validate_and_get_save_into()
 
         payload = {
             "#t": "UiConfig",
@@ -68,7 +117,7 @@ class _SaveRequestBuilder:
                 "#t": "SaveRequest?list",
                 "#v": [
                     {
-                        "_cId": self._component["_cId"],
+                        "_cId": self._component["_cId"],  # type: ignore
                         "model": self._component,
                         "value": self._value,
                         "saveInto": save_into,
@@ -90,3 +139,37 @@ class _SaveRequestBuilder:
                 }
             )
         return payload
+
+    def build_json(self) -> bytes:
+        """
+        Builds the save request serialized to JSON, the same as serializing the result of :meth:`build`.
+        Components shared by the forms are only serialized the first time a save request is built for them, see
+        :class:`SavePayloadTemplate`. Other components may have been changed since, so they are serialized every time.
+        """
+        if self._record_url_stub or not FORM_TEMPLATE_CACHE.is_shared(self._component):
+            return _dumps(self.build())
+        save_into = self._validate_and_get_save_into()
+        template = get_save_payload_template(self._component, save_into)  # type: ignore
+        return template.render(self._context, self._uuid, self._value)  # type: ignore
+
+    def _validate_and_get_save_into(self) -> Any:
+        if self._component is None:
+            raise Exception("Component not set")
+        if self._uuid is None:
+            raise Exception("uuid not set")
+        if self._context is None:
+            raise Exception("context not set")
+
+        if self._value is None:
+            self._value = self._component["value"]
+
+        if 'saveInto' not in self._component:
+            # Support onSubmitSaveInto
+            if 'onSubmitSaveInto' in self._component:
+                return self._component['onSubmitSaveInto']
+            elif 'saveInto' not in self._component.get('contents', {}):
+                raise Exception("saveInto not set")
+            else:
+                return self._component['contents']['saveInto']
+        else:
+            return self._component['saveInto']
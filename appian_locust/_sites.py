@@ -1,13 +1,14 @@
 import enum
-import json
-import random
 from typing import Any, Dict, List, Union
 
 from requests import Response
 
 from . import logger
 from ._base import _Base
+from ._form_templates import share_form_template
 from ._interactor import _Interactor
+from ._sail_json import decode_response, loads_sail
+from ._sampling import sample_item
 from .helper import extract_values, format_label
 from .records_helper import (get_all_records_from_json,
                              get_record_summary_view_response)
@@ -83,13 +84,13 @@ class _Sites(_Base):
             return resp
         headers = self._setup_headers_with_sail_json()
         if page_name not in self._sites_records:
-            records_for_page, errors = get_all_records_from_json(resp.json())
+            records_for_page, errors = get_all_records_from_json(decode_response(resp))
             self._sites_records[page_name] = records_for_page
         records = list(self._sites_records[page_name])
         if not records:
             log.error(f"No records found for site={site_name}, page={page_name}")
             return resp
-        record_key = random.choice(list(self._sites_records[page_name]))
+        record_key = sample_item(records, self.interactor.random)
         label = f"Sites.{site_name}.{page_name}." + format_label(record_key, "::", 0)[:30]
         record_id = record_key.split("::")[1]
         record_resp = self.interactor.get_page(
@@ -118,11 +119,11 @@ class _Sites(_Base):
 
         site_page_response: Response = self.navigate_to_tab_and_record_if_applicable(site_name, page_name)
         form_uri = site_page_response.request.path_url
-        site_page_json_response = site_page_response.json()
+        site_page_json_response = decode_response(site_page_response)
         if site_page_json_response.get("feed"):
             record_view_response = get_record_summary_view_response(site_page_json_response)
             breadcrumb = f"Sites.{site_name}.{page_name}.SailUi"
-            return SailUiForm(self.interactor, json.loads(record_view_response), form_uri, breadcrumb=breadcrumb)
+            return SailUiForm(self.interactor, loads_sail(record_view_response), form_uri, breadcrumb=breadcrumb)
         else:
             breadcrumb = f"Sites.{site_name}.{page_name}.SailUi"
             return SailUiForm(self.interactor, site_page_json_response, form_uri, breadcrumb=breadcrumb)
@@ -133,7 +134,7 @@ class _Sites(_Base):
         """
         headers = self._setup_headers_with_sail_json()
         all_site_resp = self.interactor.get_page(_Sites.TEMPO_SITE_PAGE_NAV, headers=headers, label="Sites.SiteNames")
-        all_site_json = all_site_resp.json()
+        all_site_json = decode_response(all_site_resp)
         for site_info in extract_values(all_site_json, '#t', 'SitePageLink'):
             if 'siteUrlStub' in site_info:
                 site_url_stub = site_info['siteUrlStub']
@@ -153,7 +154,7 @@ class _Sites(_Base):
         initial_nav_resp = self.interactor.get_page(f"/suite/rest/a/sites/latest/{site_name}/nav",
                                                     headers=headers,
                                                     label=f"Sites.{site_name}.Nav")
-        initial_nav_json = initial_nav_resp.json()
+        initial_nav_json = decode_response(initial_nav_resp)
         ui = initial_nav_json['ui']
 
         display_name = ui.get('siteName')
@@ -193,7 +194,7 @@ class _Sites(_Base):
         page_resp = self.interactor.get_page(f"/suite/rest/a/applications/latest/legacy/sites/{site_name}/page/{page_name}",
                                              headers=headers,
                                              label=f"Sites.{site_name}.{page_name}.Nav")
-        page_resp_json = page_resp.json()
+        page_resp_json = decode_response(page_resp)
         if 'redirect' not in page_resp_json:
             log.error(f"Could not find page data with a redirect for site {site_name} page {page_name}")
             return None
@@ -217,7 +218,7 @@ class _Sites(_Base):
         """
         resp: Response = self.navigate_to_tab(site_name, page_name)
         form_uri = resp.request.path_url
-        form_json = resp.json()
+        form_json = share_form_template(decode_response(resp))
 
         breadcrumb = f"Sites.{site_name}.{page_name}.SailUi"
         return SailUiForm(self.interactor, form_json, form_uri, breadcrumb=breadcrumb)
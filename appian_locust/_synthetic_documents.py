@@ -0,0 +1,135 @@
+import random
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from ._upload_cache import UploadSource
+
+# Leading bytes of the supported file types, so the server sees a plausible document
+_FILE_SIGNATURES: Dict[str, bytes] = {
+    "txt": b"",
+    "csv": b"",
+    "bin": b"",
+    "pdf": b"%PDF-1.4\n",
+    "png": b"\x89PNG\r\n\x1a\n",
+    "zip": b"PK\x03\x04",
+    "docx": b"PK\x03\x04",
+    "xlsx": b"PK\x03\x04",
+}
+# Text types only contain printable characters
+_TEXT_TYPES = ("txt", "csv")
+_PRINTABLE = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ,.;\n"
+_TO_PRINTABLE = bytes(_PRINTABLE[i % len(_PRINTABLE)] for i in range(256))
+
+# Entropy is applied per block: the start of each block is random, the rest repeats a filler byte
+_BLOCK_SIZE = 4096
+
+DEFAULT_MAX_CACHED_BYTES = 256 * 1024 * 1024
+
+_DocumentKey = Tuple[int, str, float, int]
+
+
+class SyntheticDocumentGenerator:
+    """
+    Generates in-memory documents to upload, so that upload scenarios don't need files on the load driver.
+    Content is deterministic: the same generator seed, size, type, entropy and index always give the same bytes,
+    which can be used to check how the server deduplicates documents. Different indexes give distinct documents.
+
+    Generated documents are cached, up to ``max_cached_bytes`` of content, least recently used ones are dropped first.
+    """
+
+    def __init__(self, seed: int = 0, max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES) -> None:
+        """
+        Args:
+            seed (int, optional): Seed of the generated content. Default : 0
+            max_cached_bytes (int, optional): Total size of the documents kept in memory. Default : 256MiB
+        """
+        self.seed = seed
+        self.max_cached_bytes = max_cached_bytes
+        self._documents: 'OrderedDict[_DocumentKey, UploadSource]' = OrderedDict()
+        self._cached_bytes = 0
+
+    def generate(self, size: int, file_type: str = "txt", entropy: float = 1.0, index: int = 0) -> UploadSource:
+        """
+        Returns a document, which can be passed to ``upload_document_to_server`` instead of a file path
+
+        Args:
+            size (int): Size of the document in bytes
+            file_type (str, optional): Extension of the document, one of txt, csv, bin, pdf, png, zip, docx, xlsx. Default : "txt"
+            entropy (float, optional): Share of random content between 0 and 1, lower values give more compressible documents. Default : 1.0
+            index (int, optional): Index of the document, use different indexes to get distinct documents. Default : 0
+
+        Returns (UploadSource): The generated document, named synthetic_<index>.<file_type>
+
+        Examples:
+
+            >>> generator = SyntheticDocumentGenerator(seed=42)
+            >>> document = generator.generate(1024 * 1024, "pdf", entropy=0.5, index=self.user_id)
+            >>> form.upload_document_to_upload_field("Upload File", document)
+
+        """
+        if size < 0:
+            raise Exception(f"Document size must not be negative, was {size}")
+        if file_type not in _FILE_SIGNATURES:
+            raise Exception(f"Unsupported file type '{file_type}', must be one of {', '.join(_FILE_SIGNATURES)}")
+        if not 0 <= entropy <= 1:
+            raise Exception(f"Entropy must be between 0 and 1, was {entropy}")
+
+        key = (size, file_type, entropy, index)
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        content = self._generate_content(size, file_type, entropy, index)
+        document = UploadSource(f"synthetic_{index}.{file_type}", content)
+        self._documents[key] = document
+        self._cached_bytes += size
+        while self._cached_bytes > self.max_cached_bytes and len(self._documents) > 1:
+            _, evicted = self._documents.popitem(last=False)
+            self._cached_bytes -= evicted.size
+        return document
+
+    def clear(self) -> None:
+        self._documents.clear()
+        self._cached_bytes = 0
+
+    def _generate_content(self, size: int, file_type: str, entropy: float, index: int) -> bytes:
+        # String seeds are hashed deterministically, unlike tuples
+        rng = random.Random(f"{self.seed}:{index}")
+        random_per_block = round(_BLOCK_SIZE * entropy)
+        filler = b" " if file_type in _TEXT_TYPES else b"\x00"
+
+        if random_per_block == _BLOCK_SIZE:
+            content = bytearray(_random_bytes(rng, size))
+        else:
+            content = bytearray()
+            padding = filler * (_BLOCK_SIZE - random_per_block)
+            for offset in range(0, size, _BLOCK_SIZE):
+                block_size = min(_BLOCK_SIZE, size - offset)
+                random_size = min(random_per_block, block_size)
+                content += _random_bytes(rng, random_size)
+                content += padding[:block_size - random_size]
+
+        if file_type in _TEXT_TYPES:
+            content = content.translate(_TO_PRINTABLE)
+        signature = _FILE_SIGNATURES[file_type][:size]
+        content[:len(signature)] = signature
+        return bytes(content)
+
+
+# Shared by every user of the process
+DOCUMENT_GENERATOR = SyntheticDocumentGenerator()
+
+
+def generate_document(size: int, file_type: str = "txt", entropy: float = 1.0, index: int = 0) -> UploadSource:
+    """
+    Generates a document with the generator shared by the whole process, see :meth:`SyntheticDocumentGenerator.generate`
+    """
+    return DOCUMENT_GENERATOR.generate(size, file_type, entropy, index)
+
+
+def _random_bytes(rng: random.Random, size: int) -> bytes:
+    # Same bytes as Random.randbytes, which is only available from Python 3.9
+    if size <= 0:
+        return b""
+    return rng.getrandbits(8 * size).to_bytes(size, "little")
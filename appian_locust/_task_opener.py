@@ -2,6 +2,7 @@ from typing import Any, Dict
 
 from . import logger
 from ._interactor import _Interactor
+from ._sail_json import decode_response
 from .helper import find_component_by_attribute_in_dict
 
 log = logger.getLogger(__name__)
@@ -49,7 +50,7 @@ class _TaskOpener:
         label = f'Tasks.{task_title}.Accept'
         resp = self.interactor.post_page(uri=uri, payload=payload, headers=headers,
                                          label=label)
-        return resp.json()
+        return decode_response(resp)
 
     def visit_by_task_id(self, task_title: str, task_id: str, extra_headers: Dict[str, Any] = None) -> Dict[str, Any]:
         """Vist a task page and the corresponding json using the task_id
@@ -62,16 +63,40 @@ class _TaskOpener:
         Returns:
             Dict[str, Any]: State returned by visiting the task
         """
+        attributes = self.get_task_attributes(task_title, task_id, extra_headers)
+        return self.accept_task(task_title, task_id, attributes, extra_headers)
 
+    def get_task_attributes(self, task_title: str, task_id: str, extra_headers: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Get the attributes of a task, which tell whether it has to be accepted before its form is shown
+
+        Args:
+            task_title (str): Title to identify the task
+            task_id (str): Id of the task
+            extra_headers (Dict[str, Any], optional): Extra headers, used for sites requests. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Attributes of the task
+        """
         uri = "/suite/rest/a/task/latest/{}/attributes".format(task_id)
-        headers = self.interactor.setup_request_headers(uri)
-        if extra_headers:
-            headers.update(extra_headers)
         label = f'Tasks.{task_title}'
-        resp = self.interactor.get_page(uri=uri, label=label, headers=headers).json()
+        return decode_response(self.interactor.get_page(uri=uri, label=label, headers=self._task_headers(task_id, extra_headers)))
+
+    def accept_task(self, task_title: str, task_id: str, attributes: Dict[str, Any], extra_headers: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Accept a task given its attributes, and get its form
+
+        Args:
+            task_title (str): Title to identify the task
+            task_id (str): Id of the task
+            attributes (Dict[str, Any]): Attributes of the task, as returned by get_task_attributes
+            extra_headers (Dict[str, Any], optional): Extra headers, used for sites requests. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: State of the accepted task form
+        """
+        headers = self._task_headers(task_id, extra_headers)
 
         # If isAutoAcceptable == false, accept the task first then get the form UI
-        if not resp["isAutoAcceptable"]:
+        if not attributes["isAutoAcceptable"]:
 
             # First do a suite/rest/a/task/latest/{}/status call to get the button component
             unaccepted_task_form = self.accept_a_task("assigned", task_id, task_title=task_title, headers=headers)
@@ -98,3 +123,10 @@ class _TaskOpener:
             # The task does not need to be accepted in this case
             accepted_task_form = self.accept_a_task("accepted", task_id, task_title=task_title, headers=headers)
         return accepted_task_form
+
+    def _task_headers(self, task_id: str, extra_headers: Dict[str, Any] = None) -> Dict[str, Any]:
+        uri = "/suite/rest/a/task/latest/{}/attributes".format(task_id)
+        headers = self.interactor.setup_request_headers(uri)
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
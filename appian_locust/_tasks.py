@@ -1,17 +1,31 @@
-from typing import Any, Dict
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Generator, Iterator, List, Optional, Set, Tuple
+
+from gevent import Greenlet, joinall  # type: ignore
+from gevent.pool import Pool  # type: ignore
 
 from . import logger
 from ._base import _Base
 from ._interactor import _Interactor
-from ._locust_error_handler import log_locust_error
+from ._locust_error_handler import log_locust_error, report_custom_metric
+from ._sail_json import decode_response
 from ._task_opener import _TaskOpener
 from .uiform import SailUiForm
 
 log = logger.getLogger(__name__)
 
 
+# Phases of the task pipeline, reported as "Tasks.Pipeline.<phase>"
+PIPELINE_PAGE = "Page"
+PIPELINE_ATTRIBUTES = "Attributes"
+PIPELINE_ACCEPT = "Accept"
+PIPELINE_PHASES = (PIPELINE_PAGE, PIPELINE_ATTRIBUTES, PIPELINE_ACCEPT)
+
+
 class _Tasks(_Base):
     INITIAL_FEED_URI = "/suite/api/feed/tempo?m=menu-tasks&t=t&s=pt&defaultFacets=%255Bstatus-open%255D"
+    PIPELINE_REQUEST_TYPE = "TASK_PIPELINE"
 
     def __init__(self, interactor: _Interactor) -> None:
         """
@@ -29,6 +43,8 @@ class _Tasks(_Base):
         self.interactor = interactor
         self.task_opener = _TaskOpener(self.interactor)
         self._tasks: Dict[str, Any] = dict()
+        # Durations in milliseconds of each phase of the last task pipeline
+        self.pipeline_timings: Dict[str, List[float]] = {phase: [] for phase in PIPELINE_PHASES}
 
     def get_all(self, search_string: str = None) -> Dict[str, Any]:
         """
@@ -42,15 +58,34 @@ class _Tasks(_Base):
 
             >>> self.appian.task.get_all()
 
+        """
+        self._tasks = dict()
+        for _ in self.iter_task_pages():
+            pass
+        return self._tasks
+
+    def iter_task_pages(self) -> Iterator[Dict[str, Any]]:
+        """
+        Pages through the task feed, requesting the next page only once the previous one has been consumed.
+        The tasks of each page are also added to the ones already retrieved, so they can be used with ``get_task`` or ``visit``
+
+        Returns (Iterator[dict]): Tasks and associated metadata of each page
+
+        Examples:
+
+            >>> for page in self.appian.tasks.iter_task_pages():
+            ...     if "t-1234" in str(page.keys()):
+            ...         break
+
         """
         next_uri = _Tasks.INITIAL_FEED_URI
 
         headers = self.interactor.setup_request_headers()
         headers["Accept"] = "application/atom+json; inlineSail=true; recordHeader=true, application/json;"
-        self._tasks = dict()
 
         while next_uri:
-            response = self.interactor.get_page(uri=next_uri, headers=headers, label="Tasks").json()
+            response = decode_response(self.interactor.get_page(uri=next_uri, headers=headers, label="Tasks"))
+            page: Dict[str, Any] = dict()
             for current_item in response.get("feed", {}).get("entries", []):
                 # Supporting only the SAIL tasks (id starts with "t-" id.)
                 if "t-" in current_item.get("id", ""):
@@ -58,7 +93,8 @@ class _Tasks(_Base):
                     children = current_item.get("content", {}).get("children", [])
                     if len(children) > 0:
                         key = "{}_{}_{}".format(current_item["id"], current_item["title"], children[0])
-                        self._tasks[key] = current_item
+                        page[key] = current_item
+            self._tasks.update(page)
             feed_data = response.get("feed", {})
             partially_parsed_resp = feed_data.get("links", [])
             if len(partially_parsed_resp) > 0 and partially_parsed_resp[-1].get("rel", []) == "next":
@@ -66,7 +102,117 @@ class _Tasks(_Base):
                 next_uri = next_uri_with_hostname[len(self.interactor.host):]
             else:
                 next_uri = ""
-        return self._tasks
+            yield page
+
+    def iter_accepted_tasks(self, prefetch: int = 5, accept_concurrency: int = 5, max_tasks: int = None) -> Generator[SailUiForm, None, None]:
+        """
+        Drains the task feed, yielding the form of each task once it has been accepted.
+
+        The feed is paged through as tasks are consumed, and the attributes of the next ``prefetch`` tasks are requested
+        in the background while the current form is being processed. Tasks are accepted in batches of up to
+        ``accept_concurrency`` concurrent requests, a batch is only accepted once the forms of the previous one have
+        all been consumed, so no more tasks are held than are being worked on.
+
+        Tasks that fail to load or to be accepted, for example because another user accepted them first, are reported as
+        errors and skipped. The time spent loading feed pages, waiting on attributes and accepting each batch is reported
+        as "Tasks.Pipeline.Page", "Tasks.Pipeline.Attributes" and "Tasks.Pipeline.Accept", and kept in ``pipeline_timings``.
+        Breaking out of the loop, or closing the iterator, stops the requests still in flight for the next tasks.
+
+        Args:
+            prefetch (int, optional): Number of tasks to request the attributes of ahead of time. Default : 5
+            accept_concurrency (int, optional): Number of tasks accepted at the same time. Default : 5
+            max_tasks (int, optional): Stop after this many tasks of the feed, all of them if not set. Default : None
+
+        Returns (Iterator[SailUiForm]): SAIL form of each accepted task, in feed order
+
+        Examples:
+
+            >>> for form in self.appian.tasks.iter_accepted_tasks(prefetch=10, max_tasks=100):
+            ...     form.fill_text_field("Comment", "Done").click_button("Submit")
+
+        """
+        if prefetch < 1 or accept_concurrency < 1:
+            raise Exception(f"prefetch and accept_concurrency must be at least 1, were {prefetch} and {accept_concurrency}")
+
+        self.pipeline_timings = {phase: [] for phase in PIPELINE_PHASES}
+        feed = self._iter_pipeline_tasks(max_tasks)
+        attributes_pool = Pool(prefetch)
+        accept_pool = Pool(accept_concurrency)
+        # (title, id, greenlet getting the attributes), in feed order
+        pending: Deque[Tuple[str, str, Greenlet]] = deque()
+
+        def prefetch_attributes() -> None:
+            while len(pending) < prefetch:
+                task = next(feed, None)
+                if task is None:
+                    return
+                task_title, task_id = task
+                pending.append((task_title, task_id, attributes_pool.spawn(self._get_task_attributes, task_title, task_id)))
+
+        prefetch_attributes()
+        try:
+            while pending:
+                batch = [pending.popleft() for _ in range(min(accept_concurrency, len(pending)))]
+                # Start on the attributes of the next tasks while this batch is accepted and processed
+                prefetch_attributes()
+
+                start = time.perf_counter()
+                joinall([greenlet for _, _, greenlet in batch])
+                self._record_pipeline_phase(PIPELINE_ATTRIBUTES, start)
+
+                start = time.perf_counter()
+                accepting = [(task_title, task_id, accept_pool.spawn(self._accept_task, task_title, task_id, greenlet.value))
+                             for task_title, task_id, greenlet in batch if greenlet.value is not None]
+                joinall([greenlet for _, _, greenlet in accepting])
+                self._record_pipeline_phase(PIPELINE_ACCEPT, start)
+
+                for task_title, task_id, greenlet in accepting:
+                    if greenlet.value is not None:
+                        form_uri = "/suite/rest/a/task/latest/{}/form".format(task_id)
+                        yield SailUiForm(self.interactor, greenlet.value, form_uri, breadcrumb=f"Tasks.{task_title}")
+        finally:
+            # Closed early, for example by breaking out of the loop, the attributes prefetched for later tasks are no longer needed
+            attributes_pool.kill()
+            accept_pool.kill()
+            pending.clear()
+            feed.close()
+
+    def _iter_pipeline_tasks(self, max_tasks: Optional[int]) -> Generator[Tuple[str, str], None, None]:
+        pages = self.iter_task_pages()
+        seen_ids: Set[str] = set()
+        while max_tasks is None or len(seen_ids) < max_tasks:
+            start = time.perf_counter()
+            page = next(pages, None)
+            if page is None:
+                return
+            self._record_pipeline_phase(PIPELINE_PAGE, start)
+            for task in page.values():
+                # Pages are requested while tasks get accepted, so a task can show up again on a later page
+                if task["id"] in seen_ids:
+                    continue
+                seen_ids.add(task["id"])
+                yield task["content"]["children"][0], task["id"].replace("t-", "")
+                if max_tasks is not None and len(seen_ids) >= max_tasks:
+                    return
+
+    def _get_task_attributes(self, task_title: str, task_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.task_opener.get_task_attributes(task_title, task_id)
+        except Exception as e:
+            log_locust_error(e, error_desc=f"Could not get the attributes of task {task_id}", raise_error=False)
+            return None
+
+    def _accept_task(self, task_title: str, task_id: str, attributes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            return self.task_opener.accept_task(task_title, task_id, attributes)
+        except Exception as e:
+            log_locust_error(e, error_desc=f"Could not accept task {task_id}", raise_error=False)
+            return None
+
+    def _record_pipeline_phase(self, phase: str, start: float) -> None:
+        elapsed = (time.perf_counter() - start) * 1000
+        self.pipeline_timings[phase].append(elapsed)
+        report_custom_metric(self.interactor.client, _Tasks.PIPELINE_REQUEST_TYPE, f"Tasks.Pipeline.{phase}", elapsed)
 
     def get_task(self, task_name: str, exact_match: bool = True) -> Dict[str, Any]:
         """
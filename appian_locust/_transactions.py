@@ -0,0 +1,115 @@
+import functools
+import time
+from types import TracebackType
+from typing import Any, Callable, Optional, Type
+
+from requests import Response
+
+from ._locust_error_handler import report_custom_metric
+
+# Type of the transaction entries in the statistics
+TRANSACTION_REQUEST_TYPE = "TRANSACTION"
+
+
+class Transaction:
+    """
+    Business transaction, such as submitting an order, made of all the requests a user sends while it is open.
+    Its whole duration is reported as a single ``name`` entry of the "TRANSACTION" type in the statistics, along with
+    the total size of the responses. The transaction fails if any of its requests fails or if an exception is raised within it.
+
+    Transactions only keep a few counters, they can be nested and every open transaction of the user counts each request.
+
+    Example:
+
+    .. code-block:: python
+
+        with self.appian.transaction("Submit Order"):
+            form = self.appian.actions.visit_and_get_form("Create Order")
+            form.fill_text_field("Customer", "Acme").click("Submit")
+
+    """
+    __slots__ = ('name', 'interactor', 'requests', 'failed_requests', 'response_length', '_started_at')
+
+    def __init__(self, interactor: Any, name: str) -> None:
+        """
+        Args:
+            interactor (_Interactor): Interactor of the user, whose requests make up the transaction
+            name (str): Name of the entry in the statistics
+        """
+        self.name = name
+        self.interactor = interactor
+        self.requests = 0
+        self.failed_requests = 0
+        self.response_length = 0
+        self._started_at: Optional[float] = None
+
+    def __enter__(self) -> 'Transaction':
+        self.interactor.transactions.append(self)
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        response_time = (time.perf_counter() - (self._started_at or 0)) * 1000
+        transactions = self.interactor.transactions
+        if self in transactions:
+            transactions.remove(self)
+        exception: Optional[Exception] = None
+        if exc_value is not None:
+            exception = exc_value if isinstance(exc_value, Exception) else Exception(repr(exc_value))
+        elif self.failed_requests:
+            exception = Exception(f"{self.failed_requests} of the {self.requests} requests of '{self.name}' failed")
+        report_custom_metric(self.interactor.client, TRANSACTION_REQUEST_TYPE, self.name, response_time,
+                             response_length=self.response_length, exception=exception)
+
+    def record_response(self, response: Response) -> None:
+        """
+        Counts a response to a request sent while the transaction is open
+        """
+        self.requests += 1
+        content = response.content
+        self.response_length += len(content) if content else 0
+        if not response.ok:
+            self.failed_requests += 1
+
+
+def business_transaction(name: str) -> Callable:
+    """
+    Decorator that runs a task as a :class:`Transaction`. The first argument of the task must be an ``AppianTaskSet``,
+    or an object holding the interactor of the user such as an ``AppianClient`` or a ``SailUiForm``.
+
+    Args:
+        name (str): Name of the entry in the statistics
+
+    Example:
+
+    .. code-block:: python
+
+        class OrdersTaskSet(AppianTaskSet):
+
+            @task
+            @business_transaction("Submit Order")
+            def submit_order(self):
+                form = self.appian.actions.visit_and_get_form("Create Order")
+                form.fill_text_field("Customer", "Acme").click("Submit")
+
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            with Transaction(_find_interactor(owner), name):
+                return func(owner, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _find_interactor(owner: Any) -> Any:
+    appian = getattr(owner, "appian", None)
+    if appian is not None:
+        return appian.interactor
+    interactor = getattr(owner, "interactor", None)
+    if interactor is not None:
+        return interactor
+    if hasattr(owner, "transactions"):
+        return owner
+    raise Exception(f"Could not find the interactor of the user from {type(owner).__name__}")
@@ -1,6 +1,6 @@
-import copy
+from typing import Any, Dict, Optional
 
-from typing import Any, Iterable
+from ._form_memory import estimate_size
 
 
 class UiReconciler:
@@ -11,22 +11,34 @@ class UiReconciler:
     Reconciles the SAIL UI, based on the different responses passed
     """
 
-    def reconcile_ui(self, old_state: dict, new_state: dict) -> dict:
+    @staticmethod
+    def is_delta(new_state: dict) -> bool:
+        """
+        Whether a response only holds the components that were modified, rather than a completely new UI
+        """
+        return 'ui' in new_state and new_state['ui'].get('#t') == UiReconciler.COMPONENT_DELTA_TYPE \
+            and UiReconciler.MODIFIED_COMPONENTS_KEY in new_state['ui']
+
+    def reconcile_ui(self, old_state: dict, new_state: dict, modified_components: Optional[Dict[str, Any]] = None) -> dict:
         """
         In the case where components are simply modified:
-            Makes a copy of the old_state, and applies whichever changes are necessary from the new_state
+            Makes a copy of the old_state, and applies whichever changes are necessary from the new_state.
+            Only the objects on the path to the modified components are copied, the rest is shared with the old_state,
+            which is left untouched
 
         In the case where a completely new UI is returned:
             Replaces the old state with the new state
+
+        If given, modified_components is filled with the modified components as they are in the reconciled state, by cId
         """
         # Update case
-        if 'ui' in new_state and new_state['ui'].get('#t') == UiReconciler.COMPONENT_DELTA_TYPE \
-                and UiReconciler.MODIFIED_COMPONENTS_KEY in new_state['ui']:
-            old_state_copy = copy.deepcopy(old_state)
+        if self.is_delta(new_state):
             # create a map of cIds to new state components
             component_list = new_state['ui'].get(UiReconciler.MODIFIED_COMPONENTS_KEY)
             cid_to_component = {comp[UiReconciler.CID_KEY]: comp for comp in component_list if UiReconciler.CID_KEY in comp}
-            self._traverse_and_update_state(old_state_copy, cid_to_component)
+            old_state_copy = self._copy_and_update_state(old_state, cid_to_component, modified_components)
+            if old_state_copy is old_state:
+                old_state_copy = dict(old_state)
 
             # Pass context forward as well, for stateless mode
             old_state_copy['context'] = new_state['context']
@@ -35,20 +47,46 @@ class UiReconciler:
             # Simply return the new_state, as we are most likely on a new form
             return new_state
 
-    def _traverse_and_update_state(self, state: Any, cid_to_component: dict) -> None:
+    def footprint(self) -> int:
+        """
+        Estimates the memory taken by the reconciler, which keeps no state between calls
+
+        Returns (int): Estimated size in bytes
+        """
+        return estimate_size(self)
+
+    def _copy_and_update_state(self, state: Any, cid_to_component: Dict[str, Any],
+                               modified_components: Optional[Dict[str, Any]] = None) -> Any:
         """
         Moves through a dict recursively,
-        swapping out any components that have been modified with new ones
+        swapping out any components that have been modified with new ones.
+        Returns a copy of the dict or list if anything in it was swapped, otherwise the same dict or list
         """
         is_dict = isinstance(state, dict)
         if is_dict:
             possible_cid = state.get(UiReconciler.CID_KEY)
             if possible_cid and possible_cid in cid_to_component:
-                new_component = cid_to_component[possible_cid]
-                state.update(new_component)
-                return
-        if is_dict or isinstance(state, list):
-            elems_to_traverse: Iterable = state.values() if is_dict else state
-            for elem in elems_to_traverse:
+                modified_component = {**state, **cid_to_component[possible_cid]}
+                if modified_components is not None:
+                    modified_components[possible_cid] = modified_component
+                return modified_component
+            state_copy: Any = None
+            for key, elem in state.items():
+                if isinstance(elem, (list, dict)):
+                    new_elem = self._copy_and_update_state(elem, cid_to_component, modified_components)
+                    if new_elem is not elem:
+                        if state_copy is None:
+                            state_copy = dict(state)
+                        state_copy[key] = new_elem
+            return state if state_copy is None else state_copy
+        if isinstance(state, list):
+            state_copy = None
+            for index, elem in enumerate(state):
                 if isinstance(elem, (list, dict)):
-                    self._traverse_and_update_state(elem, cid_to_component)
+                    new_elem = self._copy_and_update_state(elem, cid_to_component, modified_components)
+                    if new_elem is not elem:
+                        if state_copy is None:
+                            state_copy = list(state)
+                        state_copy[index] = new_elem
+            return state if state_copy is None else state_copy
+        return state
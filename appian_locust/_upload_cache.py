@@ -0,0 +1,275 @@
+import hashlib
+import mimetypes
+import mmap
+import os
+import uuid
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# Files at least this large are memory mapped instead of being read into memory
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+
+class UploadSource:
+    """
+    Content of a document to upload, along with a default name to upload it under and a digest of its bytes.
+    The content is either an in-memory ``bytes`` object or a read-only memory map of the file, both are
+    exposed through :attr:`content` as a ``memoryview`` so that they can be sent without being copied.
+
+    Warning: Internal class, sources are created by the :class:`UploadCache`
+    """
+    __slots__ = ('name', '_digest', '_buffer', '_view', '_multipart_bodies')
+
+    def __init__(self, name: str, buffer: Union[bytes, mmap.mmap], digest: str = None) -> None:
+        """
+        Args:
+            name (str): File name the document is uploaded under
+            buffer (bytes or mmap): Content of the document
+            digest (str, optional): Hex digest of the content, computed on first use if not provided
+        """
+        self.name = name
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._digest = digest
+        self._multipart_bodies: Dict[str, MultipartFileBody] = {}
+
+    @property
+    def digest(self) -> str:
+        # Lazy, so that uploading without the cache does not hash the whole file
+        if self._digest is None:
+            self._digest = hash_content(self._view)
+        return self._digest
+
+    @property
+    def content(self) -> memoryview:
+        return self._view
+
+    @property
+    def size(self) -> int:
+        return self._view.nbytes
+
+    @property
+    def is_mapped(self) -> bool:
+        return isinstance(self._buffer, mmap.mmap)
+
+    def multipart_body(self, file_name: str = None) -> 'MultipartFileBody':
+        """
+        Returns the multipart body to upload this content, built once per file name
+
+        Args:
+            file_name (str, optional): File name to upload the content under, defaults to the name of the source
+
+        Returns (MultipartFileBody): Body that can be streamed as the data of a request
+        """
+        file_name = file_name or self.name
+        body = self._multipart_bodies.get(file_name)
+        if body is None:
+            body = self._multipart_bodies[file_name] = MultipartFileBody(self.content, file_name)
+        return body
+
+    def close(self) -> None:
+        self._multipart_bodies.clear()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # A body is still being sent, the mapping is closed once it is garbage collected
+                pass
+
+
+def hash_content(content: Union[bytes, memoryview]) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def read_upload_source(file_path: str, mmap_threshold: int = DEFAULT_MMAP_THRESHOLD) -> UploadSource:
+    """
+    Reads a file to upload, memory mapping it if it is at least ``mmap_threshold`` bytes
+
+    Args:
+        file_path (str): Path to the file
+        mmap_threshold (int, optional): Size in bytes from which the file is memory mapped rather than read. Default : 1MiB
+
+    Returns (UploadSource): Content of the file
+    """
+    name = os.path.basename(file_path)
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= mmap_threshold:
+            # The mapping stays valid once the file is closed
+            return UploadSource(name, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return UploadSource(name, f.read())
+
+
+class MultipartFileBody:
+    """
+    ``multipart/form-data`` body holding a single file, that is streamed rather than encoded on every request.
+    The part headers and the closing boundary are encoded once, and the file content is sent as slices of a
+    ``memoryview``, so a memory mapped file is never copied into the body.
+
+    The body can be passed as the ``data`` of a request as many times as needed, along with its :attr:`content_type`.
+    """
+    __slots__ = ('content_type', '_preamble', '_content', '_trailer')
+
+    # Size of the slices of content handed to the connection, lets other greenlets run between them
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, content: memoryview, file_name: str, field_name: str = "file", boundary: str = None) -> None:
+        """
+        Args:
+            content (memoryview): Content of the file
+            file_name (str): File name sent in the part headers
+            field_name (str, optional): Name of the form field. Default : "file"
+            boundary (str, optional): Multipart boundary, randomly generated if not provided
+        """
+        boundary = boundary or uuid.uuid4().hex
+        file_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._preamble = (f'--{boundary}\r\n'
+                          f'Content-Disposition: form-data; name="{_quote(field_name)}"; filename="{_quote(file_name)}"\r\n'
+                          f'Content-Type: {file_type}\r\n\r\n').encode()
+        self._content = content
+        self._trailer = f'\r\n--{boundary}--\r\n'.encode()
+
+    def __len__(self) -> int:
+        return len(self._preamble) + self._content.nbytes + len(self._trailer)
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        yield self._preamble
+        content = self._content
+        for offset in range(0, content.nbytes, self.CHUNK_SIZE):
+            yield content[offset:offset + self.CHUNK_SIZE]
+        yield self._trailer
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the whole body, copying the content. Only meant for recording and debugging
+        """
+        return b"".join(self)
+
+
+def _quote(value: str) -> str:
+    # Same escaping browsers apply to form-data names
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class UploadCache:
+    """
+    Process wide cache of documents to upload, keyed by the hash of their content.
+    Each file is read (or memory mapped) once, and files with identical content share a single buffer,
+    so that thousands of users uploading the same fixture do not each hit the disk.
+
+    Files are re-read if their size or modification time changes.
+    """
+
+    def __init__(self, mmap_threshold: int = DEFAULT_MMAP_THRESHOLD) -> None:
+        """
+        Args:
+            mmap_threshold (int, optional): Size in bytes from which files are memory mapped rather than read. Default : 1MiB
+        """
+        self.mmap_threshold = mmap_threshold
+        # (path, size, mtime) -> digest, so unchanged files are not hashed again
+        self._digests_by_file: Dict[Tuple[str, int, int], str] = {}
+        self._sources_by_digest: Dict[str, UploadSource] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: str) -> UploadSource:
+        """
+        Returns the cached content of a file, reading it on first use
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns (UploadSource): Cached content of the file
+        """
+        stat = os.stat(file_path)
+        file_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests_by_file.get(file_key)
+        if digest is not None:
+            self.hits += 1
+            return self._sources_by_digest[digest]
+
+        self.misses += 1
+        source = self.add(read_upload_source(file_path, self.mmap_threshold))
+        self._digests_by_file[file_key] = source.digest
+        return source
+
+    def add(self, source: UploadSource) -> UploadSource:
+        """
+        Adds a source to the cache, returning the already cached source if one with the same content exists
+
+        Args:
+            source (UploadSource): Source to add
+
+        Returns (UploadSource): The cached source for this content
+        """
+        cached = self._sources_by_digest.get(source.digest)
+        if cached is None:
+            self._sources_by_digest[source.digest] = source
+            return source
+        if cached is not source:
+            source.close()
+        return cached
+
+    def clear(self) -> None:
+        """
+        Drops every cached document, closing memory maps
+        """
+        for source in self._sources_by_digest.values():
+            source.close()
+        self._sources_by_digest.clear()
+        self._digests_by_file.clear()
+
+    def __len__(self) -> int:
+        return len(self._sources_by_digest)
+
+
+class DocumentIdReusePolicy:
+    """
+    Lets a previously uploaded document id be used again instead of uploading the same content again.
+    Only meant for scenarios that do not measure upload throughput, the server sees a single upload
+    for every ``max_uses`` uses of the same content.
+    """
+
+    def __init__(self, max_uses: int = 1) -> None:
+        """
+        Args:
+            max_uses (int, optional): Number of times a document id can be used in total, 1 disables reuse. Default : 1
+        """
+        if max_uses < 1:
+            raise Exception(f"max_uses must be at least 1, was {max_uses}")
+        self.max_uses = max_uses
+        # (digest, is_encrypted) -> [document id, remaining uses]
+        self._ids: Dict[Tuple[str, bool], list] = {}
+
+    def checkout(self, digest: str, is_encrypted: bool = False) -> Optional[int]:
+        """
+        Returns a document id that can be used for this content, if there is one with uses left
+
+        Args:
+            digest (str): Digest of the document content
+            is_encrypted (bool, optional): Whether the document is uploaded encrypted
+
+        Returns (Optional[int]): Reusable document id, or None if the document must be uploaded
+        """
+        entry = self._ids.get((digest, is_encrypted))
+        if entry is None or entry[1] <= 0:
+            return None
+        entry[1] -= 1
+        return entry[0]
+
+    def record(self, digest: str, doc_id: int, is_encrypted: bool = False) -> None:
+        """
+        Records a freshly uploaded document id, which counts as its first use
+
+        Args:
+            digest (str): Digest of the document content
+            doc_id (int): Document id returned by the server
+            is_encrypted (bool, optional): Whether the document was uploaded encrypted
+        """
+        if self.max_uses > 1:
+            self._ids[(digest, is_encrypted)] = [doc_id, self.max_uses - 1]
+
+
+# Shared by every user of the process
+UPLOAD_CACHE = UploadCache()
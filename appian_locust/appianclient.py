@@ -1,7 +1,7 @@
 import os
 import urllib.parse
 import uuid
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from locust import SequentialTaskSet, TaskSet
 from locust.clients import HttpSession
@@ -19,10 +19,12 @@ from ._feature_toggle_helper import (get_client_feature_toggles,
 from ._interactor import _Interactor
 from ._locust_error_handler import log_locust_error
 from ._news import _News
+from ._pacing import PacingEngine, ThinkTime
 from ._records import _Records
 from ._reports import _Reports
 from ._sites import _Sites
 from ._tasks import _Tasks
+from ._transactions import Transaction
 from .exceptions import MissingConfigurationException
 
 log = logger.getLogger(__name__)
@@ -253,6 +255,64 @@ class AppianClient:
         """
         return self._sites
 
+    def set_stateless_mode(self, stateless: bool = True) -> None:
+        """
+        Switches between stateful SAIL, where the server keeps the state of every open form, and stateless SAIL,
+        where the client sends the whole state of the form, its context, with every request. Use stateless mode to
+        model deployments that do not keep the state of forms on the server.
+
+        In stateless mode, forms keep their context compressed, it is no longer part of ``SailUiForm.state``.
+        Only forms opened after switching modes are affected.
+
+        Args:
+            stateless (bool, optional): Whether to use stateless SAIL. Default : True
+
+        Examples:
+
+            >>> self.appian.set_stateless_mode()
+
+        """
+        self.interactor.stateless = stateless
+
+    def set_pacing(self, think_times: Dict[str, ThinkTime] = None, scale: float = 1.0) -> None:
+        """
+        Makes the user think before every interaction with a form, as a person would, rather than sending chained
+        interactions back to back. Think time depends on the type of interaction: ``TYPING`` text, ``SELECTING`` from
+        dropdowns, checkboxes, radio buttons and dates, ``CLICKING`` buttons and links, and ``READING_GRID`` before paging
+        or sorting a grid. See :class:`PacingEngine` for the defaults.
+
+        Args:
+            think_times (Dict[str, ThinkTime], optional): Think time of some interaction types, overriding the defaults. Default : None
+            scale (float, optional): Factor applied to every think time, 0 to stop thinking. Default : 1.0
+
+        Examples:
+
+            >>> from appian_locust._pacing import READING_GRID, ThinkTime
+            >>> self.appian.set_pacing({READING_GRID: ThinkTime(5, 20)})
+
+        """
+        self.interactor.pacing = PacingEngine(think_times, scale) if scale > 0 else None
+
+    def transaction(self, name: str) -> Transaction:
+        """
+        Groups every request sent within it, such as the six requests of filling and submitting a form, into a business
+        transaction. Its whole duration and outcome are reported as a single ``name`` entry of the "TRANSACTION" type
+        in the statistics, next to the entries of each request.
+
+        Args:
+            name (str): Name of the entry in the statistics
+
+        Returns (Transaction): Context manager of the transaction, see also the ``business_transaction`` decorator
+
+        Examples:
+
+            >>> with self.appian.transaction("Submit Order"):
+            ...     form = self.appian.actions.visit_and_get_form("Create Order")
+            ...     form.fill_text_field("Customer", "Acme").click("Submit")
+
+        """
+        return self.interactor.transaction(name)
+
     def login(self, auth: list = None) -> Tuple[HttpSession, Response]:
         return self.interactor.login(auth)
 
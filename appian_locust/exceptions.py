@@ -25,3 +25,7 @@ class InvalidComponentException(Exception):
 
 class ChoiceNotFoundException(Exception):
     pass
+
+
+class InvalidSelectorException(Exception):
+    pass
@@ -1,16 +1,20 @@
 import functools
 import random
 import re
-from typing import Any, Callable, Dict, Generator, List, Union
+from typing import Any, Callable, Collection, Dict, Generator, List, Tuple, Union
 
 import gevent  # type: ignore
 from locust.env import Environment
 
 from . import logger
+from ._sampling import sample_item
 
 ENV = Environment()
 log = logger.getLogger(__name__)
 
+# Used when picking items at random without a generator of the user
+_RANDOM = random.Random()
+
 
 def format_label(label: str, delimiter: str = None, index: int = 0) -> str:
     """
@@ -33,21 +37,149 @@ def format_label(label: str, delimiter: str = None, index: int = 0) -> str:
     return label.replace(" ", "_")
 
 
-def extract(obj: Any, key: str, val: Any) -> Generator:
-    """Recursively search for values of key in JSON tree."""
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if isinstance(v, (dict, list)):
-                yield from extract(v, key, val)
-            elif k == key and v == val:
-                yield obj
+# Decoded JSON only contains plain dicts and lists, checking the exact type is much cheaper than isinstance
+_JSON_CONTAINERS = {dict, list}
+
 
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from extract(item, key, val)
+class _Found:
+    """
+    Marks a match on the stack of the iterative walkers, so it is yielded in depth first order
+    """
+    __slots__ = ('value',)
 
+    def __init__(self, value: Any) -> None:
+        self.value = value
 
-def extract_values(obj: Dict[str, Any], key: str, val: Any) -> List[Dict[str, Any]]:
+
+def extract(obj: Any, key: str, val: Any, prune: Callable[[Any], bool] = None) -> Generator:
+    """
+    Iteratively search for the dictionaries containing key with value val in JSON tree.
+    The tree is walked with an explicit stack, so deeply nested trees do not hit the recursion limit,
+    and the walk stops as soon as the caller stops consuming the generator.
+
+    Args:
+        obj: JSON tree to search
+        key (str): key to match
+        val (any): value the key should have
+        prune (Callable, optional): called with every nested dictionary or list, whose whole subtree
+                                    is skipped if it returns True (hidden components for example)
+
+    Returns:
+        generator of the matching dictionaries, in depth first order
+    """
+    if type(obj) not in _JSON_CONTAINERS or (prune is not None and prune(obj)):
+        return
+    stack: List[Any] = [obj]
+    pop, push = stack.pop, stack.append
+    while stack:
+        current = pop()
+        current_type = type(current)
+        if current_type is _Found:
+            yield current.value
+            continue
+        if current_type is dict:
+            if key in current and current[key] == val and type(current[key]) not in _JSON_CONTAINERS:
+                # The match comes after the containers nested before the matching key, and before the ones after it
+                for k, v in reversed(list(current.items())):
+                    if k == key:
+                        push(_Found(current))
+                    elif type(v) in _JSON_CONTAINERS and (prune is None or not prune(v)):
+                        push(v)
+                continue
+            inner_items = reversed(list(current.values()))
+        else:
+            inner_items = reversed(current)
+        for v in inner_items:
+            if type(v) in _JSON_CONTAINERS and (prune is None or not prune(v)):
+                push(v)
+
+
+class JsonVisitor:
+    """
+    Walks a JSON tree a single time and dispatches every registered matcher during that one traversal,
+    instead of running one full tree walk per key/value pair being searched for.
+
+    A matcher fires for every dictionary that directly contains ``key`` with a non container value equal
+    to ``val``, in the same order ``extract`` would yield them. Its callback receives the matching dictionary
+    and the list of containers (dictionaries and lists) enclosing it, outermost first. If a callback returns
+    ``True`` the traversal stops right away, which allows early exit for first match queries.
+
+    Example:
+        >>> visitor = JsonVisitor()
+        >>> grids = visitor.collect('#t', 'GridField')
+        >>> buttons = visitor.collect('#t', 'ButtonWidget')
+        >>> visitor.visit(form_json)
+
+        will fill both lists with a single walk of ``form_json``
+
+    """
+
+    def __init__(self) -> None:
+        self._matchers: Dict[str, List[Tuple[Any, Callable[[Dict[str, Any], List[Any]], Any]]]] = dict()
+
+    def on(self, key: str, val: Any, callback: Callable[[Dict[str, Any], List[Any]], Any]) -> 'JsonVisitor':
+        """
+        Register a callback to be called for every dictionary containing the key/value pair
+
+        Args:
+            key (str): key to match
+            val (any): value the key should have
+            callback (Callable): called with the matching dictionary and its enclosing containers,
+                                 returning ``True`` stops the traversal
+
+        Returns:
+            The visitor itself, so registrations can be chained
+        """
+        self._matchers.setdefault(key, []).append((val, callback))
+        return self
+
+    def collect(self, key: str, val: Any) -> List[Dict[str, Any]]:
+        """
+        Register a matcher that collects every dictionary containing the key/value pair
+
+        Args:
+            key (str): key to match
+            val (any): value the key should have
+
+        Returns:
+            The list the matches will be appended to while visiting
+        """
+        matches: List[Dict[str, Any]] = []
+        self.on(key, val, lambda match, _: matches.append(match))
+        return matches
+
+    def visit(self, obj: Any) -> None:
+        """
+        Walk the JSON tree once, calling back the registered matchers
+
+        Args:
+            obj: JSON tree to walk
+        """
+        matchers = self._matchers
+        if not matchers or type(obj) not in _JSON_CONTAINERS:
+            return
+        # Containers being walked, outermost first, along with the iterator over their items
+        containers: List[Any] = [obj]
+        iterators: List[Any] = [iter(obj.items()) if type(obj) is dict else iter(obj)]
+        while iterators:
+            container = containers[-1]
+            is_dict = type(container) is dict
+            for item in iterators[-1]:
+                v = item[1] if is_dict else item
+                if type(v) in _JSON_CONTAINERS:
+                    containers.append(v)
+                    iterators.append(iter(v.items()) if type(v) is dict else iter(v))
+                    break
+                if is_dict and item[0] in matchers:
+                    for val, callback in matchers[item[0]]:
+                        if v == val and callback(container, containers[:-1]):
+                            return
+            else:
+                containers.pop()
+                iterators.pop()
+
+
+def extract_values(obj: Dict[str, Any], key: str, val: Any, prune: Callable[[Any], bool] = None) -> List[Dict[str, Any]]:
     """
     Pull all values of specified key from nested JSON.
 
@@ -55,41 +187,60 @@ def extract_values(obj: Dict[str, Any], key: str, val: Any) -> List[Dict[str, An
         obj (dict): Dictionary to be searched
         key (str): tuple of key and value.
         value (any): value, which can be any type
+        prune (Callable, optional): subtrees for which it returns True are not searched
 
     Returns:
         list of matched key-value pairs
 
     """
-    return [elem for elem in extract(obj, key, val)]
+    return [elem for elem in extract(obj, key, val, prune)]
 
 
-def extract_item_by_label(obj: Union[dict, list], label: str) -> Generator:
+def extract_item_by_label(obj: Union[dict, list], label: str, prune: Callable[[Any], bool] = None) -> Generator:
     """
-    Recursively search for all fields with a matching label in JSON tree.
+    Iteratively search for all fields with a matching label in JSON tree.
     And return as a generator
     """
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == label:
-                yield v
-            yield from extract_item_by_label(v, label)
-    elif isinstance(obj, list):
-        for v in obj:
-            yield from extract_item_by_label(v, label)
+    if type(obj) not in _JSON_CONTAINERS or (prune is not None and prune(obj)):
+        return
+    stack: List[Any] = [obj]
+    pop, push = stack.pop, stack.append
+    while stack:
+        current = pop()
+        current_type = type(current)
+        if current_type is _Found:
+            yield current.value
+            continue
+        if current_type is dict:
+            if label in current:
+                # The field is yielded before walking into its own value
+                for k, v in reversed(list(current.items())):
+                    if type(v) in _JSON_CONTAINERS and (prune is None or not prune(v)):
+                        push(v)
+                    if k == label:
+                        push(_Found(v))
+                continue
+            inner_items = reversed(list(current.values()))
+        else:
+            inner_items = reversed(current)
+        for v in inner_items:
+            if type(v) in _JSON_CONTAINERS and (prune is None or not prune(v)):
+                push(v)
 
 
-def extract_all_by_label(obj: Union[dict, list], label: str) -> list:
-    """Recursively search for all fields with a matching label in JSON tree."""
-    return [elem for elem in extract_item_by_label(obj, label)]
+def extract_all_by_label(obj: Union[dict, list], label: str, prune: Callable[[Any], bool] = None) -> list:
+    """Iteratively search for all fields with a matching label in JSON tree."""
+    return [elem for elem in extract_item_by_label(obj, label, prune)]
 
 
-def get_random_item(list_of_items: List[Any], exclude: List[Any] = []) -> Any:
+def get_random_item(list_of_items: List[Any], exclude: List[Any] = [], rng: random.Random = None) -> Any:
     """
     Gets a random item from the given list excluding the items if any provided
 
     Args:
         list_of_items: list of items of any data type
         exclude: if any items needs to be excluded in random pick
+        rng: random generator to pick with, such as the generator of the user to get reproducible picks. Default : a shared generator
 
     Returns:
         Randomly picked Item
@@ -97,14 +248,13 @@ def get_random_item(list_of_items: List[Any], exclude: List[Any] = []) -> Any:
     Raises:
         In case of no item to pick, Exception will be raised
     """
-    count = len(list_of_items)
-    while count != 0:
-        selected_item = random.SystemRandom().choice(list_of_items)
-        if selected_item not in exclude:
-            return selected_item
-        else:
-            count = count - 1
-    raise(Exception("There is no item to select randomly"))
+    excluded: Collection[Any] = exclude
+    try:
+        excluded = set(exclude)
+    except TypeError:
+        # Unhashable items are compared one by one
+        pass
+    return sample_item(list_of_items, rng or _RANDOM, excluded)
 
 
 def list_filter(list_var: List[str], filter_string: str, exact_match: bool = False) -> List[str]:
@@ -132,7 +282,8 @@ def list_filter(list_var: List[str], filter_string: str, exact_match: bool = Fal
     return return_list
 
 
-def find_component_by_attribute_in_dict(attribute: str, value: str, component_tree: Dict[str, Any]) -> Any:
+def find_component_by_attribute_in_dict(attribute: str, value: str, component_tree: Dict[str, Any],
+                                        prune: Callable[[Any], bool] = None) -> Any:
     """
     Find a UI component by the given attribute (label for example) in a dictionary
     It only returns the first match in a depth first search of the json tree
@@ -143,6 +294,7 @@ def find_component_by_attribute_in_dict(attribute: str, value: str, component_tr
         attribute: an attribute to search ('label' for example)
         value: the value of the attribute ('Submit' for example)
         component_tree: the json response.
+        prune: optional predicate, subtrees for which it returns True are not searched
 
     Returns:
         the json object of the component or None if none is found
@@ -153,11 +305,12 @@ def find_component_by_attribute_in_dict(attribute: str, value: str, component_tr
         will search the json response to find a component that has 'Submit' as the label
 
     """
-    for val in extract(component_tree, attribute, value):
-        return val
+    # The walk stops as soon as the first match is found
+    return next(extract(component_tree, attribute, value, prune), None)
 
 
-def find_component_by_label_and_type_dict(attribute: str, value: str, type: str, component_tree: Dict[str, Any]) -> Any:
+def find_component_by_label_and_type_dict(attribute: str, value: str, type: str, component_tree: Dict[str, Any],
+                                          prune: Callable[[Any], bool] = None) -> Any:
     """
     Find a UI component by the given attribute (like label) in a dictionary, and the type of the component as well.
     (`#t` should match the type value passed in)
@@ -170,6 +323,7 @@ def find_component_by_label_and_type_dict(attribute: str, value: str, type: str,
         value: the value of the label
         type: Type of the component (TextField, StartProcessLink etc.)
         component_tree: the json response.
+        prune: optional predicate, subtrees for which it returns True are not searched
 
     Returns:
         the json object of the component or None if none is found
@@ -178,12 +332,13 @@ def find_component_by_label_and_type_dict(attribute: str, value: str, type: str,
         >>> find_component_by_label_and_type_dict('label', 'MyLabel', 'StartProcessLink', self.json_response)
 
     """
-    for val in extract(component_tree, attribute, value):
+    for val in extract(component_tree, attribute, value, prune):
         if (('#t' in val) and (val['#t'] == type)):
             return val
 
 
-def find_component_by_index_in_dict(component_type: str, index: int, component_tree: Dict[str, Any]) -> Any:
+def find_component_by_index_in_dict(component_type: str, index: int, component_tree: Dict[str, Any],
+                                    prune: Callable[[Any], bool] = None) -> Any:
     """
     Find a UI component by the index of a given type of component ("RadioButtonField" for example) in a dictionary
     Performs a depth first search and counts quantity of the component, so the 1st is the first one
@@ -194,6 +349,7 @@ def find_component_by_index_in_dict(component_type: str, index: int, component_t
         component_type: type of the component(#t in the JSON response, 'RadioButtonField' for example)
         index: the index of the component with the component_type ('1' for example - Indices start from 1)
         component_tree: the json response
+        prune: optional predicate, subtrees for which it returns True are neither searched nor counted
 
     Returns:
         the json object of the component or the count of matching attributes if no match found
@@ -208,7 +364,7 @@ def find_component_by_index_in_dict(component_type: str, index: int, component_t
         raise Exception(
             f"Invalid index: '{index}'.  Please enter a positive number")
 
-    result = _find_component_by_type_and_index(component_type, index, component_tree, 0)
+    result = _find_component_by_type_and_index(component_type, index, component_tree, 0, prune)
 
     if isinstance(result, int):
         if result == 0:
@@ -220,22 +376,26 @@ def find_component_by_index_in_dict(component_type: str, index: int, component_t
     return result
 
 
-def _find_component_by_type_and_index(type_name: str, index: int, component: Any, count: int) -> Any:
-    is_dict = isinstance(component, dict)
-    if is_dict:
-        if '#t' in component and component.get('#t') == type_name:
-            count += 1
-            if count == index:
-                return component
-    if is_dict or isinstance(component, list):
-        component_items = component.values() if is_dict else component
-        for inner_component in component_items:
-            if isinstance(inner_component, (dict, list)):
-                result = _find_component_by_type_and_index(type_name, index, inner_component, count)
-                if isinstance(result, dict):
-                    return result
-                else:
-                    count = result
+def _find_component_by_type_and_index(type_name: str, index: int, component: Any, count: int,
+                                      prune: Callable[[Any], bool] = None) -> Any:
+    if type(component) not in _JSON_CONTAINERS or (prune is not None and prune(component)):
+        return count
+    # Components are counted in pre-order, a dictionary before anything nested within it
+    stack: List[Any] = [component]
+    pop, push = stack.pop, stack.append
+    while stack:
+        current = pop()
+        if type(current) is dict:
+            if '#t' in current and current['#t'] == type_name:
+                count += 1
+                if count == index:
+                    return current
+            inner_items = reversed(list(current.values()))
+        else:
+            inner_items = reversed(current)
+        for v in inner_items:
+            if type(v) in _JSON_CONTAINERS and (prune is None or not prune(v)):
+                push(v)
     return count
 
 
@@ -1,41 +1,78 @@
-from typing import Any, Dict, Tuple, Optional
+import enum
+import re
+from typing import Any, Dict, List, Tuple, Optional
 
+from ._catalog import RecordEntry
 from ._locust_error_handler import log_locust_error
-from .helper import extract_values, find_component_by_attribute_in_dict
-from re import match
+from .helper import JsonVisitor, find_component_by_attribute_in_dict
 
+_RECORD_LIST_URL_PATH = re.compile(r'tempo/records/type/([\w]+)/view/all')
+_RECORD_LIST_POST_REQUEST_URL = re.compile(r'[\S]+\/pages\/records\/recordType\/([\w]+)')
+_SITE_PAGE_URL = re.compile(r'.*\/page\/\w+$')
+_SITE_REPORT_PAGE_NAME = re.compile(r'(?<=\/pages\/)\w+')
 
-def get_all_records_from_json(json_response: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
-    is_grid = _is_grid(json_response)
-    records = {}
+
+def get_all_records_from_json(json_response: Dict[str, Any], keep_full_json: bool = False) -> Tuple[Dict[str, Any], int]:
+    """
+        Extracts all record instances out of a record list response, as compact ``RecordEntry`` objects
+        keyed by ``label::_recordRef``
+
+        Args:
+            json_response: record list response to parse
+            keep_full_json: whether each entry should also retain the full JSON of its record link
+
+        Returns: Tuple of the records found and the number of corrupt records encountered
+    """
+    visitor = JsonVisitor()
+    grid_markers = visitor.collect("testLabel", "recordGrid")
+    grid_markers_instances = visitor.collect("testLabel", "recordGridInstances")
+    all_record_items = visitor.collect("#t", "RecordLink")
+    all_linked_items = visitor.collect("#t", "LinkedItem")
+    # First RecordLink and first label string found within each LinkedItem, keyed by the id of the LinkedItem
+    linked_record_links: Dict[int, Dict[str, Any]] = {}
+    linked_labels: Dict[int, Dict[str, Any]] = {}
+
+    def on_record_link(record_link: Dict[str, Any], ancestors: List[Any]) -> None:
+        for ancestor in ancestors:
+            if _is_linked_item(ancestor):
+                linked_record_links.setdefault(id(ancestor), record_link)
+
+    def on_string(label: Dict[str, Any], ancestors: List[Any]) -> None:
+        path = ancestors + [label]
+        for position, ancestor in enumerate(ancestors):
+            if _is_linked_item(ancestor) and path[position + 1] is ancestor.get("values"):
+                linked_labels.setdefault(id(ancestor), label)
+
+    visitor.on("#t", "RecordLink", on_record_link)
+    visitor.on("#t", "string", on_string)
+    # A single walk of the response gathers everything needed below
+    visitor.visit(json_response)
+
+    records: Dict[str, Any] = {}
     error_key_string = "ERROR::"
     error_key_count = 0
-    if is_grid:
-        all_record_items = extract_values(json_response, "#t", "RecordLink")
+    if grid_markers or grid_markers_instances:
         # extract all RecordLinks out of the response directly
         for record_item in all_record_items:
             try:
                 opaque_id = record_item["_recordRef"]
                 label = record_item["label"]
                 key = label + "::" + opaque_id
-                records[key] = record_item
+                records[key] = RecordEntry(record_item, keep_full_json)
             except Exception as e:
                 error_key_count += 1
                 records[error_key_string + str(error_key_count)] = {}
                 log_locust_error(e, error_desc="Corrupt Record Error")
     else:
-        all_linked_items = extract_values(json_response, "#t", "LinkedItem")
         for current_item in all_linked_items:
-            record_link_raw = extract_values(current_item, "#t", "RecordLink")
-            if len(record_link_raw) > 0:
-                label_raw = extract_values(current_item["values"], "#t", "string")
-                record_item = record_link_raw[0]
+            record_link = linked_record_links.get(id(current_item))
+            if record_link is not None:
                 try:
-                    opaque_id = record_item["_recordRef"]
-                    label = label_raw[0]["#v"]
-                    record_item["label"] = label
+                    opaque_id = record_link["_recordRef"]
+                    label = linked_labels[id(current_item)]["#v"]
+                    record_link["label"] = label
                     key = label + "::" + opaque_id
-                    records[key] = record_item
+                    records[key] = RecordEntry(record_link, keep_full_json)
                 except Exception as e:
                     error_key_count += 1
                     records[error_key_string + str(error_key_count)] = {}
@@ -71,8 +108,21 @@ def get_record_header_response(form_json: Dict[str, Any]) -> str:
 
 
 def _is_grid(res_dict_var: Dict[str, Any]) -> bool:
-    return any([len(extract_values(res_dict_var, "testLabel", "recordGrid")) != 0,
-                len(extract_values(res_dict_var, "testLabel", "recordGridInstances")) != 0])
+    grid_markers: List[Dict[str, Any]] = []
+
+    def on_grid_marker(grid_marker: Dict[str, Any], _: List[Any]) -> bool:
+        grid_markers.append(grid_marker)
+        return True
+
+    visitor = JsonVisitor()
+    visitor.on("testLabel", "recordGrid", on_grid_marker)
+    visitor.on("testLabel", "recordGridInstances", on_grid_marker)
+    visitor.visit(res_dict_var)
+    return len(grid_markers) != 0
+
+
+def _is_linked_item(component: Any) -> bool:
+    return isinstance(component, dict) and component.get("#t") == "LinkedItem"
 
 
 def get_url_stub_from_record_list_url_path(url: Optional[str]) -> Optional[str]:
@@ -88,7 +138,7 @@ def get_url_stub_from_record_list_url_path(url: Optional[str]) -> Optional[str]:
     """
     record_url_match = None
     if url:
-        record_url_match = match(r'tempo/records/type/([\w]+)/view/all', url)
+        record_url_match = _RECORD_LIST_URL_PATH.match(url)
     return record_url_match.groups()[0] if record_url_match else None
 
 
@@ -104,5 +154,87 @@ def get_url_stub_from_record_list_post_request_url(post_url: Optional[str]) -> O
     """
     record_url_match = None
     if post_url:
-        record_url_match = match(r'[\S]+\/pages\/records\/recordType\/([\w]+)', post_url)
+        record_url_match = _RECORD_LIST_POST_REQUEST_URL.match(post_url)
     return record_url_match.groups()[0] if record_url_match else None
+
+
+class RecordLinkUrlType(enum.Enum):
+    TEMPO = 'tempo'
+    SITE_RECORD = 'site_record'
+    SITE_PAGE = 'site_page'
+    SITE_REPORT = 'site_report'
+    SITE_RECORD_VIEW = 'site_record_view'
+
+
+class RecordLinkRoute:
+    """
+    Where the record links of a form lead to, worked out once from the URL of the form.
+    Building the URL of a record link is then plain string formatting.
+    """
+    __slots__ = ('url_type', 'prefix')
+
+    def __init__(self, url_type: RecordLinkUrlType, prefix: str = "") -> None:
+        """
+        Args:
+            url_type (RecordLinkUrlType): Kind of page the record links are on
+            prefix (str, optional): URL the record reference is appended to, unused for record views within a site
+        """
+        self.url_type = url_type
+        self.prefix = prefix
+
+    def build_url(self, record_ref: str, dashboard: str, component: Dict[str, Any]) -> str:
+        """
+        Builds the URL of a record link
+
+        Args:
+            record_ref (str): Opaque reference of the record
+            dashboard (str): Record view to open, such as "summary"
+            component (dict): The RecordLink, only used for record views within a site
+
+        Returns (str): URL (not including the host) of the record view
+        """
+        if self.prefix:
+            return f"{self.prefix}{record_ref}/view/{dashboard}"
+        # Record views within a site are the only routes without a prefix
+        site_name = component.get('siteUrlStub', "")
+        page_name = component.get('pageUrlStub', "")
+        return f"/suite/rest/a/sites/latest/{site_name}/page/{page_name}/record/{record_ref}/view/{dashboard}"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RecordLinkRoute) and (self.url_type, self.prefix) == (other.url_type, other.prefix)
+
+    def __repr__(self) -> str:
+        return f"RecordLinkRoute({self.url_type}, {self.prefix!r})"
+
+
+def get_record_link_route(url: str) -> RecordLinkRoute:
+    """
+        Classifies the URL of a form, to know how to build the URLs of the record links on it.
+        Meant to be called once per form URL, the returned route can be reused for every click.
+
+        Args:
+            url: url path (not including the host and domain) of the form the record links are on
+
+        Returns: The route to build record link URLs with
+
+        Raises: Exception if record links can't be followed from this URL
+    """
+    if "tempo" in url:
+        return RecordLinkRoute(RecordLinkUrlType.TEMPO, "/suite/tempo/records/item/")
+    if "sites" in url and "/record/" in url:
+        parse_pattern = "/record/"
+        return RecordLinkRoute(RecordLinkUrlType.SITE_RECORD, url[:url.index(parse_pattern) + len(parse_pattern)])
+    if _SITE_PAGE_URL.match(url):
+        return RecordLinkRoute(RecordLinkUrlType.SITE_PAGE, url + "/record/")
+    # Support record links on site pages
+    if "sites" in url and "/report" in url and "/pages/" in url:
+        page_search = _SITE_REPORT_PAGE_NAME.search(url)
+        if not page_search:
+            raise Exception("Unexpected record link URL - couldn't find page name after /pages/")
+        page_name = page_search.group()
+        url_prefix_index = url.index(page_name + "/report") + len(page_name)
+        return RecordLinkRoute(RecordLinkUrlType.SITE_REPORT, url[:url_prefix_index].replace("/pages/", "/page/") + "/record/")
+    # Support record view links from a record within a site
+    if "record" in url:
+        return RecordLinkRoute(RecordLinkUrlType.SITE_RECORD_VIEW)
+    raise Exception("Unexpected record link URL")
@@ -3,24 +3,32 @@ import enum
 import errno
 import json
 import os
-import random
 import warnings
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import quote, urlparse
 
 from appian_locust.records_helper import _is_grid
 
 from . import logger
+from ._component_selector import compile_selector
+from ._component_subscriptions import (CID_KEY, ComponentCallback, ComponentSubscription,
+                                       ComponentSubscriptions)
+from ._context_store import CompressedContext, compress_context
+from ._form_memory import FORM_STATE_BUDGET, SpilledState, estimate_size
 from ._grid_interactor import GridInteractor
 from ._interactor import _Interactor
 from ._locust_error_handler import raises_locust_error
+from ._pacing import CLICKING, READING_GRID, SELECTING, TYPING
+from ._sail_json import decode_response, loads_sail
 from ._task_opener import _TaskOpener
 from ._ui_reconciler import UiReconciler
+from ._upload_cache import UploadSource
 from .exceptions import ComponentNotFoundException, InvalidComponentException, ChoiceNotFoundException
 from .helper import (extract_all_by_label, find_component_by_attribute_in_dict,
                      find_component_by_index_in_dict,
                      find_component_by_label_and_type_dict)
-from .records_helper import (get_record_header_response,
+from .records_helper import (RecordLinkRoute, get_record_header_response,
+                             get_record_link_route,
                              get_record_summary_view_response,
                              get_url_stub_from_record_list_url_path)
 
@@ -53,11 +61,28 @@ class SailUiForm:
         """
         self.interactor: _Interactor = interactor
         self.task_opener: _TaskOpener = _TaskOpener(self.interactor)
-        self.state: Dict[str, Any] = state
+        # Held compressed instead of the state while the form is spilled, see ``appian_locust._form_memory``
+        self._state: Optional[Dict[str, Any]] = None
+        self._spilled_state: Optional[SpilledState] = None
+        self.state = state
+        # Incremented every time the state changes, used to know when cached lookups are stale
+        self.state_version: int = 0
+        # Results of lookups on the state, only valid for the state version they were computed for
+        self._state_cache: Dict[Any, Any] = dict()
+        self._state_cache_version: int = 0
+        # Route of the record links, along with the form URL it was worked out from
+        self._record_link_route: Optional[Tuple[str, RecordLinkRoute]] = None
+        # Created on first subscription, see subscribe
+        self._subscriptions: Optional[ComponentSubscriptions] = None
         self.form_url = url
+        # Forms opened in stateless mode keep their context compressed, out of the state
+        self.stateless: bool = interactor.stateless
+        self._context: Union[Dict[str, Any], CompressedContext, None] = None
         if any(key not in self.state for key in (KEY_CONTEXT, KEY_UUID)):
             return None
-        self.context: dict = self.state[KEY_CONTEXT]
+        if self.stateless:
+            self.state = {key: value for key, value in self.state.items() if key != KEY_CONTEXT}
+        self._store_context(state[KEY_CONTEXT])
         self.uuid: str = self.state[KEY_UUID]
         self.grid_interactor: GridInteractor = GridInteractor()
         self.reconciler: UiReconciler = UiReconciler()
@@ -101,6 +126,171 @@ class SailUiForm:
     def __str__(self) -> str:
         return f"self_state={json.dumps(self.state,indent=4)}"
 
+    @property
+    def context(self) -> Dict[str, Any]:
+        """
+        Context of the form, sent with every update. In stateless mode, it is decompressed on every access
+        """
+        context = self._context
+        if isinstance(context, CompressedContext):
+            return context.get()
+        return context  # type: ignore
+
+    def _store_context(self, context: Dict[str, Any]) -> None:
+        self._context = compress_context(context) if self.stateless else context
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """
+        Latest state of the form. If the state was spilled to stay within the form state budget, it is loaded back first
+        """
+        state = self._state
+        if state is None:
+            spilled_state = self._spilled_state
+            self._spilled_state = None
+            state = self._state = FORM_STATE_BUDGET.rehydrate(self, spilled_state.load)  # type: ignore
+        elif FORM_STATE_BUDGET.enabled:
+            FORM_STATE_BUDGET.touch(self)
+        return state
+
+    @state.setter
+    def state(self, state: Dict[str, Any]) -> None:
+        self._state = state
+        self._spilled_state = None
+        if FORM_STATE_BUDGET.enabled:
+            FORM_STATE_BUDGET.update(self, state)
+
+    def _spill_state(self) -> None:
+        """
+        Replaces the state with its compressed JSON, called by the form state budget
+        """
+        if self._state is not None:
+            self._spilled_state = SpilledState(self._state)
+            self._state = None
+            # Cached lookups point into the state, they would keep it in memory
+            self._state_cache = dict()
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._state is None
+
+    def footprint(self) -> int:
+        """
+        Estimates the memory taken by the form, not counting the interactor shared with the user
+
+        Returns (int): Estimated size in bytes
+        """
+        seen = {id(self.interactor)}
+        size = estimate_size(self._state, seen) + estimate_size(self._state_cache, seen) + estimate_size(self._context, seen)
+        if self._spilled_state is not None:
+            size += self._spilled_state.compressed_size
+        return size
+
+    def find_components(self, selector: str) -> List[Dict[str, Any]]:
+        """
+        Finds all the components matching a selector, such as ``GridField[label="Orders"] > RecordLink``.
+        See ``appian_locust._component_selector.compile_selector`` for the selector syntax.
+
+        Selectors are compiled once, and results are cached until the state of the form changes.
+
+        Args:
+            selector(str): Selector of the components to find
+
+        Returns (list): The matching components, in document order
+
+        Examples:
+
+            >>> form.find_components('GridField[label="Orders"] > RecordLink')
+
+        """
+        return list(self._select(selector, first_only=False))
+
+    def find_component(self, selector: str) -> Dict[str, Any]:
+        """
+        Finds the first component matching a selector, such as ``GridField[label="Orders"] > RecordLink:nth(3)``.
+        See ``appian_locust._component_selector.compile_selector`` for the selector syntax.
+
+        Selectors are compiled once, and results are cached until the state of the form changes.
+
+        Args:
+            selector(str): Selector of the component to find
+
+        Returns (dict): The first matching component
+
+        Raises: ComponentNotFoundException if no component matches the selector
+
+        Examples:
+
+            >>> form.find_component('GridField[label="Orders"] > RecordLink:nth(3)')
+
+        """
+        found = self._select(selector, first_only=True)
+        if not found:
+            raise ComponentNotFoundException(f"Could not find any component matching '{selector}' in the provided form")
+        return found[0]
+
+    def subscribe(self, callback: ComponentCallback, component_id: str = None, selector: str = None) -> ComponentSubscription:
+        """
+        Calls back whenever a component changes, rather than looking it up again after every interaction.
+
+        When a response only modifies some components, only the subscriptions to these components are looked up.
+        When a response replaces the whole UI, selectors are resolved again and every watched component still in the form
+        is considered changed.
+
+        Args:
+            callback (Callable): Called with the form and the changed component, as it is in the new state of the form
+            component_id (str, optional): cId of the component to watch
+            selector (str, optional): Selector of the components to watch, see ``find_components``
+
+        Returns (ComponentSubscription): The subscription, to pass to ``unsubscribe``
+
+        Example:
+
+            >>> statuses = []
+            >>> form.subscribe(lambda form, component: statuses.append(component["value"]), selector='TextField[label="Status"]')
+
+        """
+        if component_id is not None and selector is None:
+            subscription = ComponentSubscription(callback, frozenset((component_id,)), None)
+        elif selector is not None and component_id is None:
+            component_ids = frozenset(component[CID_KEY] for component in self.find_components(selector) if CID_KEY in component)
+            subscription = ComponentSubscription(callback, component_ids, compile_selector(selector))
+        else:
+            raise Exception("Either a component id or a selector must be passed")
+        if self._subscriptions is None:
+            self._subscriptions = ComponentSubscriptions()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ComponentSubscription) -> None:
+        """
+        Stops calling back a subscription returned by ``subscribe``
+        """
+        if self._subscriptions is not None:
+            self._subscriptions.remove(subscription)
+
+    def _get_state_cache(self) -> Dict[Any, Any]:
+        if self._state_cache_version != self.state_version:
+            self._state_cache = dict()
+            self._state_cache_version = self.state_version
+        return self._state_cache
+
+    def _select(self, selector: str, first_only: bool) -> List[Dict[str, Any]]:
+        state_cache = self._get_state_cache()
+        # A full result also answers a first match query
+        found = state_cache.get(("selector", selector, False))
+        if found is None and first_only:
+            found = state_cache.get(("selector", selector, True))
+        if found is None:
+            compiled_selector = compile_selector(selector)
+            if first_only:
+                first_component = compiled_selector.first(self.state)
+                found = [first_component] if first_component is not None else []
+            else:
+                found = compiled_selector.select(self.state)
+            state_cache[("selector", selector, first_only)] = found
+        return found
+
     # TODO: Handle components on a page with the same label
 
     @raises_locust_error
@@ -124,6 +314,7 @@ class SailUiForm:
             >>> form.fill_text_field('Title','My New Novel')
 
         """
+        self._think(TYPING, value)
         attribute_to_find = 'testLabel' if is_test_label else 'label'
         component = find_component_by_attribute_in_dict(
             attribute_to_find, label, self.state)
@@ -159,6 +350,7 @@ class SailUiForm:
             # selects the first ParagraphField with the value "Hello, Testing"
 
         """
+        self._think(TYPING, text_to_fill)
         component = find_component_by_index_in_dict(type_of_component, index, self.state)
         reeval_url = self._get_update_url_for_reeval(self.state)
         locust_label = locust_request_label or f"{self.breadcrumb}.FillTextFieldByIndex.{index}"
@@ -196,6 +388,7 @@ class SailUiForm:
             # and fills it with "Hello, Testing"
 
         """
+        self._think(TYPING, text_to_fill)
         component = find_component_by_attribute_in_dict(attribute, value_for_attribute, self.state)
         if component is None:
             raise Exception(f"No such component found with attribute: '{attribute}' and its value: '{value_for_attribute}''")
@@ -254,6 +447,7 @@ class SailUiForm:
             >>> form.fill_picker_field('Customer', 'GAC Guyana', identifier='code')
 
         """
+        self._think(TYPING, value)
         # pickerFieldCustom will add a test-Label at the level where the suggestions/saveInto exist
         test_label = f'test-{label}'
         component = find_component_by_label_and_type_dict('testLabel', test_label, 'PickerWidget', self.state)
@@ -286,7 +480,7 @@ class SailUiForm:
         if not v_or_id:
             raise Exception(f"Could not extract picker values '{id_index}' from suggestions_list {suggestions_list}")
 
-        v_choice = random.choice(range(len(v_or_id)))
+        v_choice = self.interactor.random.randrange(len(v_or_id))
 
         dict_value = identifiers[v_choice]
 
@@ -324,6 +518,7 @@ class SailUiForm:
             >>> form.click('SampleTestLabel', is_test_label = True)
 
         """
+        self._think(CLICKING)
         locust_label = locust_request_label or f"{self.breadcrumb}.Click.{label}"
         return self._click(label, is_test_label=is_test_label, locust_request_label=locust_label)
 
@@ -350,6 +545,7 @@ class SailUiForm:
             >>> form.click_link('Update')
 
         """
+        self._think(CLICKING)
         locust_label = locust_request_label or f"{self.breadcrumb}.ClickButton.{label}"
         return self._click(label, is_test_label=is_test_label, locust_request_label=locust_label)
 
@@ -375,6 +571,7 @@ class SailUiForm:
             >>> form.click_link('Update')
 
         """
+        self._think(CLICKING)
         locust_label = locust_request_label or f"{self.breadcrumb}.ClickLink.{label}"
         return self._click(label, is_test_label=is_test_label, locust_request_label=locust_label)
 
@@ -419,6 +616,7 @@ class SailUiForm:
             >>> form.click_card_layout_by_index(2)
 
         """
+        self._think(CLICKING)
         component = find_component_by_index_in_dict("CardLayout", index, self.state)
 
         if not component.get("link"):
@@ -455,6 +653,7 @@ class SailUiForm:
         Returns (SailUiForm): The record form (feed) for the linked record.
 
         """
+        self._think(CLICKING)
         attribute_to_find = 'testLabel' if is_test_label else 'label'
         component = find_component_by_attribute_in_dict(attribute_to_find, label, self.state)
         self._validate_component_found(component, label)
@@ -462,7 +661,8 @@ class SailUiForm:
         reeval_url = self._get_update_url_for_reeval(self.state)
         locust_label = locust_request_label or f"{self.breadcrumb}.ClickRecordLink.{label}"
         new_state = self.interactor.click_record_link(reeval_url, component, self.context, self.uuid,
-                                                      locust_label=locust_label)
+                                                      locust_label=locust_label,
+                                                      route=self._get_record_link_route(reeval_url))
         return self._reconcile_state(new_state, form_url=reeval_url)
 
     @raises_locust_error
@@ -486,6 +686,7 @@ class SailUiForm:
             >>> form.click_start_process_link('Request upgrade')
 
         """
+        self._think(CLICKING)
 
         component = find_component_by_label_and_type_dict('label', label, START_PROCESS_LINK_TYPE, self.state)
         self._validate_component_found(component, label)
@@ -607,6 +808,7 @@ class SailUiForm:
             >>> header_form.click_related_action('Request upgrade')
 
         """
+        self._think(CLICKING)
         component = find_component_by_attribute_in_dict('label', label, self.state)
         self._validate_component_found(component, label)
         # Support scenario where related action label is found within outer "ButtonWidget" rather than directly in "RelatedActionLink" component
@@ -652,6 +854,7 @@ class SailUiForm:
             >>> form.select_dropdown_item('MyDropdown', 'My First Choice')
 
         """
+        self._think(SELECTING)
         attribute_to_find = 'testLabel' if is_test_label else 'label'
         component = find_component_by_attribute_in_dict(
             attribute_to_find, label, self.state)
@@ -705,6 +908,7 @@ class SailUiForm:
             >>> form.select_multi_dropdown_item('MyMultiDropdown', ['My First Choice','My Second Choice'])
 
         """
+        self._think(SELECTING)
         attribute_to_find = 'testLabel' if is_test_label else 'label'
         component = find_component_by_attribute_in_dict(
             attribute_to_find, label, self.state)
@@ -784,6 +988,7 @@ class SailUiForm:
             >>> form.check_checkbox_by_test_label('myTestLabel', None) # unchecks
 
         """
+        self._think(SELECTING)
         if not test_label:
             raise Exception(f"No testLabel provided to select a checkbox")
 
@@ -811,6 +1016,7 @@ class SailUiForm:
             >>> form.check_checkbox_by_label('myLabel', None) # unchecks
 
         """
+        self._think(SELECTING)
         if not label:
             raise Exception(f"No label provided to select a checkbox")
 
@@ -834,6 +1040,7 @@ class SailUiForm:
         Examples:
 
         """
+        self._think(CLICKING)
         # find the TabButtonGroup, which is the  model we need for the SaveRequest
         reeval_url = self._get_update_url_for_reeval(self.state)
 
@@ -850,7 +1057,7 @@ class SailUiForm:
         return self._reconcile_state(new_state, form_url=reeval_url)
 
     @raises_locust_error
-    def upload_document_to_upload_field(self, label: str, file_path: str, locust_request_label: str = "") -> 'SailUiForm':
+    def upload_document_to_upload_field(self, label: str, file_path: Union[str, UploadSource], locust_request_label: str = "") -> 'SailUiForm':
         """
         Uploads a document to a named upload field
         There are two steps to this which can fail, one is the document upload, the other
@@ -858,7 +1065,7 @@ class SailUiForm:
 
         Args:
             label(str): Label of the upload field
-            file_path(str): File path to the document
+            file_path(str or UploadSource): File path to the document, or an in-memory document
 
         Keyword Args:
             locust_request_label(str): Label used to identify the request for locust statistics
@@ -870,7 +1077,13 @@ class SailUiForm:
             >>> form.upload_document_to_upload_field('Upload File', "/usr/local/appian/File.zip")
             >>> form.upload_document_to_upload_field('Upload Properties', "/usr/local/appian/File.properties")
 
+            Documents can also be generated in memory, instead of being read from disk
+
+            >>> from appian_locust._synthetic_documents import generate_document
+            >>> form.upload_document_to_upload_field('Upload File', generate_document(1024 * 1024, "pdf"))
+
         """
+        self._think(SELECTING)
         component = find_component_by_attribute_in_dict(
             'label', label, self.state)
 
@@ -886,7 +1099,7 @@ class SailUiForm:
 
         is_encrypted = component.get("isEncrypted", False)
 
-        if not os.path.exists(file_path):
+        if not isinstance(file_path, UploadSource) and not os.path.exists(file_path):
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
         doc_id = self.interactor.upload_document_to_server(file_path, is_encrypted=is_encrypted)
         locust_label = locust_request_label or f"{self.breadcrumb}.FileUpload.{label}"
@@ -917,6 +1130,7 @@ class SailUiForm:
             >>> form.fill_date_field('Date of Birth', datetime.date(1992, 12, 30))
 
         """
+        self._think(SELECTING)
         if not isinstance(date_input, datetime.date):
             raise Exception("Input must be of type datetime.date")
         field_type = 'DatePickerField'
@@ -959,6 +1173,7 @@ class SailUiForm:
             >>> form.fill_datetime_field('Date and Time of Birth', datetime.datetime(1992, 12, 30, 12, 30, 5))
 
         """
+        self._think(SELECTING)
         if not isinstance(datetime_input, datetime.datetime):
             raise Exception("Input must be of type datetime.datetime")
         field_type = 'DateTimePickerField'
@@ -977,6 +1192,39 @@ class SailUiForm:
 
         return self._reconcile_state(new_state, form_url=reeval_url)
 
+    def get_grid_data(self, label: str = None, index: int = None, as_numpy: bool = False) -> Dict[str, Any]:
+        """
+        Reads the cells of the current page of a grid, as columns.
+        Either a label or an index is required, indices are useful if there is no title for the grid
+
+        The result is cached until the state of the form changes, so reading many cells only walks the grid once.
+        It should not be modified.
+
+        Args:
+            label(str): Label of the grid
+            index(str): Index of the grid
+            as_numpy(bool): Return each column as a NumPy array rather than a list, requires NumPy to be installed
+
+        Returns (dict): Column name, which is its label or else its field or position, to the cell values of that column
+
+        Examples:
+
+            >>> form.get_grid_data(label='my nice grid')['Total'][0]
+        """
+        state_cache = self._get_state_cache()
+        cache_key = ("grid_data", label, index, as_numpy)
+        if cache_key not in state_cache:
+            grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
+            columns: Dict[str, Any] = self.grid_interactor.get_columns(grid)
+            if as_numpy:
+                try:
+                    import numpy  # type: ignore
+                except ImportError:
+                    raise Exception("NumPy must be installed to get grid data as NumPy arrays")
+                columns = {name: numpy.asarray(values) for name, values in columns.items()}
+            state_cache[cache_key] = columns
+        return state_cache[cache_key]
+
     @raises_locust_error
     def move_to_end_of_paging_grid(self, label: str = None, index: int = None, locust_request_label: str = "") -> 'SailUiForm':
         """
@@ -996,6 +1244,7 @@ class SailUiForm:
 
             >>> form.move_to_end_of_paging_grid(label='my nice grid')
         """
+        self._think(READING_GRID)
         grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
         grid_label = self.grid_interactor.format_grid_display_label(grid)
 
@@ -1023,6 +1272,7 @@ class SailUiForm:
 
             >>> form.move_to_beginning_of_paging_grid(label='my nice grid')
         """
+        self._think(READING_GRID)
         grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
         grid_label = self.grid_interactor.format_grid_display_label(grid)
 
@@ -1054,6 +1304,7 @@ class SailUiForm:
 
             >>> form.move_to_left_in_paging_grid(label='my nice grid')
         """
+        self._think(READING_GRID)
         grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
         grid_label = self.grid_interactor.format_grid_display_label(grid)
 
@@ -1085,6 +1336,7 @@ class SailUiForm:
 
             >>> form.move_to_right_in_paging_grid(index=0) # move to right in first grid on the page
         """
+        self._think(READING_GRID)
         grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
         grid_label = self.grid_interactor.format_grid_display_label(grid)
 
@@ -1121,6 +1373,7 @@ class SailUiForm:
 
             >>> form.sort_paging_grid(index=0,field_name='Total',ascending=True)
         """
+        self._think(READING_GRID)
         if not field_name:
             raise Exception("Field to sort cannot be blank when sorting a grid")
         grid = self.grid_interactor.find_grid_by_label_or_index(self.state, label=label, index=index)
@@ -1151,6 +1404,7 @@ class SailUiForm:
             >>> form.select_radio_button_by_test_label('myTestLabel', 1)  # selects the first item
 
         """
+        self._think(SELECTING)
         component = find_component_by_attribute_in_dict(
             'testLabel', test_label, self.state)
 
@@ -1185,6 +1439,7 @@ class SailUiForm:
             >>> form.select_radio_button_by_label('myLabel', 1)  # selects the first item
 
         """
+        self._think(SELECTING)
         component = find_component_by_attribute_in_dict(
             'label', label, self.state)
 
@@ -1219,6 +1474,7 @@ class SailUiForm:
             >>> form.select_radio_button_by_index(1, 1)  # selects the first item in the first radio button field
 
         """
+        self._think(SELECTING)
         component = find_component_by_index_in_dict(
             'RadioButtonField', field_index, self.state)
 
@@ -1232,6 +1488,7 @@ class SailUiForm:
         return self._reconcile_state(new_state, form_url=reeval_url)
 
     def go_to_next_record_grid_page(self, locust_request_label: str = "") -> 'SailUiForm':
+        self._think(READING_GRID)
         context_label = locust_request_label or f"{self.breadcrumb}.NextPage"
         headers = self.interactor.setup_request_headers()
         headers["Accept"] = "application/vnd.appian.tv.ui+json"
@@ -1260,12 +1517,12 @@ class SailUiForm:
 
         """
         # self in this case is a record form (feed) containing embedded forms (header and view form)
-        record_header_response = get_record_header_response(self.state)
+        record_header_state = self._get_embedded_form_state("header", get_record_header_response)
 
         # record "feed" form has no breadcrumb - set up a breadcrumb
         self.breadcrumb = "Record.HeaderForm.SailUi"
 
-        return SailUiForm(self.interactor, json.loads(record_header_response), self.form_url,
+        return SailUiForm(self.interactor, record_header_state, self.form_url,
                           breadcrumb=self.breadcrumb)
 
     def get_record_view_form(self) -> 'SailUiForm':
@@ -1279,12 +1536,25 @@ class SailUiForm:
             >>> form.get_record_view_form()
 
         """
-        record_view_response = get_record_summary_view_response(self.state)
+        record_view_state = self._get_embedded_form_state("summary", get_record_summary_view_response)
 
         # record "feed" form has no breadcrumb - set up a breadcrumb
         self.breadcrumb = "Record.ViewForm.SailUi"
 
-        return SailUiForm(self.interactor, json.loads(record_view_response), self.form_url, breadcrumb=self.breadcrumb)
+        return SailUiForm(self.interactor, record_view_state, self.form_url, breadcrumb=self.breadcrumb)
+
+    def _get_embedded_form_state(self, name: str, get_embedded_response: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+        """
+        Embedded forms are JSON strings within the state, they are only parsed the first time they are asked for
+        after each change of the state. Forms never change their state in place, so the parsed state can be shared
+        by the forms created from it.
+        """
+        state_cache = self._get_state_cache()
+        cache_key = ("embedded_form", name)
+        embedded_state = state_cache.get(cache_key)
+        if embedded_state is None:
+            embedded_state = state_cache[cache_key] = loads_sail(get_embedded_response(self.state))
+        return embedded_state
 
     def filter_records_using_searchbox(self, search_term: str = "", locust_request_label: str = "") -> 'SailUiForm':
         """
@@ -1302,12 +1572,13 @@ class SailUiForm:
 
         Returns (SailUiForm): The record type list UiForm with the filtered results.
         """
+        self._think(TYPING, search_term)
         context_label = locust_request_label or f"{self.breadcrumb}.RecordType.SearchByText"
         search_uri = f"{self.form_url}?searchTerm={quote(search_term)}"
 
         headers = self.interactor.setup_sail_headers()
         response = self.interactor.get_page(uri=search_uri, headers=headers, label=context_label)
-        return SailUiForm(self.interactor, response.json(), self.form_url, breadcrumb=context_label)
+        return SailUiForm(self.interactor, decode_response(response), self.form_url, breadcrumb=context_label)
 
     def assert_no_validations_present(self) -> 'SailUiForm':
         """
@@ -1384,6 +1655,7 @@ class SailUiForm:
             >>> form.click_record_search_button_by_index(1)
 
         """
+        self._think(CLICKING)
         component = find_component_by_index_in_dict("SearchBoxWidget", index, self.state)
         self._validate_component_found_by_attribute(component, "searchButtonLabel", "Search")
 
@@ -1399,12 +1671,26 @@ class SailUiForm:
 
     def _reconcile_state(self, new_state: dict, form_url: str = "") -> 'SailUiForm':
         self.interactor.datatype_cache.cache(new_state)
-        self.state = self.reconciler.reconcile_ui(self.state, new_state)
+        subscriptions = self._subscriptions
+        modified_components: Optional[Dict[str, Any]] = dict() if subscriptions else None
+        state = self.reconciler.reconcile_ui(self.state, new_state, modified_components)
+        new_context = state.pop(KEY_CONTEXT, None) if self.stateless else state.get(KEY_CONTEXT)
+        self.state = state
+        self.state_version += 1
         self.form_url = form_url or self.form_url
-        self.uuid = self.state.get(KEY_UUID) or self.uuid
-        self.context = self.state.get(KEY_CONTEXT) or self.context
+        self.uuid = state.get(KEY_UUID) or self.uuid
+        if new_context:
+            self._store_context(new_context)
+        if subscriptions:
+            subscriptions.notify(self, state, modified_components if UiReconciler.is_delta(new_state) else None)
         return self
 
+    def _think(self, interaction: str, text: Any = None) -> None:
+        # Waits as long as the user would before the interaction, if pacing is set, see AppianClient.set_pacing
+        pacing = self.interactor.pacing
+        if pacing is not None:
+            pacing.pause(interaction, self.interactor.random, text)
+
     def _validate_component_found(self, component: Optional[Dict[str, Any]], label: str, type: Optional[str] = None) -> None:
         if not component:
             optional_type_info = f" of type '{type}'" if type else ''
@@ -1418,6 +1704,18 @@ class SailUiForm:
                 its value: '{value_for_attribute}' in the provided form
                 ''')
 
+    def _get_record_link_route(self, url: str) -> Optional[RecordLinkRoute]:
+        """
+        Works out how to build record link URLs from this form once per form URL, rather than on every click.
+        Returns None if the URL is not supported, in which case the interactor reports the error.
+        """
+        if self._record_link_route is None or self._record_link_route[0] != url:
+            try:
+                self._record_link_route = (url, get_record_link_route(url))
+            except Exception:
+                return None
+        return self._record_link_route[1]
+
     def _get_update_url_for_reeval(self, state: Dict[str, Any]) -> str:
         """
         This function looks at the links object in a SAIL response
@@ -0,0 +1,25 @@
+import timeit
+from typing import Any, Callable, Dict
+
+
+def compare(title: str, candidates: Dict[str, Callable[[], Any]], number: int = 20, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time every candidate and print how each compares to the first one, which is treated as the baseline
+
+    Args:
+        title (str): Heading printed above the results
+        candidates (dict): Name of each candidate mapped to a no argument callable to time
+        number (int, optional): How many calls make up one timing run. Default : 20
+        repeat (int, optional): How many timing runs to take the best of. Default : 5
+
+    Returns:
+        Best time per call, in seconds, for every candidate
+    """
+    print(title)
+    results: Dict[str, float] = {}
+    for name, candidate in candidates.items():
+        results[name] = min(timeit.repeat(candidate, number=number, repeat=repeat)) / number
+    baseline = next(iter(results.values()))
+    for name, seconds in results.items():
+        print(f"    {name:<45} {seconds * 1000:10.3f} ms/call {baseline / seconds:8.2f}x")
+    return results
@@ -0,0 +1,44 @@
+"""
+Compares picking one of 300,000 records with a Zipf distribution through ``random.choices``, which walks the weights
+on every pick, through a binary search over precomputed cumulative weights, and through the alias table used by
+``ZipfAccess``.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_access_distributions
+"""
+import bisect
+import itertools
+import random
+
+from appian_locust._sampling import UniformAccess, ZipfAccess
+
+from ._timing import compare
+
+RECORD_COUNT = 300000
+
+
+def main() -> None:
+    records = [f"record_{index}" for index in range(RECORD_COUNT)]
+    weights = [rank ** -1.0 for rank in range(1, RECORD_COUNT + 1)]
+    cumulative_weights = list(itertools.accumulate(weights))
+    total_weight = cumulative_weights[-1]
+    rng = random.Random(0)
+    zipf = ZipfAccess()
+    # Builds the alias table outside of the timings
+    zipf.pick(records, rng)
+    uniform = UniformAccess()
+
+    compare(f"Zipf pick among {RECORD_COUNT} records", {
+        "random.choices with weights": lambda: rng.choices(records, weights)[0],
+        "bisect over cumulative weights": lambda: records[bisect.bisect_right(cumulative_weights, rng.random() * total_weight)],
+        "alias table": lambda: zipf.pick(records, rng),
+    }, number=200)
+    compare(f"uniform pick among {RECORD_COUNT} records", {
+        "random.choice over list(keys)": lambda: rng.choice(list(records)),
+        "UniformAccess over a key array": lambda: uniform.pick(records, rng),
+    }, number=200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares the memory held by the decoded mock fixtures when decoded with ``json.loads``, and with the SAIL decoder
+which interns keys and short string values, as if every fixture was the form of many users at once.
+Also times both decoders.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_json_interning
+"""
+import json
+import os
+import tracemalloc
+from typing import Any, Callable, List
+
+from appian_locust._sail_json import loads_sail
+from tests.mock_reader import DIR_PATH, FOLDER_NAME, read_mock_file
+
+from ._timing import compare
+
+# Copies of every fixture held at once, as if opened by as many users
+COPIES = 20
+
+
+def retained_bytes(decode: Callable[[str], Any], documents: List[str]) -> int:
+    tracemalloc.start()
+    try:
+        decoded = [decode(document) for _ in range(COPIES) for document in documents]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del decoded
+    return size
+
+
+def main() -> None:
+    documents = []
+    for fixture in sorted(os.listdir(os.path.join(DIR_PATH, FOLDER_NAME))):
+        document = read_mock_file(fixture)
+        if fixture.endswith(".json") and document.lstrip().startswith(("{", "[")):
+            documents.append(document)
+
+    print(f"memory held by {COPIES} copies of {len(documents)} fixtures")
+    baseline = retained_bytes(json.loads, documents)
+    interned = retained_bytes(loads_sail, documents)
+    print(f"    {'json.loads':<45} {baseline / 1e6:10.1f} MB")
+    print(f"    {'loads_sail':<45} {interned / 1e6:10.1f} MB {1 - interned / baseline:8.1%} less")
+
+    compare(f"decode {len(documents)} fixtures", {
+        "json.loads": lambda: [json.loads(document) for document in documents],
+        "loads_sail": lambda: [loads_sail(document) for document in documents],
+    }, number=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compares the iterative JSON tree walkers in helper against the recursive generators they replaced,
+on the mock fixtures used by the tests, as well as on an artificially deep tree.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_json_walkers
+"""
+import json
+from typing import Any, Dict, Generator, List
+
+from appian_locust.helper import (_find_component_by_type_and_index, extract,
+                                  extract_item_by_label)
+from tests.mock_reader import read_mock_file
+
+from ._timing import compare
+
+FIXTURES = ["records_response.json", "sites_record_recordType_resp.json", "report_with_rep_sales_grid.json",
+            "form_content_response.json"]
+
+
+def recursive_extract(obj: Any, key: str, val: Any) -> Generator:
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)):
+                yield from recursive_extract(v, key, val)
+            elif k == key and v == val:
+                yield obj
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from recursive_extract(item, key, val)
+
+
+def recursive_extract_item_by_label(obj: Any, label: str) -> Generator:
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k == label:
+                yield v
+            yield from recursive_extract_item_by_label(v, label)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from recursive_extract_item_by_label(v, label)
+
+
+def recursive_find_component_by_type_and_index(type_name: str, index: int, component: Any, count: int) -> Any:
+    is_dict = isinstance(component, dict)
+    if is_dict:
+        if '#t' in component and component.get('#t') == type_name:
+            count += 1
+            if count == index:
+                return component
+    if is_dict or isinstance(component, list):
+        component_items = component.values() if is_dict else component
+        for inner_component in component_items:
+            if isinstance(inner_component, (dict, list)):
+                result = recursive_find_component_by_type_and_index(type_name, index, inner_component, count)
+                if isinstance(result, dict):
+                    return result
+                else:
+                    count = result
+    return count
+
+
+def deep_tree(depth: int) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {"#t": "TextField", "label": "leaf"}
+    for level in range(depth):
+        tree = {"#t": "ColumnLayout", "contents": [tree, {"#t": "TextField", "label": f"level {level}"}]}
+    return tree
+
+
+def main() -> None:
+    trees: List[Any] = [(fixture, json.loads(read_mock_file(fixture))) for fixture in FIXTURES]
+    # Deep enough to show the cost of nested generator frames, while staying under the default recursion limit
+    trees.append(("deep tree (depth 400)", deep_tree(400)))
+
+    for name, tree in trees:
+        compare(f"extract '#t' == 'TextField' on {name}", {
+            "recursive": lambda: list(recursive_extract(tree, "#t", "TextField")),
+            "iterative": lambda: list(extract(tree, "#t", "TextField")),
+        })
+        compare(f"first match of '#t' == 'TextField' on {name}", {
+            "recursive": lambda: next(recursive_extract(tree, "#t", "TextField"), None),
+            "iterative": lambda: next(extract(tree, "#t", "TextField"), None),
+        }, number=200)
+        compare(f"extract_item_by_label 'label' on {name}", {
+            "recursive": lambda: list(recursive_extract_item_by_label(tree, "label")),
+            "iterative": lambda: list(extract_item_by_label(tree, "label")),
+        })
+        compare(f"find 2nd 'TextField' on {name}", {
+            "recursive": lambda: recursive_find_component_by_type_and_index("TextField", 2, tree, 0),
+            "iterative": lambda: _find_component_by_type_and_index("TextField", 2, tree, 0),
+        }, number=200)
+        compare(f"count all 'TextField' on {name}", {
+            "recursive": lambda: recursive_find_component_by_type_and_index("TextField", -1, tree, 0),
+            "iterative": lambda: _find_component_by_type_and_index("TextField", -1, tree, 0),
+        })
+
+
+if __name__ == "__main__":
+    main()
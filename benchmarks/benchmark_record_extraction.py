@@ -0,0 +1,59 @@
+"""
+Compares the single pass record and grid extraction against the previous approach of one tree walk per
+searched key/value pair, on the mock fixtures used by the tests.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_record_extraction
+"""
+import json
+from typing import Any, Dict, Tuple
+
+from appian_locust._grid_interactor import GridInteractor
+from appian_locust.helper import extract_values
+from appian_locust.records_helper import get_all_records_from_json
+from tests.mock_reader import read_mock_file
+
+from ._timing import compare
+
+
+def multi_walk_get_all_records_from_json(json_response: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    # Previous implementation, walking the tree once per extract_values call
+    records = {}
+    is_grid = any([len(extract_values(json_response, "testLabel", "recordGrid")) != 0,
+                   len(extract_values(json_response, "testLabel", "recordGridInstances")) != 0])
+    if is_grid:
+        for record_item in extract_values(json_response, "#t", "RecordLink"):
+            records[record_item["label"] + "::" + record_item["_recordRef"]] = record_item
+    else:
+        for current_item in extract_values(json_response, "#t", "LinkedItem"):
+            record_link_raw = extract_values(current_item, "#t", "RecordLink")
+            if len(record_link_raw) > 0:
+                label = extract_values(current_item["values"], "#t", "string")[0]["#v"]
+                records[label + "::" + record_link_raw[0]["_recordRef"]] = record_link_raw[0]
+    return records, 0
+
+
+def multi_walk_find_grid_by_index(index: int, form: Dict[str, Any]) -> Dict[str, Any]:
+    # Previous implementation, collecting every grid before indexing
+    return extract_values(form, '#t', "GridField")[index]
+
+
+def main() -> None:
+    for fixture in ["records_response.json", "sites_record_recordType_resp.json"]:
+        records_json = json.loads(read_mock_file(fixture))
+        compare(f"get_all_records_from_json on {fixture}", {
+            "one walk per key/value pair": lambda: multi_walk_get_all_records_from_json(records_json),
+            "single pass visitor": lambda: get_all_records_from_json(records_json),
+        })
+
+    grid_form = json.loads(read_mock_file("report_with_rep_sales_grid.json"))
+    grid_interactor = GridInteractor()
+    compare("find_grid_by_index on report_with_rep_sales_grid.json", {
+        "collect all grids": lambda: multi_walk_find_grid_by_index(0, grid_form),
+        "single pass visitor with early exit": lambda: grid_interactor.find_grid_by_index(0, grid_form),
+    }, number=200)
+
+
+if __name__ == "__main__":
+    main()
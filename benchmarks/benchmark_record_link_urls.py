@@ -0,0 +1,58 @@
+"""
+Compares building record link URLs with a route worked out once per form URL against the previous approach of
+classifying the form URL with substring checks and uncompiled regexes on every click, for every URL shape used
+by the tests.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_record_link_urls
+"""
+from re import match, search
+from typing import Any, Dict
+
+from appian_locust.records_helper import get_record_link_route
+
+from ._timing import compare
+
+URLS = {
+    "tempo": "/suite/tempo/reports/view/oxy4ed",
+    "site record": "/suite/sites/records/page/db/record/some-record-ref/view/summary",
+    "site page": "/suite/sites/textcolumns/page/500",
+    "site report": "/suite/rest/a/sites/latest/my-site/pages/my_page/report",
+    "site record view": "/suite/rest/a/record/latest/ref/actions",
+}
+COMPONENT = {"_recordRef": "lIBHer_bdD8Emw8hLPETeiApJ24AA5ZJilzpBmewf--PdHDSUx022ZVdk6bhtcs5w_3twr_z1drDBwn8DKfhPp90o",
+             "dashboard": "summary", "siteUrlStub": "my-site", "pageUrlStub": "my-page"}
+
+
+def per_click_record_link_url(get_url: str, component: Dict[str, Any]) -> str:
+    # Previous implementation, classifying the URL on every click
+    record_link_url_suffix = component["_recordRef"] + f"/view/{component['dashboard']}"
+    if "tempo" in get_url:
+        return "/suite/tempo/records/item/" + record_link_url_suffix
+    elif "sites" in get_url and "/record/" in get_url:
+        parse_pattern = "/record/"
+        return get_url[:get_url.index(parse_pattern) + len(parse_pattern)] + record_link_url_suffix
+    elif match(r'.*\/page\/\w+$', get_url):
+        return get_url + "/record/" + record_link_url_suffix
+    elif "sites" in get_url and "/report" in get_url and "/pages/" in get_url:
+        page_name = search(r'(?<=\/pages\/)\w+', get_url).group()  # type: ignore
+        url_prefix_index = get_url.index(page_name + "/report") + len(page_name)
+        return get_url[:url_prefix_index].replace("/pages/", "/page/") + "/record/" + record_link_url_suffix
+    elif "record" in get_url:
+        return f"/suite/rest/a/sites/latest/{component['siteUrlStub']}/page/{component['pageUrlStub']}/record/{record_link_url_suffix}"
+    raise Exception("Unexpected record link URL")
+
+
+def main() -> None:
+    for shape, url in URLS.items():
+        route = get_record_link_route(url)
+        assert route.build_url(COMPONENT["_recordRef"], COMPONENT["dashboard"], COMPONENT) == per_click_record_link_url(url, COMPONENT)
+        compare(f"record link URL on a {shape} form", {
+            "classify on every click": lambda: per_click_record_link_url(url, COMPONENT),
+            "route parsed once per form URL": lambda: route.build_url(COMPONENT["_recordRef"], COMPONENT["dashboard"], COMPONENT),
+        }, number=20000)
+
+
+if __name__ == "__main__":
+    main()
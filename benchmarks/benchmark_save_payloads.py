@@ -0,0 +1,41 @@
+"""
+Compares building save requests as nested dicts serialized with ``json.dumps``, which is how every interaction
+built them before, with rendering the precompiled templates of ``_SaveRequestBuilder.build_json``,
+for a text field and for a paging grid from the mock fixtures. Templates are only used for the components
+shared by the forms, so the forms are shared first.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.benchmark_save_payloads
+"""
+import json
+
+from appian_locust._form_templates import set_form_template_cache, share_form_template
+from appian_locust._save_request_builder import save_builder
+from appian_locust.helper import find_component_by_attribute_in_dict
+from tests.mock_reader import read_mock_file
+
+from ._timing import compare
+
+
+def main() -> None:
+    set_form_template_cache()
+    text_form = share_form_template(json.loads(read_mock_file("form_content_response.json")))
+    text_field = find_component_by_attribute_in_dict("label", "Title", text_form)
+    grid_form = share_form_template(json.loads(read_mock_file("report_with_rep_sales_grid.json")))
+    grid = find_component_by_attribute_in_dict("#t", "GridField", grid_form)
+
+    cases = [
+        ("text field", text_field, text_form, {"#t": "Text", "#v": "Some text"}),
+        ("paging grid", grid, grid_form, {"#t": "PagingInfo", "startIndex": 21, "batchSize": 20}),
+    ]
+    for name, component, form, value in cases:
+        builder = save_builder().component(component).context(form["context"]).uuid(form["uuid"]).value(value)
+        compare(f"save request for a {name} ({len(json.dumps(component))} bytes of component)", {
+            "dict + json.dumps": lambda: json.dumps(builder.build()).encode(),
+            "template": lambda: builder.build_json(),
+        }, number=2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/x-rst",
     url="https://gitlab.com/appian-oss/appian-locust",
-    packages=find_packages(exclude=["contrib",
+    packages=find_packages(exclude=["benchmarks",
+                                    "benchmarks.*",
+                                    "contrib",
                                     "docs",
                                     "tasks",
                                     "tests",
@@ -2,9 +2,13 @@ from locust import TaskSet, Locust
 from .mock_client import CustomLocust
 from .mock_reader import read_mock_file
 from appian_locust import AppianTaskSet, SailUiForm
+from appian_locust._form_templates import set_form_template_cache
+from appian_locust._sampling import SequentialAccess
+from appian_locust.helper import find_component_by_attribute_in_dict
 from appian_locust.uiform import (ComponentNotFoundException,
                                   ChoiceNotFoundException, InvalidComponentException)
 
+import json
 import os
 import unittest
 from unittest.mock import patch, MagicMock
@@ -86,6 +90,18 @@ class TestActions(unittest.TestCase):
         action = self.task_set.appian.actions.visit("Create a Case", False)
         self.assertIsInstance(action, dict)
 
+    def test_actions_visit_without_name(self) -> None:
+        actions = self.task_set.appian.actions
+        actions.set_access_distribution(SequentialAccess())
+        names = [name for name in actions.get_all() if not name.startswith("ERROR::")]
+        self.assertEqual(names[:3], [actions.get_random_action_name() for _ in range(3)])
+
+        actions.set_access_distribution(SequentialAccess())
+        form_href = actions.get_action(names[0], True)['formHref']
+        self.custom_locust.set_response(form_href, 200, "{}")
+        self.assertIsInstance(actions.visit(), dict)
+        self.assertIn(form_href, [request['path'] for request in self.custom_locust.get_request_list()])
+
     def test_actions_start(self) -> None:
         self.setup_action_response_no_ui()
         self.task_set.appian.actions.start_action(
@@ -112,6 +128,26 @@ class TestActions(unittest.TestCase):
         resp = latest_form.get_response()
         self.assertEqual("12345", resp['context'])
 
+    def test_actions_forms_share_templates(self) -> None:
+        self.setup_action_response_with_ui()
+        set_form_template_cache()
+        try:
+            first_form = self.task_set.appian.actions.visit_and_get_form("Create a Case", False)
+            second_form = self.task_set.appian.actions.visit_and_get_form("Create a Case", False)
+        finally:
+            set_form_template_cache(None)
+        self.assertIsNot(first_form.state, second_form.state)
+        self.assertIs(first_form.state["ui"], second_form.state["ui"])
+
+        # Only the first form gets the new value of the field, the rest of the form is still shared
+        title = {"_cId": "79681e360ec024e38605e40b38c01445", "label": "Title", "value": "Filled", "#t": "TextField"}
+        self.custom_locust.set_response('/suite/rest/a/model/latest/228/form', 200, json.dumps(
+            {"context": "12345", "ui": {"#t": "UiComponentsDelta", "modifiedComponents": [title]}}))
+        first_form.fill_text_field('Title', "Filled")
+        self.assertEqual("Filled", find_component_by_attribute_in_dict("label", "Title", first_form.state)["value"])
+        self.assertEqual("", find_component_by_attribute_in_dict("label", "Title", second_form.state)["value"])
+        self.assertIs(first_form.state["ui"]["contents"][0]["buttons"], second_form.state["ui"]["contents"][0]["buttons"])
+
     def test_actions_form_example_activity_chained(self) -> None:
         action = self.task_set.appian.actions.get_action("Create a Case", False)
         resp_json = read_mock_file("form_content_response.json")
@@ -0,0 +1,101 @@
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from appian_locust._base import _Base
+from appian_locust._polling import is_polling, poll_until
+from appian_locust.helper import ENV
+
+
+class CountingCatalog(_Base):
+    def __init__(self, items: Dict[str, Any]) -> None:
+        self.items = items
+        self.get_all_calls = 0
+
+    def get_all(self, search_string: str = None) -> Dict[str, Any]:
+        self.get_all_calls += 1
+        return self.items
+
+
+class TestBase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.catalog = CountingCatalog({"First Item": 1})
+
+    def test_get_refreshes_on_miss(self) -> None:
+        self.assertEqual(("First Item", 1), self.catalog.get({}, "First Item"))
+        self.assertEqual(1, self.catalog.get_all_calls)
+        self.assertEqual(1, self.catalog.forced_refreshes)
+
+    def test_get_remembers_missed_lookups(self) -> None:
+        with patch("appian_locust._base.time.monotonic", return_value=100.0):
+            self.assertEqual((None, None), self.catalog.get({}, "Missing Item"))
+        with patch("appian_locust._base.time.monotonic", return_value=120.0):
+            self.assertEqual((None, None), self.catalog.get({}, "Missing Item"))
+            self.assertEqual(1, self.catalog.get_all_calls)
+            self.assertEqual(1, self.catalog.skipped_refreshes)
+            # The missed lookup is only remembered for that name
+            self.assertEqual(("First Item", 1), self.catalog.get({}, "First Item"))
+            self.assertEqual(2, self.catalog.get_all_calls)
+        with patch("appian_locust._base.time.monotonic", return_value=131.0):
+            self.catalog.items["Missing Item"] = 2
+            self.assertEqual(("Missing Item", 2), self.catalog.get({}, "Missing Item"))
+        self.assertEqual(3, self.catalog.forced_refreshes)
+
+    def test_get_limits_refresh_rate(self) -> None:
+        with patch("appian_locust._base.time.monotonic", return_value=100.0):
+            self.catalog.get({}, "First Item")
+            self.assertEqual((None, None), self.catalog.get({}, "Other Item"))
+        self.assertEqual(1, self.catalog.get_all_calls)
+
+        # Refreshes for another search string are not limited
+        self.catalog.get({}, "Other Item", search_string="Other")
+        self.assertEqual(2, self.catalog.get_all_calls)
+
+    def test_footprint(self) -> None:
+        empty_footprint = self.catalog.footprint()
+        self.catalog.items.update({f"Item {index}": index for index in range(100)})
+        self.assertGreater(self.catalog.footprint(), empty_footprint)
+
+    def test_get_reports_refreshes(self) -> None:
+        fired: List[Any] = []
+
+        def listener(**kwargs: Any) -> None:
+            fired.append(kwargs)
+        ENV.events.request.add_listener(listener)
+        try:
+            self.catalog.get({}, "First Item")
+        finally:
+            ENV.events.request.remove_listener(listener)
+
+        self.assertEqual(1, len(fired))
+        self.assertEqual("CATALOG_REFRESH", fired[0]["request_type"])
+        self.assertEqual("CountingCatalog.Refresh", fired[0]["name"])
+
+    def test_get_retries_during_a_poll_always_refresh(self) -> None:
+        self.assertEqual((None, None), self.catalog.get({}, "New Item"))
+        self.catalog.items["New Item"] = 2
+        # Outside of a poll the missed lookup is remembered
+        self.assertEqual((None, None), self.catalog.get({}, "New Item"))
+
+        polled: List[bool] = []
+
+        def check() -> Any:
+            polled.append(is_polling())
+            return self.catalog.get({}, "New Item")[1]
+        with patch("appian_locust._polling.gevent.sleep"):
+            self.assertEqual(2, poll_until(check, "New Item.Visible"))
+        self.assertEqual([True], polled)
+        self.assertFalse(is_polling())
+        self.assertEqual(2, self.catalog.get_all_calls)
+
+    def test_get_negative_cache_can_be_disabled(self) -> None:
+        self.catalog.negative_lookup_ttl = 0
+        self.catalog.min_refresh_interval = 0
+        self.catalog.get({}, "Missing Item")
+        self.catalog.get({}, "Missing Item")
+        self.assertEqual(2, self.catalog.get_all_calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import tracemalloc
+import unittest
+from typing import Any, Callable
+
+from appian_locust._catalog import ActionEntry, NewsEntry, RecordEntry, RecordTypeEntry
+from appian_locust.records_helper import get_all_records_from_json
+
+from .mock_reader import read_mock_file, read_mock_file_as_dict
+
+
+def _retained_bytes(build: Callable[[], Any]) -> int:
+    # Warm up first so one-off allocations (interned strings, caches) are not counted
+    build()
+    tracemalloc.start()
+    try:
+        kept = build()  # noqa: F841 keep the result alive while measuring
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+class TestCatalog(unittest.TestCase):
+    actions = read_mock_file("actions_response.json")
+    news = read_mock_file("news_response.json")
+
+    def test_action_entry_keeps_only_used_fields(self) -> None:
+        raw_action = json.loads(self.actions)[0]["actions"][0]
+        entry = ActionEntry(raw_action)
+        self.assertEqual(raw_action["formHref"], entry["formHref"])
+        self.assertEqual(raw_action["displayLabel"], entry["displayLabel"])
+        self.assertEqual(["displayLabel", "opaqueId", "formHref", "initiateActionHref"], list(entry))
+        self.assertIsNone(entry.full_json)
+        with self.assertRaises(KeyError):
+            entry["processModelId"]
+
+    def test_entry_keep_full_json(self) -> None:
+        raw_action = json.loads(self.actions)[0]["actions"][0]
+        entry = ActionEntry(raw_action, keep_full_json=True)
+        self.assertEqual(raw_action["processModelId"], entry["processModelId"])
+        self.assertEqual(raw_action, dict(entry))
+        self.assertIs(raw_action, entry.full_json)
+
+    def test_entry_is_read_only(self) -> None:
+        entry = RecordEntry({"_recordRef": "abc", "label": "a label"})
+        with self.assertRaises(TypeError):
+            entry["label"] = "other"  # type: ignore
+        with self.assertRaises(AttributeError):
+            entry.label = "other"  # type: ignore
+
+    def test_entry_missing_fields(self) -> None:
+        entry = RecordEntry({"_recordRef": "abc", "label": "a label"})
+        self.assertEqual({"_recordRef": "abc", "label": "a label"}, entry)
+        self.assertIsNone(entry.get("dashboard"))
+        self.assertEqual(2, len(entry))
+
+    def test_record_type_entry_url_stub(self) -> None:
+        record_types = read_mock_file_as_dict("record_types_response.json")
+        entry = RecordTypeEntry(record_types["ui"]["contents"][0]["feedItems"][0])
+        self.assertEqual({"title": "Commits", "urlstub": "commit"}, entry)
+
+    def test_news_entry_links(self) -> None:
+        raw_entry = json.loads(self.news)["feed"]["entries"][0]
+        entry = NewsEntry(raw_entry)
+        self.assertEqual([(link["rel"], link["href"]) for link in raw_entry["links"]
+                          if link["rel"] in ("related-records-properties", "share", "edit")],
+                         [(link["rel"], link["href"]) for link in entry["links"]])
+
+    def test_compact_records_use_less_memory(self) -> None:
+        records = read_mock_file("records_response.json")
+
+        def build_full() -> Any:
+            return get_all_records_from_json(json.loads(records), keep_full_json=True)
+
+        def build_compact() -> Any:
+            return get_all_records_from_json(json.loads(records))
+
+        self.assertLess(_retained_bytes(build_compact), _retained_bytes(build_full))
+
+    def test_compact_news_use_less_memory(self) -> None:
+        def build_full() -> Any:
+            return [entry for entry in json.loads(self.news)["feed"]["entries"]]
+
+        def build_compact() -> Any:
+            return [NewsEntry(entry) for entry in json.loads(self.news)["feed"]["entries"]]
+
+        self.assertLess(_retained_bytes(build_compact) * 4, _retained_bytes(build_full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import unittest
+
+from appian_locust._component_selector import compile_selector
+from appian_locust.exceptions import InvalidSelectorException
+from appian_locust.helper import extract_values
+
+from .mock_reader import read_mock_file
+
+
+class TestComponentSelector(unittest.TestCase):
+    grid_form = json.loads(read_mock_file("report_with_rep_sales_grid.json"))
+    grid_label = 'Top Sales Reps by Total Sales'
+
+    def test_select_by_type(self) -> None:
+        record_links = compile_selector('RecordLink').select(self.grid_form)
+        self.assertEqual(extract_values(self.grid_form, '#t', 'RecordLink'), record_links)
+
+    def test_select_nested_with_nth(self) -> None:
+        record_links = extract_values(self.grid_form, '#t', 'RecordLink')
+        selector = compile_selector(f'GridField[label="{self.grid_label}"] > RecordLink:nth(3)')
+        self.assertEqual([record_links[2]], selector.select(self.grid_form))
+        self.assertIs(record_links[2], selector.first(self.grid_form))
+
+    def test_select_nested_no_match(self) -> None:
+        self.assertEqual([], compile_selector('GridField[label="Orders"] > RecordLink').select(self.grid_form))
+        self.assertIsNone(compile_selector('RecordLink:nth(11)').first(self.grid_form))
+
+    def test_select_nth_on_ancestor(self) -> None:
+        columns = compile_selector('GridField > GridTextColumn').select(self.grid_form)
+        self.assertEqual(2, len(columns))
+        self.assertEqual(['Total'], [column['label'] for column in compile_selector('GridTextColumn:nth(2)').select(self.grid_form)])
+        self.assertEqual([], compile_selector('GridTextColumn:nth(2) > RecordLink').select(self.grid_form))
+        self.assertEqual(10, len(compile_selector('GridTextColumn:nth(1) > RecordLink').select(self.grid_form)))
+
+    def test_nested_ancestors_matching_the_same_step(self) -> None:
+        first = {"#t": "TextField", "label": "a"}
+        second = {"#t": "TextField", "label": "b"}
+        tree = {"#t": "SectionLayout", "contents": [{"#t": "SectionLayout", "contents": [first, second]}]}
+
+        self.assertEqual([first, second], compile_selector('SectionLayout > TextField').select(tree))
+        self.assertEqual([second], compile_selector('SectionLayout > TextField:nth(2)').select(tree))
+        self.assertIs(second, compile_selector('SectionLayout > TextField:nth(2)').first(tree))
+        inner = tree["contents"][0]
+        self.assertEqual([inner], compile_selector('SectionLayout > SectionLayout').select(tree))
+
+    def test_attribute_operators(self) -> None:
+        def labels(selector: str) -> list:
+            return [column['label'] for column in compile_selector(selector).select(self.grid_form)]
+        self.assertEqual(['Account Owner'], labels('GridTextColumn[field="AccountOwner"]'))
+        self.assertEqual(['Total'], labels("GridTextColumn[field!='AccountOwner']"))
+        self.assertEqual(['Account Owner'], labels('GridTextColumn[label^=Account]'))
+        self.assertEqual(['Account Owner'], labels('GridTextColumn[label$=Owner]'))
+        self.assertEqual(['Account Owner', 'Total'], labels('*[field][label*=o]'))
+        self.assertEqual(['Total'], labels('GridTextColumn[truncateText=false][alignment=RIGHT]'))
+
+    def test_nested_attribute_and_namespaced_type(self) -> None:
+        tree = {"#t": "{http://www.appian.com/ae/types/2009}CustomLink", "value": {"#t": "TempoRecordTypeLink", "urlstub": "commit"}}
+        self.assertEqual([tree], compile_selector('CustomLink[value.urlstub="commit"]').select(tree))
+        self.assertEqual([], compile_selector('Link').select(tree))
+
+    def test_compiled_selectors_are_cached(self) -> None:
+        self.assertIs(compile_selector('GridField > RecordLink'), compile_selector('GridField > RecordLink'))
+
+    def test_invalid_selectors(self) -> None:
+        for selector in ['', 'GridField >', 'GridField RecordLink', '[label="Orders"', 'RecordLink:nth(0)', 'RecordLink:first']:
+            with self.assertRaises(InvalidSelectorException, msg=selector):
+                compile_selector(selector)
+
+
+if __name__ == '__main__':
+    unittest.main()
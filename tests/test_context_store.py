@@ -0,0 +1,30 @@
+import gc
+import unittest
+
+from appian_locust._context_store import _INTERNED_CONTEXTS, compress_context
+
+
+class TestContextStore(unittest.TestCase):
+
+    context = {"type": "stateless", "state": ["component"] * 1000}
+
+    def test_compress_context(self) -> None:
+        compressed = compress_context(self.context)
+
+        self.assertEqual(self.context, compressed.get())
+        self.assertIsNot(compressed.get(), compressed.get())
+        self.assertLess(compressed.compressed_size, compressed.size)
+
+    def test_identical_contexts_are_shared(self) -> None:
+        compressed = compress_context(self.context)
+        self.assertIs(compressed, compress_context(dict(self.context)))
+        self.assertIsNot(compressed, compress_context({"type": "stateless"}))
+
+        count = len(_INTERNED_CONTEXTS)
+        del compressed
+        gc.collect()
+        self.assertEqual(count - 1, len(_INTERNED_CONTEXTS))
+
+
+if __name__ == '__main__':
+    unittest.main()
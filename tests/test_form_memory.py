@@ -0,0 +1,112 @@
+import gc
+import sys
+import unittest
+from typing import Any, Dict, List
+
+from appian_locust._form_memory import FormStateBudget, SpilledState, estimate_size
+from appian_locust._locust_error_handler import ENV
+
+
+class FakeForm:
+    """
+    Holds a state the way ``SailUiForm`` does, without an interactor
+    """
+
+    def __init__(self, budget: FormStateBudget, state: Dict[str, Any]) -> None:
+        self.budget = budget
+        self.spilled_state: Any = None
+        self._state: Any = state
+        budget.update(self, state)
+
+    def _spill_state(self) -> None:
+        self.spilled_state = SpilledState(self._state)
+        self._state = None
+
+    def get_state(self) -> Dict[str, Any]:
+        if self._state is None:
+            self._state = self.budget.rehydrate(self, self.spilled_state.load)
+        else:
+            self.budget.touch(self)
+        return self._state
+
+
+class TestFormMemory(unittest.TestCase):
+
+    state = {"ui": {"#t": "FormLayout", "contents": ["component"] * 20}}
+    # Length of the state serialized to compact JSON
+    state_size = 279
+
+    def test_spilled_state(self) -> None:
+        spilled = SpilledState(self.state)
+
+        self.assertEqual(self.state_size, spilled.size)
+        self.assertLess(spilled.compressed_size, spilled.size)
+        self.assertEqual(self.state, spilled.load())
+
+    def test_rehydrated_state_is_interned(self) -> None:
+        loaded = SpilledState({"#t": "".join(["Text", "Field"]), "label": "Title"}).load()
+
+        self.assertIs(sys.intern("TextField"), loaded["#t"])
+        self.assertTrue(all(key is sys.intern(key) for key in loaded))
+
+    def test_least_recently_used_form_is_spilled(self) -> None:
+        budget = FormStateBudget(max_bytes=self.state_size * 2)
+        first = FakeForm(budget, dict(self.state))
+        second = FakeForm(budget, dict(self.state))
+        self.assertEqual(0, budget.spills)
+
+        first.get_state()
+        third = FakeForm(budget, dict(self.state))
+
+        self.assertIsNone(second._state)
+        self.assertIsNotNone(first._state)
+        self.assertIsNotNone(third._state)
+        self.assertEqual({"forms_in_memory": 2, "bytes_in_memory": self.state_size * 2, "spills": 1, "rehydrations": 0},
+                         budget.get_stats())
+
+        self.assertEqual(self.state, second.get_state())
+        self.assertIsNone(first._state)
+        self.assertEqual(1, budget.rehydrations)
+        self.assertEqual(2, budget.spills)
+
+    def test_spills_and_rehydrations_are_reported(self) -> None:
+        requests: List[Dict[str, Any]] = []
+
+        def record(**kwargs: Any) -> None:
+            requests.append(kwargs)
+        ENV.events.request.add_listener(record)
+        try:
+            budget = FormStateBudget(max_bytes=self.state_size)
+            first = FakeForm(budget, dict(self.state))
+            second = FakeForm(budget, dict(self.state))
+            first.get_state()
+            self.assertIsNone(second._state)
+        finally:
+            ENV.events.request.remove_listener(record)
+
+        self.assertEqual(["SailUiForm.Spill", "SailUiForm.Spill", "SailUiForm.Rehydrate"], [request["name"] for request in requests])
+        self.assertTrue(all(request["request_type"] == "FORM_MEMORY" for request in requests))
+        self.assertEqual(self.state_size, requests[-1]["response_length"])
+
+    def test_forms_no_longer_used_are_released(self) -> None:
+        budget = FormStateBudget(max_bytes=self.state_size * 10)
+        form = FakeForm(budget, dict(self.state))
+        self.assertEqual(self.state_size, budget.bytes_in_memory)
+
+        del form
+        gc.collect()
+        self.assertEqual(0, len(budget))
+        self.assertEqual(0, budget.bytes_in_memory)
+
+    def test_estimate_size(self) -> None:
+        shared = ["component"] * 100
+        single = estimate_size({"a": shared})
+
+        self.assertGreater(single, estimate_size(shared))
+        # Shared objects are counted once
+        self.assertLess(estimate_size({"a": shared, "b": shared}), single * 2)
+        self.assertGreater(estimate_size(SpilledState(self.state)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
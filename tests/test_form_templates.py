@@ -0,0 +1,54 @@
+import json
+import unittest
+
+from appian_locust._form_templates import FormTemplateCache
+
+from .mock_reader import read_mock_file
+
+
+class TestFormTemplates(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.document = read_mock_file("form_content_response.json")
+        self.cache = FormTemplateCache(max_nodes=100000)
+
+    def test_identical_forms_are_shared(self) -> None:
+        first = self.cache.share(json.loads(self.document))
+        second_state = json.loads(self.document)
+        second_state["uuid"] = "another uuid"
+        second = self.cache.share(second_state)
+
+        self.assertEqual(json.loads(self.document), first)
+        self.assertIs(first["ui"], second["ui"])
+        self.assertIsNot(first["context"], second["context"])
+        self.assertEqual("another uuid", second["uuid"])
+        self.assertGreater(self.cache.shared_nodes, 0)
+
+    def test_identical_subtrees_are_shared(self) -> None:
+        state = self.cache.share({"ui": {"contents": [{"#t": "TextField", "value": 1}, {"#t": "TextField", "value": 1}]}})
+        contents = state["ui"]["contents"]
+        self.assertIs(contents[0], contents[1])
+
+    def test_values_of_different_types_are_not_shared(self) -> None:
+        state = self.cache.share({"ui": [{"value": 1}, {"value": True}, {"value": 1.0}]})
+        self.assertEqual([int, bool, float], [type(component["value"]) for component in state["ui"]])
+
+    def test_cache_is_bounded(self) -> None:
+        cache = FormTemplateCache(max_nodes=1)
+        first = cache.share({"ui": {"contents": [{"#t": "TextField"}]}})
+        second = cache.share({"ui": {"contents": [{"#t": "TextField"}]}})
+
+        self.assertEqual(1, cache.cached_nodes)
+        self.assertIs(first["ui"]["contents"][0], second["ui"]["contents"][0])
+        self.assertIsNot(first["ui"], second["ui"])
+
+    def test_disabled_cache_leaves_forms_alone(self) -> None:
+        cache = FormTemplateCache()
+        state = json.loads(self.document)
+        ui = state["ui"]
+        self.assertIs(ui, cache.share(state)["ui"])
+        self.assertEqual(0, cache.cached_nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,6 +31,10 @@ class TestGridInteractor(unittest.TestCase):
         with self.assertRaisesRegex(Exception, 'Index 5 out of range'):
             grid = self.grid_interactor.find_grid_by_index(5, self.grid_form)
 
+    def test_find_grid_by_index_just_out_of_range(self) -> None:
+        with self.assertRaisesRegex(Exception, 'Index 1 out of range, only found 1 grid'):
+            grid = self.grid_interactor.find_grid_by_index(1, self.grid_form)
+
     def test_find_grid_no_grids_found(self) -> None:
         with self.assertRaisesRegex(Exception, 'No paging grids found in form'):
             grid = self.grid_interactor.find_grid_by_index(5, {})
@@ -97,6 +101,29 @@ class TestGridInteractor(unittest.TestCase):
         self.assertEqual(sort_save['sort'][0]['field'], 'AccountOwner')
         self.assertEqual(sort_save['sort'][0]['ascending'], False)
 
+    def test_get_columns(self) -> None:
+        form_label = 'Top Sales Reps by Total Sales'
+        grid = self.grid_interactor.find_grid_by_label(form_label, self.grid_form)
+        columns = self.grid_interactor.get_columns(grid)
+
+        self.assertEqual(['Account Owner', 'Total'], list(columns))
+        self.assertEqual(10, len(columns['Total']))
+        self.assertEqual('$18,934.08', columns['Total'][0])
+        self.assertEqual('Sandra Taylor', columns['Account Owner'][0])
+
+    def test_get_columns_typed_values_and_unnamed_columns(self) -> None:
+        grid = {
+            "#t": "GridField",
+            "columns": [
+                {"#t": "GridImageColumn", "label": "", "field": "", "data": [{"#t": "DocumentImage", "source": "a"}]},
+                {"#t": "GridFieldColumn", "label": "Type", "data": [{"#v": "Manual", "#t": "string"}]},
+                {"#t": "GridFieldColumn", "label": "Type", "field": "type"}
+            ]
+        }
+        columns = self.grid_interactor.get_columns(grid)
+
+        self.assertEqual({"0": [{"#t": "DocumentImage", "source": "a"}], "Type": ["Manual"], "Type_2": []}, columns)
+
 
 if __name__ == '__main__':
     unittest.main()
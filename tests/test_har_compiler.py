@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from appian_locust._har_compiler import compile_har, main
+from appian_locust.helper import find_component_by_attribute_in_dict
+
+from .mock_reader import read_mock_file
+
+HOST = "https://an-appian-instance.host.net"
+CAPTURE_START = datetime(2021, 3, 4, 10, 0, 0)
+
+
+class TestHarCompiler(unittest.TestCase):
+    tasks = read_mock_file("tasks_response.json")
+    task_form = read_mock_file("date_task.json")
+    actions = read_mock_file("actions_response.json")
+    action_form = read_mock_file("form_content_response.json")
+
+    def setUp(self) -> None:
+        self.entries: List[Dict[str, Any]] = []
+
+    def _add_entry(self, at: float, method: str, path: str, response: str = "", request_body: Any = None,
+                   duration_ms: float = 100) -> None:
+        request: Dict[str, Any] = {"method": method, "url": HOST + path, "bodySize": 0}
+        if request_body is not None:
+            text = request_body if isinstance(request_body, str) else json.dumps(request_body)
+            request["postData"] = {"mimeType": "application/json", "text": text}
+            request["bodySize"] = len(text)
+        self.entries.append({
+            "startedDateTime": (CAPTURE_START + timedelta(seconds=at)).isoformat() + "Z",
+            "time": duration_ms,
+            "request": request,
+            "response": {"status": 200, "content": {"text": response}},
+        })
+
+    def _har(self) -> Dict[str, Any]:
+        return {"log": {"pages": [{"title": "Appian"}], "entries": self.entries}}
+
+    def _save(self, form: str, label: str, value: Any) -> Dict[str, Any]:
+        component = find_component_by_attribute_in_dict("label", label, json.loads(form))
+        return {"#t": "UiRequest", "context": {},
+                "updates": {"#t": "SaveRequest?list", "#v": [{"#t": "SaveRequest", "_cId": component["_cId"], "value": value}]}}
+
+    def _record_task(self) -> None:
+        self._add_entry(0, "GET", "/suite/api/feed/tempo?m=menu-tasks&t=t", self.tasks)
+        self._add_entry(2, "GET", "/suite/rest/a/task/latest/1/attributes", '{"isAutoAcceptable": true}')
+        self._add_entry(2.1, "GET", "/suite/rest/a/task/latest/1/form", self.task_form)
+        self._add_entry(5.2, "POST", "/suite/rest/a/task/latest/1/form", "{}",
+                        self._save(self.task_form, "Text", {"#t": "Text", "#v": "some text"}))
+        self._add_entry(5.4, "POST", "/suite/rest/a/task/latest/1/form", "{}",
+                        self._save(self.task_form, "Date", {"#t": "Date", "#v": "2021-03-04Z"}))
+        self._add_entry(7, "POST", "/suite/rest/a/task/latest/1/form", "{}",
+                        self._save(self.task_form, "Save Draft", None))
+
+    def test_compile_task(self) -> None:
+        self._record_task()
+        source = compile_har(self._har())
+
+        self.assertIn("class RecordedTaskSequence(AppianTaskSequence):", source)
+        expected_lines = [
+            "    def step_1_task_test_user1_task(self) -> None:",
+            "        form = self.appian.tasks.visit_and_get_form('test.user1 Task', exact_match=False)",
+            "        time.sleep(3.000)",
+            "        form = form.fill_text_field('Text', 'some text')",
+            "        form = form.fill_date_field('Date', datetime.date.fromisoformat('2021-03-04'))",
+            "        time.sleep(1.500)",
+            "        form = form.click_button('Save Draft')",
+        ]
+        lines = source.splitlines()
+        start = lines.index(expected_lines[0])
+        self.assertEqual(expected_lines, lines[start:start + len(expected_lines)])
+        # The generated locustfile is valid and imports what it uses
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, "locustfile.py", "exec"), namespace)
+        self.assertIn("RecordedTaskSequence", namespace)
+        self.assertEqual(HOST, namespace["RecordedTaskSequenceUser"].host)
+
+    def test_compile_action_with_dropdown_and_think_time_threshold(self) -> None:
+        self._add_entry(0, "GET", "/suite/api/tempo/open-a-case/available-actions?ids=%5B%5D", self.actions)
+        action = json.loads(self.actions)[0]["actions"][0]
+        self._add_entry(1, "GET", action["formHref"][len(HOST):], self.action_form)
+        self._add_entry(1.6, "POST", action["formHref"][len(HOST):], "{}",
+                        self._save(self.action_form, "Category", {"#t": "Integer", "#v": 2}))
+        source = compile_har(self._har(), class_name="MyActions", min_think_time=1)
+
+        self.assertIn("class MyActions(AppianTaskSequence):", source)
+        self.assertIn(f"        form = self.appian.actions.visit_and_get_form({action['displayLabel']!r}, exact_match=False)", source)
+        category = find_component_by_attribute_in_dict("label", "Category", json.loads(self.action_form))
+        self.assertIn(f"        form = form.select_dropdown_item('Category', {category['choices'][1]!r})", source)
+        self.assertNotIn("time.sleep", source)
+
+    def test_unrecognized_requests_are_kept_as_comments(self) -> None:
+        self._add_entry(0, "GET", "/suite/rest/a/uicontainer/latest/abc/view")
+        self._add_entry(0.1, "GET", "/suite/tempo/ui/sail-client/sites.cache.js")
+        self._add_entry(1, "POST", "/suite/rest/a/task/latest/1/form", "{}", {"updates": {"#v": [{"_cId": "abc", "value": "x"}]}})
+        source = compile_har(self._har())
+
+        self.assertIn("        # Unrecognized request: GET /suite/rest/a/uicontainer/latest/abc/view", source)
+        self.assertIn("        # Update of a component that is not on the captured form", source)
+        self.assertNotIn("cache.js", source)
+        compile(source, "locustfile.py", "exec")
+
+    def test_main_writes_locustfile(self) -> None:
+        self._record_task()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            har_path = os.path.join(temp_dir, "capture.har")
+            output_path = os.path.join(temp_dir, "locustfile.py")
+            with open(har_path, "w") as har_file:
+                json.dump(self._har(), har_file)
+
+            main([har_path, "-o", output_path])
+
+            with open(output_path) as output_file:
+                self.assertEqual(compile_har(self._har()), output_file.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
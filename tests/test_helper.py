@@ -1,9 +1,12 @@
 import json
 import time
 import unittest
-from typing import List
+from typing import Any, List
 
-from appian_locust.helper import (find_component_by_attribute_in_dict,
+from appian_locust.helper import (JsonVisitor, extract_all_by_label,
+                                  extract_values,
+                                  find_component_by_attribute_in_dict,
+                                  find_component_by_index_in_dict,
                                   find_component_by_label_and_type_dict,
                                   repeat)
 
@@ -24,6 +27,85 @@ class TestHelper(unittest.TestCase):
         # finds first component by that label
         self.assertEqual(component['#t'], 'RichTextDisplayField')
 
+    def test_walkers_handle_deep_trees(self) -> None:
+        # Given
+        tree: dict = {"#t": "TextField", "label": "leaf"}
+        for _ in range(5000):
+            tree = {"#t": "ColumnLayout", "label": "column", "contents": [tree]}
+        # When
+        leaf = find_component_by_attribute_in_dict('label', 'leaf', tree)
+        labels = extract_all_by_label(tree, 'label')
+        text_field = find_component_by_index_in_dict('TextField', 1, tree)
+        # Then
+        self.assertEqual('TextField', leaf['#t'])
+        self.assertEqual(5001, len(labels))
+        self.assertIs(leaf, text_field)
+
+    def test_walkers_order(self) -> None:
+        # Given
+        tree = {"label": "outer", "contents": [{"label": "inner"}], "#t": "Outer",
+                "footer": {"#t": "Footer", "label": "footer"}}
+        # When
+        labels = extract_all_by_label(tree, 'label')
+        components = extract_values(tree, 'label', 'outer') + extract_values(tree, '#t', 'Footer')
+        # Then
+        self.assertEqual(['outer', 'inner', 'footer'], labels)
+        self.assertEqual([tree, tree['footer']], components)
+
+    def test_walkers_prune(self) -> None:
+        # Given
+        hidden = {"#t": "TextField", "label": "Name", "hidden": True}
+        visible = {"#t": "TextField", "label": "Name"}
+        tree = {"contents": [{"#t": "SectionLayout", "hidden": True, "contents": [hidden]}, visible]}
+
+        def is_hidden(component: Any) -> bool:
+            return isinstance(component, dict) and bool(component.get("hidden"))
+        # When
+        first_match = find_component_by_attribute_in_dict('label', 'Name', tree, prune=is_hidden)
+        first_text_field = find_component_by_index_in_dict('TextField', 1, tree, prune=is_hidden)
+        # Then
+        self.assertIs(visible, first_match)
+        self.assertIs(visible, first_text_field)
+        self.assertIs(hidden, find_component_by_attribute_in_dict('label', 'Name', tree))
+        self.assertEqual(['Name'], extract_all_by_label(tree, 'label', prune=is_hidden))
+
+    def test_json_visitor_matches_extract_values(self) -> None:
+        # Given
+        visitor = JsonVisitor()
+        labels = visitor.collect('label', 'Request Pass')
+        links = visitor.collect('#t', 'StartProcessLink')
+        # When
+        visitor.visit(self.form_dict)
+        # Then
+        self.assertEqual(extract_values(self.form_dict, 'label', 'Request Pass'), labels)
+        self.assertEqual(extract_values(self.form_dict, '#t', 'StartProcessLink'), links)
+        self.assertTrue(links)
+
+    def test_json_visitor_ancestors(self) -> None:
+        # Given
+        tree = {"#t": "Outer", "contents": [{"#t": "Inner", "value": 1}]}
+        visitor = JsonVisitor()
+        found: List = []
+        visitor.on('#t', 'Inner', lambda match, ancestors: found.append((match, ancestors)))
+        # When
+        visitor.visit(tree)
+        # Then
+        self.assertEqual([(tree["contents"][0], [tree, tree["contents"]])], found)
+
+    def test_json_visitor_early_exit(self) -> None:
+        # Given
+        visitor = JsonVisitor()
+        found: List = []
+
+        def on_link(match: dict, _: list) -> bool:
+            found.append(match)
+            return True
+        visitor.on('#t', 'StartProcessLink', on_link)
+        # When
+        visitor.visit(self.form_dict)
+        # Then
+        self.assertEqual([find_component_by_label_and_type_dict('#t', 'StartProcessLink', 'StartProcessLink', self.form_dict)], found)
+
     def test_repeat_decorator(self) -> None:
         # Given
         my_list: List[int] = []
@@ -6,6 +6,8 @@ from unittest.mock import Mock
 from appian_locust import AppianClient, AppianTaskSet
 from appian_locust.helper import find_component_by_attribute_in_dict, find_component_by_index_in_dict
 from appian_locust import logger
+from appian_locust._synthetic_documents import SyntheticDocumentGenerator
+from appian_locust._upload_cache import UploadCache
 from locust import Locust, TaskSet
 
 from .mock_client import CustomLocust, SampleAppianTaskSequence
@@ -315,3 +317,62 @@ class TestInteractor(unittest.TestCase):
         self.custom_locust.set_response("", 200, "{}")
         output = self.task_set.appian.interactor.click_record_search_button("", component, {}, "my_uuid", "")
         self.assertEqual(output, dict())
+
+    def _upload_requests(self) -> list:
+        return [request for request in self.custom_locust.get_request_list()
+                if request['path'] == "/suite/api/tempo/file?validateExtension=false"]
+
+    def test_upload_document_to_server(self) -> None:
+        self.custom_locust.set_response("/suite/api/tempo/file?validateExtension=false", 200, '[{"id": 123}]')
+        file_path = os.path.join(self.dir_path, "resources", "Constant Test App.properties")
+
+        doc_id = self.task_set.appian.interactor.upload_document_to_server(file_path)
+
+        self.assertEqual(123, doc_id)
+        uploads = self._upload_requests()
+        self.assertEqual(1, len(uploads))
+        self.assertEqual("Document.Upload.Constant Test App.properties", uploads[0]['name'])
+        body = uploads[0]['data']
+        self.assertIsNone(uploads[0]['files'])
+        self.assertEqual(body.content_type, uploads[0]['headers']['Content-Type'])
+        self.assertIn(b'filename="Constant Test App.properties"', body.to_bytes())
+
+    def test_upload_document_to_server_with_cache_reuses_document_ids(self) -> None:
+        self.custom_locust.set_response("/suite/api/tempo/file?validateExtension=false", 200, '[{"id": 123}]')
+        file_path = os.path.join(self.dir_path, "resources", "Constant Test App.properties")
+        cache = UploadCache()
+        interactor = self.task_set.appian.interactor
+        interactor.enable_upload_cache(document_id_uses=2, cache=cache)
+
+        doc_ids = [interactor.upload_document_to_server(file_path) for _ in range(3)]
+
+        self.assertEqual([123, 123, 123], doc_ids)
+        # Every id is used twice, so the third use uploads again
+        uploads = self._upload_requests()
+        self.assertEqual(2, len(uploads))
+        with open(file_path, 'rb') as f:
+            self.assertIn(f.read(), uploads[0]['data'].to_bytes())
+        # The body is only encoded once for the cached file
+        self.assertIs(uploads[0]['data'], uploads[1]['data'])
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(2, cache.hits)
+
+        # Encrypted uploads don't share ids with unencrypted ones
+        interactor.upload_document_to_server(file_path, is_encrypted=True)
+        self.assertEqual(3, len(self._upload_requests()))
+
+        interactor.disable_upload_cache()
+        interactor.upload_document_to_server(file_path)
+        self.assertEqual(4, len(self._upload_requests()))
+        self.assertEqual(3, cache.hits)
+
+    def test_upload_generated_document_to_server(self) -> None:
+        self.custom_locust.set_response("/suite/api/tempo/file?validateExtension=false", 200, '[{"id": 123}]')
+        document = SyntheticDocumentGenerator(seed=1).generate(1000, "pdf", index=4)
+
+        doc_id = self.task_set.appian.interactor.upload_document_to_server(document)
+
+        self.assertEqual(123, doc_id)
+        uploads = self._upload_requests()
+        self.assertEqual("Document.Upload.synthetic_4.pdf", uploads[0]['name'])
+        self.assertIn(bytes(document.content), uploads[0]['data'].to_bytes())
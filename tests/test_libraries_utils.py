@@ -1,5 +1,6 @@
 import json
 import os
+import random
 from .mock_client import CustomLocust, SampleAppianTaskSequence
 from .mock_reader import read_mock_file
 import appian_locust.helper as helper
@@ -24,6 +25,14 @@ class TestLibraryHelper(unittest.TestCase):
         var = helper.get_random_item(testlist, exclude)
         self.assertTrue((var in testlist and var not in exclude))
 
+    def test_get_random_item_with_rng(self) -> None:
+        testlist = [{"id": i} for i in range(10)]
+        # Unhashable items can be excluded too
+        exclude = testlist[:5]
+        picks = [helper.get_random_item(testlist, exclude, rng=random.Random(42)) for _ in range(2)]
+        self.assertEqual(picks[0], picks[1])
+        self.assertNotIn(picks[0], exclude)
+
     def test_get_random_item_with_no_item_to_choose(self) -> None:
         testlist = [2]
         exclude = [2]
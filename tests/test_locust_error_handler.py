@@ -1,7 +1,8 @@
 import unittest
+from typing import Any, List
 
 import locust
-from appian_locust._locust_error_handler import log_locust_error
+from appian_locust._locust_error_handler import log_locust_error, report_custom_metric
 from appian_locust.helper import ENV
 
 
@@ -24,6 +25,24 @@ class TestLocustErrorHandler(unittest.TestCase):
         self.assertEqual('EXCEPTION: abc', error.error)
         self.assertEqual(1, error.occurrences)
 
+    def test_report_custom_metric(self) -> None:
+        fired: List[Any] = []
+
+        def listener(**kwargs: Any) -> None:
+            fired.append(kwargs)
+        ENV.events.request.add_listener(listener)
+        try:
+            # The mock client has no request event, the one of the environment is used instead
+            report_custom_metric(object(), "WORKFLOW", "Submit", 12.5)
+        finally:
+            ENV.events.request.remove_listener(listener)
+
+        self.assertEqual(1, len(fired))
+        self.assertEqual("WORKFLOW", fired[0]["request_type"])
+        self.assertEqual("Submit", fired[0]["name"])
+        self.assertEqual(12.5, fired[0]["response_time"])
+        self.assertIsNone(fired[0]["exception"])
+
 
 if __name__ == '__main__':
     unittest.main()
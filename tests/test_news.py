@@ -1,8 +1,11 @@
+from collections.abc import Mapping
 from locust import TaskSet, Locust
 from .mock_client import CustomLocust
 from .mock_reader import read_mock_file
 from appian_locust import AppianTaskSet
+import json
 import unittest
+from typing import Any, Dict, List
 
 NEWS_URI = "/suite/api/feed/tempo?t=e,x,b&m=menu-news&st=o"
 
@@ -40,7 +43,7 @@ class TestNews(unittest.TestCase):
     def test_news_get(self) -> None:
         news = self.task_set.appian.news.get_news(
             "x-1::Administrator Custom")
-        self.assertIsInstance(news, dict)
+        self.assertIsInstance(news, Mapping)
 
     def test_news_get_corrupt_news_post(self) -> None:
         corrupt_news = self.news.replace('"id": "x-3"', '"corrupt_id": "x-3"')
@@ -54,7 +57,7 @@ class TestNews(unittest.TestCase):
         self.custom_locust.set_response("/suite/api/feed/tempo?q=Admin", 200, self.news)
         action = self.task_set.appian.news.get_news(
             "x-1::Administrator Custom", True, "Admin")
-        self.assertIsInstance(action, dict)
+        self.assertIsInstance(action, Mapping)
 
     def test_news_get_missing_news(self) -> None:
         with self.assertRaisesRegex(Exception, "There is no news with name .* in the system under test.*"):
@@ -104,6 +107,92 @@ class TestNews(unittest.TestCase):
             # Then
             self.assertEqual(response, test_case['expected'])
 
+    def news_feed(self, entries: List[Dict[str, str]], newer_uri: str = None, older_uri: str = None) -> str:
+        links = [{"rel": "related", "href": "https://an-appian-instance.host.net/suite/"}]
+        if older_uri:
+            links.append({"rel": "next", "href": older_uri})
+        if newer_uri:
+            links.append({"rel": "previous", "href": newer_uri})
+        return json.dumps({"feed": {"links": links, "entries": [{**entry, "links": []} for entry in entries]}})
+
+    def news_requests(self) -> List[str]:
+        return [request["path"] for request in self.custom_locust.get_request_list() if "/suite/api/feed/tempo" in request["path"]]
+
+    def setup_paged_feed(self) -> None:
+        self.custom_locust.set_response(NEWS_URI, 200, self.news_feed(
+            [{"id": "x-10", "title": "Tenth"}, {"id": "x-9", "title": "Ninth"}],
+            newer_uri="/suite/api/feed/tempo?a=10&m=menu-news", older_uri="/suite/api/feed/tempo?b=9&m=menu-news"))
+        self.custom_locust.set_response("/suite/api/feed/tempo?a=10&m=menu-news", 200, self.news_feed(
+            [{"id": "x-11", "title": "Eleventh"}, {"id": "x-10", "title": "Tenth, edited"}],
+            newer_uri="/suite/api/feed/tempo?a=11&m=menu-news"))
+        self.custom_locust.set_response("/suite/api/feed/tempo?a=11&m=menu-news", 200, self.news_feed(
+            [], newer_uri="/suite/api/feed/tempo?a=11&m=menu-news"))
+        self.custom_locust.set_response("/suite/api/feed/tempo?b=9&m=menu-news", 200, self.news_feed(
+            [{"id": "x-8", "title": "Eighth"}]))
+
+    def test_news_get_all_refreshes_newer_entries(self) -> None:
+        self.setup_paged_feed()
+        news = self.task_set.appian.news
+        self.assertEqual(["x-10::Tenth", "x-9::Ninth"], list(news.get_all()))
+
+        all_news = news.get_all()
+
+        # Only the newer entries are requested, edited entries replace the cached ones
+        self.assertEqual(["x-11::Eleventh", "x-10::Tenth, edited", "x-9::Ninth"], list(all_news))
+        self.assertEqual([NEWS_URI, "/suite/api/feed/tempo?a=10&m=menu-news"], self.news_requests())
+        self.assertEqual(3, len(news.get_all()))
+        self.assertEqual("/suite/api/feed/tempo?a=11&m=menu-news", self.news_requests()[-1])
+
+    def test_news_get_loads_older_pages_lazily(self) -> None:
+        self.setup_paged_feed()
+        news = self.task_set.appian.news
+        news.get_all()
+        self.assertEqual("x-9", news.get_news("x-9::Ninth")["id"])
+        self.assertEqual([NEWS_URI], self.news_requests())
+
+        self.assertEqual("x-8", news.get_news("x-8::Eighth")["id"])
+
+        self.assertEqual("/suite/api/feed/tempo?b=9&m=menu-news", self.news_requests()[-1])
+        self.assertFalse(news.load_next_page())
+        with self.assertRaisesRegex(Exception, "There is no news with name"):
+            news.get_news("x-7::Seventh")
+
+    def test_news_fixture_with_absolute_continuation_links(self) -> None:
+        host = "https://an-appian-instance.host.net"
+        newer_uri = NEWS_URI + "&a=x-1"
+        older_uri = NEWS_URI + "&b=x-3"
+        first_page = json.loads(self.news)
+        first_page["feed"]["links"] = [{"href": host + "/suite/api/feed/tempo", "rel": "service.post"},
+                                       {"href": host + newer_uri, "rel": "previous"},
+                                       {"href": host + older_uri, "rel": "next"}]
+        older_page = json.loads(self.news)
+        older_entry = older_page["feed"]["entries"][0]
+        older_entry["id"] = "x-0"
+        older_page["feed"]["entries"] = [older_entry]
+        older_page["feed"]["links"] = []
+        self.custom_locust.set_response(NEWS_URI, 200, json.dumps(first_page))
+        self.custom_locust.set_response(newer_uri, 200, json.dumps({"feed": {"entries": [], "links": [{"href": host + newer_uri, "rel": "previous"}]}}))
+        self.custom_locust.set_response(older_uri, 200, json.dumps(older_page))
+        news = self.task_set.appian.news
+        news.interactor.host = host
+
+        all_news = news.get_all()
+        self.assertEqual(["x-1", "x-2", "x-3"], [key.split("::")[0] for key in all_news])
+        self.assertTrue(news.load_next_page())
+        self.assertEqual(f"x-0::{older_entry['title'].strip()}", list(news.get_all())[-1])
+        self.assertEqual([NEWS_URI, older_uri, newer_uri], self.news_requests())
+        self.assertFalse(news.load_next_page())
+
+    def test_news_search_reloads_other_feed(self) -> None:
+        self.setup_paged_feed()
+        self.custom_locust.set_response("/suite/api/feed/tempo?q=Ninth", 200, self.news_feed([{"id": "x-9", "title": "Ninth"}]))
+        news = self.task_set.appian.news
+        news.get_all()
+
+        self.assertEqual(["x-9::Ninth"], list(news.search("Ninth")))
+        self.assertEqual(["x-10::Tenth", "x-9::Ninth"], list(news.get_all()))
+        self.assertEqual([NEWS_URI, "/suite/api/feed/tempo?q=Ninth", NEWS_URI], self.news_requests())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,110 @@
+import random
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from appian_locust._pacing import (CLICKING, READING_GRID, TYPING, ArrivalRate, PacingEngine,
+                                   ThinkTime, arrival_rate)
+from appian_locust.helper import ENV
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class TestThinkTime(unittest.TestCase):
+
+    def test_think_time_is_within_bounds_plus_typing(self) -> None:
+        think_time = ThinkTime(1, 3, per_character=0.25)
+        rng = random.Random(4)
+        for _ in range(100):
+            self.assertTrue(1 <= think_time.sample(rng) <= 3)
+        self.assertEqual(3, ThinkTime(1, 1, per_character=0.25).sample(rng, 8))
+
+    def test_invalid_think_time(self) -> None:
+        with self.assertRaisesRegex(Exception, "Invalid think time between 3 and 1 seconds"):
+            ThinkTime(3, 1)
+
+
+class TestPacingEngine(unittest.TestCase):
+
+    def test_think_time_depends_on_interaction(self) -> None:
+        engine = PacingEngine({CLICKING: ThinkTime(1, 1)}, scale=0.5)
+        rng = random.Random(4)
+
+        self.assertEqual(0.5, engine.get_think_time(CLICKING, rng))
+        self.assertTrue(1.5 <= engine.get_think_time(READING_GRID, rng) <= 4)
+        self.assertEqual(0, engine.get_think_time("scrolling", rng))
+
+    def test_typing_takes_longer_for_longer_text(self) -> None:
+        engine = PacingEngine({TYPING: ThinkTime(0.5, 0.5, per_character=0.2)})
+
+        self.assertAlmostEqual(0.5, engine.get_think_time(TYPING, random.Random(), None))
+        self.assertAlmostEqual(2.5, engine.get_think_time(TYPING, random.Random(), "0123456789"))
+
+    def test_pause_sleeps_for_think_time(self) -> None:
+        engine = PacingEngine({CLICKING: ThinkTime(2, 2)})
+        with patch("appian_locust._pacing.gevent.sleep") as sleep:
+            self.assertEqual(2, engine.pause(CLICKING, random.Random()))
+            engine.pause("scrolling", random.Random())
+        sleep.assert_called_once_with(2)
+
+
+class TestArrivalRate(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        patcher = patch("appian_locust._pacing.time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.requests: List[Dict[str, Any]] = []
+        ENV.events.request.add_listener(self.record)
+        self.addCleanup(ENV.events.request.remove_listener, self.record)
+
+    def record(self, **kwargs: Any) -> None:
+        self.requests.append(kwargs)
+
+    def test_arrivals_are_evenly_spaced_across_users(self) -> None:
+        wait_time = arrival_rate(4)
+
+        self.assertEqual([0, 0.25, 0.5, 0.75], [wait_time() for _ in range(4)])
+
+    def test_slow_tasks_do_not_lower_throughput(self) -> None:
+        wait_time = ArrivalRate(2)
+        self.assertEqual(0, wait_time())
+        # The task took longer than the interval, the next arrival starts right away
+        self.clock.now += 0.8
+        self.assertEqual(0, wait_time())
+        self.assertAlmostEqual(0.2, wait_time())
+        self.assertEqual([], self.requests)
+
+    def test_arrivals_no_user_was_free_for_are_dropped(self) -> None:
+        wait_time = ArrivalRate(2, max_lateness=1)
+        wait_time()
+        self.clock.now += 3
+
+        self.assertEqual(0, wait_time())
+        self.assertEqual(3, wait_time.dropped_arrivals)
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual("PACING", self.requests[0]["request_type"])
+        self.assertEqual("Arrival.Dropped", self.requests[0]["name"])
+        self.assertEqual("3 arrivals dropped, every user was busy", str(self.requests[0]["exception"]))
+
+    def test_poisson_arrivals_keep_the_rate(self) -> None:
+        wait_time = ArrivalRate(10, poisson=True, rng=random.Random(4))
+        waits = [wait_time() for _ in range(2000)]
+
+        self.assertNotEqual(waits[1] * 2, waits[2])
+        self.assertAlmostEqual(10, len(waits) / waits[-1], delta=1)
+
+    def test_invalid_rate(self) -> None:
+        with self.assertRaisesRegex(Exception, "Invalid arrival rate of 0 per second"):
+            ArrivalRate(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
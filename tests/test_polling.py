@@ -0,0 +1,103 @@
+import random
+import unittest
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from appian_locust import _polling
+from appian_locust._polling import get_latency_estimate, poll_until
+from appian_locust.helper import ENV
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestPolling(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.requests: List[Dict[str, Any]] = []
+        patches: List[Any] = [patch("appian_locust._polling.time.monotonic", self.clock.monotonic),
+                              patch("appian_locust._polling.gevent.sleep", self.clock.sleep),
+                              patch.dict(_polling._latency_estimates, clear=True)]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ENV.events.request.add_listener(self.record)
+        self.addCleanup(ENV.events.request.remove_listener, self.record)
+
+    def record(self, **kwargs: Any) -> None:
+        self.requests.append(kwargs)
+
+    def check_after(self, seconds: float) -> Any:
+        visible_at = self.clock.now + seconds
+
+        def check() -> Optional[str]:
+            return "result" if self.clock.now >= visible_at else None
+        return check
+
+    def test_backs_off_until_result(self) -> None:
+        result = poll_until(self.check_after(5), "Order.Visible", initial_interval=1, backoff=2, jitter=0)
+
+        self.assertEqual("result", result)
+        self.assertEqual([1, 2, 4], self.clock.sleeps)
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual("POLL", self.requests[0]["request_type"])
+        self.assertEqual("Order.Visible", self.requests[0]["name"])
+        self.assertEqual(7000, self.requests[0]["response_time"])
+        self.assertIsNone(self.requests[0]["exception"])
+
+    def test_latency_is_measured_from_start(self) -> None:
+        started_at = self.clock.now
+        self.clock.now += 2
+        poll_until(self.check_after(0), "Order.Visible", started_at=started_at)
+        self.assertEqual(2000, self.requests[0]["response_time"])
+        self.assertEqual(2, get_latency_estimate("Order.Visible"))
+
+    def test_intervals_are_jittered_and_capped(self) -> None:
+        poll_until(self.check_after(60), "Order.Visible", initial_interval=4, max_interval=5, jitter=0.5, rng=random.Random(0))
+        self.assertTrue(all(1.99 <= sleep <= 7.51 for sleep in self.clock.sleeps[:-1]))
+        self.assertNotEqual(len(set(self.clock.sleeps)), 1)
+
+    def test_first_check_waits_for_estimated_latency(self) -> None:
+        poll_until(self.check_after(10), "Order.Visible", initial_interval=10, jitter=0)
+        self.clock.sleeps.clear()
+
+        poll_until(self.check_after(10), "Order.Visible", initial_interval=10, jitter=0, adaptive_first_check=True)
+        self.assertEqual([8, 10], self.clock.sleeps)
+        self.assertAlmostEqual(10 + 0.3 * (18 - 10), get_latency_estimate("Order.Visible") or 0)
+
+    def test_fast_results_are_reported_fast_after_slow_ones(self) -> None:
+        poll_until(self.check_after(10), "Order.Visible", initial_interval=10, jitter=0)
+        self.clock.sleeps.clear()
+
+        poll_until(self.check_after(0), "Order.Visible", initial_interval=10, jitter=0)
+        self.assertEqual([], self.clock.sleeps)
+        self.assertEqual(0, self.requests[-1]["response_time"])
+
+    def test_hits_after_the_adaptive_wait_do_not_update_the_estimate(self) -> None:
+        poll_until(self.check_after(10), "Order.Visible", initial_interval=10, jitter=0)
+
+        poll_until(self.check_after(1), "Order.Visible", adaptive_first_check=True)
+        self.assertEqual(8000, self.requests[-1]["response_time"])
+        self.assertEqual(10, get_latency_estimate("Order.Visible"))
+
+    def test_deadline(self) -> None:
+        with self.assertRaisesRegex(Exception, "No result for 'Order.Visible' after 3 seconds"):
+            poll_until(lambda: None, "Order.Visible", timeout=3, initial_interval=1, backoff=2, jitter=0)
+        self.assertEqual([1, 2], self.clock.sleeps)
+        self.assertEqual(3000, self.requests[0]["response_time"])
+        self.assertIsNotNone(self.requests[0]["exception"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 import json
+import random
 import unittest
+from collections.abc import Mapping
 from typing import Any
 from unittest import mock
 
 from appian_locust import AppianTaskSet, logger
+from appian_locust._sampling import SequentialAccess
 from appian_locust.uiform import SailUiForm
 from locust import Locust, TaskSet
 
@@ -102,7 +105,7 @@ class TestRecords(unittest.TestCase):
     def test_records_fetch_record_instance(self) -> None:
         record = self.task_set.appian.records.fetch_record_instance(
             "Commits", self.record_instance_name, False)
-        self.assertIsInstance(record, dict)
+        self.assertIsInstance(record, Mapping)
 
     def test_records_fetch_record_instance_no_record_type(self) -> None:
         with self.assertRaisesRegex(Exception,
@@ -117,12 +120,12 @@ class TestRecords(unittest.TestCase):
     def test_records_fetch_record_type(self) -> None:
         self.task_set.appian.records.get_all()
         output = self.task_set.appian.records.fetch_record_type("Commits")
-        self.assertIsInstance(output, dict)
+        self.assertIsInstance(output, Mapping)
 
     def test_records_fetch_record_type_recaching(self) -> None:
         self.task_set.appian.records._record_types = dict()  # Resetting the cache.
         output = self.task_set.appian.records.fetch_record_type("Commits")
-        self.assertIsInstance(output, dict)
+        self.assertIsInstance(output, Mapping)
 
     def test_records_fetch_record_type_missing_record_type(self) -> None:
         with self.assertRaisesRegex(Exception,
@@ -147,6 +150,47 @@ class TestRecords(unittest.TestCase):
         self.assertIsInstance(output_json, dict)
         self.assertTrue("summary" in output_uri)
 
+    def test_records_random_record_is_reproducible(self) -> None:
+        records = self.task_set.appian.records
+        records.interactor.random = random.Random(7)
+        first_picks = [records._get_random_record_instance() for _ in range(5)]
+        records.interactor.random = random.Random(7)
+        self.assertEqual(first_picks, [records._get_random_record_instance() for _ in range(5)])
+
+    def test_records_weighted_record_types(self) -> None:
+        records = self.task_set.appian.records
+        records.get_all()
+        record_types = list(records._records)
+        records.set_record_type_weights({record_types[-1]: 1})
+        self.assertEqual({record_types[-1]}, {records._get_random_record_type() for _ in range(20)})
+
+        records.set_record_type_weights(None)
+        self.assertEqual(set(record_types), {records._get_random_record_type() for _ in range(200)})
+
+    def test_records_access_distribution(self) -> None:
+        records = self.task_set.appian.records
+        records.get_all()
+        records.set_access_distribution(SequentialAccess())
+        record_names = list(records._records["Commits"])
+        self.assertEqual(record_names[:2], [records._get_random_record_instance("Commits")[1] for _ in range(2)])
+
+    def test_records_random_record_skips_error_placeholders(self) -> None:
+        records = self.task_set.appian.records
+        records.get_all()
+        commits = records._records["Commits"]
+        record_names = list(commits)
+        commits["ERROR::1"] = {}
+        commits["ERROR::2"] = {}
+
+        picks = {records._get_random_record_instance("Commits")[1] for _ in range(200)}
+        self.assertTrue(picks)
+        self.assertTrue(picks <= set(record_names))
+
+        for name in record_names:
+            del commits[name]
+        with self.assertRaisesRegex(Exception, "There is no item to select randomly"):
+            records._get_random_record_instance("Commits")
+
     def test_records_visit_random_no_record_type_failure(self) -> None:
         with self.assertRaisesRegex(Exception,
                                     "If record_name parameter is specified, record_type must also be included"):
@@ -3,7 +3,8 @@ import time
 import unittest
 from typing import List
 
-from appian_locust.records_helper import (get_url_stub_from_record_list_url_path,
+from appian_locust.records_helper import (RecordLinkRoute, RecordLinkUrlType, get_record_link_route,
+                                          get_url_stub_from_record_list_url_path,
                                           get_url_stub_from_record_list_post_request_url)
 
 
@@ -47,6 +48,34 @@ class TestHelper(unittest.TestCase):
         # Then None is returned
         self.assertIsNone(record_instance_url_stub)
 
+    def test_get_record_link_route_for_every_url_type(self) -> None:
+        component = {"siteUrlStub": "my-site", "pageUrlStub": "my-page"}
+        expected_urls = {
+            "/suite/tempo/reports/view/oxy4ed": (RecordLinkUrlType.TEMPO, "/suite/tempo/records/item/ref/view/summary"),
+            "/suite/sites/records/page/db/record/some-record-ref/view/summary":
+                (RecordLinkUrlType.SITE_RECORD, "/suite/sites/records/page/db/record/ref/view/summary"),
+            "/suite/sites/textcolumns/page/500": (RecordLinkUrlType.SITE_PAGE, "/suite/sites/textcolumns/page/500/record/ref/view/summary"),
+            "/suite/rest/a/sites/latest/my-site/pages/my_page/report":
+                (RecordLinkUrlType.SITE_REPORT, "/suite/rest/a/sites/latest/my-site/page/my_page/record/ref/view/summary"),
+            "/suite/rest/a/record/latest/ref/actions":
+                (RecordLinkUrlType.SITE_RECORD_VIEW, "/suite/rest/a/sites/latest/my-site/page/my-page/record/ref/view/summary"),
+        }
+        for url, (url_type, record_link_url) in expected_urls.items():
+            route = get_record_link_route(url)
+            self.assertEqual(url_type, route.url_type, url)
+            self.assertEqual(record_link_url, route.build_url("ref", "summary", component), url)
+
+    def test_get_record_link_route_dashboard(self) -> None:
+        route = get_record_link_route("/suite/tempo/reports/view/oxy4ed")
+        self.assertEqual(RecordLinkRoute(RecordLinkUrlType.TEMPO, "/suite/tempo/records/item/"), route)
+        self.assertEqual("/suite/tempo/records/item/ref/view/news", route.build_url("ref", "news", {}))
+
+    def test_get_record_link_route_unexpected_url(self) -> None:
+        with self.assertRaisesRegex(Exception, "Unexpected record link URL"):
+            get_record_link_route("fake_uri")
+        with self.assertRaisesRegex(Exception, "couldn't find page name after /pages/"):
+            get_record_link_route("/suite/sites/my-site/pages/-/report")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,40 @@
+import json
+import unittest
+
+from appian_locust._sail_json import decode_response, loads_sail
+from requests.models import Response
+
+from .mock_reader import read_mock_file
+
+
+class TestSailJson(unittest.TestCase):
+
+    def test_loads_sail(self) -> None:
+        document = read_mock_file("form_content_response.json")
+        self.assertEqual(json.loads(document), loads_sail(document))
+        self.assertEqual(json.loads(document), loads_sail(document.encode("utf-16")))
+
+    def test_keys_and_short_values_are_shared(self) -> None:
+        document = '{"#t": "TextField", "label": "%s", "value": "%s"}'
+        first = loads_sail(document % ("Name", "x" * 100))
+        second = loads_sail(document % ("Name", "x" * 100))
+
+        for first_key, second_key in zip(first, second):
+            self.assertIs(first_key, second_key)
+        self.assertIs(first["#t"], second["#t"])
+        self.assertIs(first["label"], second["label"])
+        # Long values are left alone
+        self.assertIsNot(first["value"], second["value"])
+
+    def test_decode_response(self) -> None:
+        response = Response()
+        response._content = '{"#t": "TextField", "label": "Näme"}'.encode()
+        response.encoding = "utf-8"
+
+        decoded = decode_response(response)
+        self.assertEqual({"#t": "TextField", "label": "Näme"}, decoded)
+        self.assertIs(loads_sail('{"#t": "TextField"}')["#t"], decoded["#t"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from appian_locust._sampling import (AccessDistribution, AliasTable, HotSetAccess, SampleSet, SequentialAccess, UniformAccess, WeightedSampleSet,
+                                     ZipfAccess, create_user_random, get_run_seed, set_run_seed)
+
+
+class TestSampling(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        set_run_seed(None)
+
+    def test_user_random_is_reproducible_with_run_seed(self) -> None:
+        set_run_seed(1234)
+        first_run = [create_user_random().random() for _ in range(3)]
+        set_run_seed(1234)
+        second_run = [create_user_random().random() for _ in range(3)]
+
+        self.assertEqual(1234, get_run_seed())
+        self.assertEqual(first_run, second_run)
+        # Each user gets its own sequence
+        self.assertEqual(3, len(set(first_run)))
+        self.assertEqual(first_run[1], create_user_random(user_index=1).random())
+
+    def test_user_random_without_run_seed(self) -> None:
+        self.assertNotEqual(create_user_random(0).random(), create_user_random(0).random())
+
+    def test_sample_set(self) -> None:
+        samples = SampleSet(["a", "b", "c"])
+        rng = random.Random(0)
+        picks = {samples.sample(rng) for _ in range(100)}
+        self.assertEqual({"a", "b", "c"}, picks)
+
+    def test_sample_set_with_exclusions(self) -> None:
+        samples = SampleSet(range(100))
+        rng = random.Random(0)
+        exclude = set(range(99))
+        # Most picks are excluded, the remaining item is found by filtering
+        self.assertEqual(99, samples.sample(rng, exclude))
+        self.assertNotIn(samples.sample(rng, {0, 1}), {0, 1})
+        with self.assertRaisesRegex(Exception, "There is no item to select randomly"):
+            samples.sample(rng, set(range(100)))
+        with self.assertRaisesRegex(Exception, "There is no item to select randomly"):
+            SampleSet([]).sample(rng)
+
+    def test_weighted_sample_set(self) -> None:
+        samples = WeightedSampleSet({"never": 0, "rare": 1, "common": 9})
+        rng = random.Random(0)
+        counts = Counter(samples.sample(rng) for _ in range(10000))
+
+        self.assertNotIn("never", counts)
+        self.assertAlmostEqual(0.9, counts["common"] / 10000, delta=0.02)
+
+    def test_weighted_sample_set_invalid_weights(self) -> None:
+        with self.assertRaisesRegex(Exception, "must not be negative"):
+            WeightedSampleSet({"a": -1, "b": 2})
+        with self.assertRaisesRegex(Exception, "At least one weight must be positive"):
+            WeightedSampleSet({"a": 0})
+
+    def test_alias_table(self) -> None:
+        table = AliasTable([0, 1, 2, 0, 7])
+        rng = random.Random(0)
+        counts = Counter(table.sample_index(rng) for _ in range(10000))
+
+        self.assertEqual({1, 2, 4}, set(counts))
+        self.assertAlmostEqual(0.7, counts[4] / 10000, delta=0.02)
+        self.assertAlmostEqual(0.2, counts[2] / 10000, delta=0.02)
+
+    def test_uniform_access(self) -> None:
+        rng = random.Random(0)
+        self.assertEqual(set(range(5)), {UniformAccess().sample_index(rng, 5) for _ in range(200)})
+
+    def test_zipf_access(self) -> None:
+        distribution = ZipfAccess(exponent=1.0)
+        rng = random.Random(0)
+        counts = Counter(distribution.sample_index(rng, 4) for _ in range(10000))
+
+        # 1/1, 1/2, 1/3, 1/4 over their sum
+        self.assertAlmostEqual(12 / 25, counts[0] / 10000, delta=0.02)
+        self.assertAlmostEqual(3 / 25, counts[3] / 10000, delta=0.02)
+        # The table follows the number of items
+        self.assertEqual(0, distribution.sample_index(rng, 1))
+        with self.assertRaisesRegex(Exception, "must not be negative"):
+            ZipfAccess(exponent=-1)
+
+    def test_zipf_tables_are_kept_per_size(self) -> None:
+        distribution = ZipfAccess()
+        rng = random.Random(0)
+        with patch("appian_locust._sampling.AliasTable", wraps=AliasTable) as alias_table:
+            for _ in range(10):
+                distribution.sample_index(rng, 4)
+                distribution.sample_index(rng, 7)
+        self.assertEqual(2, alias_table.call_count)
+
+    def test_access_distributions_must_sample(self) -> None:
+        class NoSampleAccess(AccessDistribution):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoSampleAccess()  # type: ignore
+
+    def test_hot_set_access(self) -> None:
+        distribution = HotSetAccess(hot_fraction=0.1, hot_probability=0.9)
+        rng = random.Random(0)
+        counts = Counter(distribution.sample_index(rng, 100) for _ in range(10000))
+
+        self.assertAlmostEqual(0.9, sum(counts[index] for index in range(10)) / 10000, delta=0.02)
+        self.assertEqual(set(range(100)), set(counts))
+        self.assertEqual(0, HotSetAccess().sample_index(rng, 1))
+        with self.assertRaisesRegex(Exception, "hot_fraction must be"):
+            HotSetAccess(hot_fraction=0)
+
+    def test_sequential_access(self) -> None:
+        distribution = SequentialAccess(start=1)
+        rng = random.Random(0)
+        self.assertEqual(["b", "c", "a", "b"], [distribution.pick("abc", rng) for _ in range(4)])
+        with self.assertRaisesRegex(Exception, "There is no item to select randomly"):
+            distribution.pick([], rng)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,15 @@
 import json
 import os
 import unittest
+from typing import Any, Dict
 from unittest.mock import Mock
 
 from appian_locust import AppianClient, AppianTaskSet
 from appian_locust.helper import find_component_by_attribute_in_dict
 from appian_locust import logger
 from locust import Locust, TaskSet
-from appian_locust._save_request_builder import save_builder
+from appian_locust._form_templates import set_form_template_cache, share_form_template
+from appian_locust._save_request_builder import _SAVE_PAYLOAD_TEMPLATES, get_save_payload_template, save_builder
 
 from .mock_client import CustomLocust, SampleAppianTaskSequence
 from .mock_reader import read_mock_file
@@ -75,3 +77,47 @@ class TestSaveRequestBuilder(unittest.TestCase):
 
         self.assertEqual(record_action_payload, json.loads(self.record_action_component_payload_json))
         self.assertEqual(record_action_trigger_payload, json.loads(self.record_action_trigger_payload_json))
+
+    def test_build_json_matches_build(self) -> None:
+        form = json.loads(read_mock_file("form_content_response.json"))
+        text_field = find_component_by_attribute_in_dict("label", "Title", form)
+        for value in [{"#t": "Text", "#v": "Some text"}, {"#t": "Text", "#v": "Ünïcode \"quoted\""}, None]:
+            builder = save_builder().component(text_field).context(form["context"]).uuid(form["uuid"])
+            if value is not None:
+                builder.value(value)
+            self.assertEqual(json.dumps(builder.build()).encode(), builder.build_json())
+
+        record_grid_builder = save_builder().component(text_field).context({}).uuid("uuid").record_url_stub("stub")
+        self.assertEqual(json.dumps(record_grid_builder.build()).encode(), record_grid_builder.build_json())
+
+    def test_changed_components_are_serialized_again(self) -> None:
+        component: Dict[str, Any] = {"_cId": "abc", "value": "first", "saveInto": [], "#t": "TextField"}
+        builder = save_builder().component(component).context({}).uuid("uuid").value({"#t": "Text", "#v": "typed"})
+        builder.build_json()
+
+        component["value"] = "second"
+        payload = json.loads(builder.build_json())
+        self.assertEqual("second", payload["updates"]["#v"][0]["model"]["value"])
+        self.assertNotIn(id(component), _SAVE_PAYLOAD_TEMPLATES)
+
+    def test_shared_components_use_templates(self) -> None:
+        set_form_template_cache()
+        try:
+            form = share_form_template(json.loads(read_mock_file("form_content_response.json")))
+            text_field = find_component_by_attribute_in_dict("label", "Title", form)
+            builder = save_builder().component(text_field).context(form["context"]).uuid(form["uuid"]).value({"#t": "Text", "#v": "typed"})
+
+            self.assertEqual(json.dumps(builder.build()).encode(), builder.build_json())
+            self.assertIs(text_field, _SAVE_PAYLOAD_TEMPLATES[id(text_field)].component)
+        finally:
+            set_form_template_cache(None)
+
+    def test_save_payload_templates_are_compiled_once_per_component(self) -> None:
+        component: Dict[str, Any] = {"_cId": "abc", "value": None, "saveInto": [], "#t": "ButtonWidget"}
+        template = get_save_payload_template(component, [])
+
+        self.assertIs(template, get_save_payload_template(component, []))
+        self.assertIsNot(template, get_save_payload_template(dict(component), []))
+        payload = json.loads(template.render({"type": "stateful"}, "uuid", 1))
+        self.assertEqual(1, payload["updates"]["#v"][0]["value"])
+        self.assertEqual(component, payload["updates"]["#v"][0]["model"])
@@ -0,0 +1,78 @@
+import random
+import zlib
+import unittest
+from unittest.mock import patch
+
+from appian_locust._synthetic_documents import SyntheticDocumentGenerator, _random_bytes, generate_document
+
+
+class TestSyntheticDocuments(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.generator = SyntheticDocumentGenerator(seed=7)
+
+    def test_generate_size_and_name(self) -> None:
+        document = self.generator.generate(10000, "pdf", index=3)
+        self.assertEqual(10000, document.size)
+        self.assertEqual("synthetic_3.pdf", document.name)
+        self.assertTrue(bytes(document.content).startswith(b"%PDF-1.4\n"))
+
+    def test_content_is_deterministic(self) -> None:
+        first = self.generator.generate(5000, "bin", entropy=0.5, index=1)
+        other_generator = SyntheticDocumentGenerator(seed=7)
+        self.assertEqual(bytes(first.content), bytes(other_generator.generate(5000, "bin", entropy=0.5, index=1).content))
+        self.assertEqual(first.digest, other_generator.generate(5000, "bin", entropy=0.5, index=1).digest)
+
+    def test_indexes_and_seeds_give_distinct_documents(self) -> None:
+        digests = {self.generator.generate(1000, index=index).digest for index in range(50)}
+        self.assertEqual(50, len(digests))
+        self.assertNotEqual(self.generator.generate(1000).digest, SyntheticDocumentGenerator(seed=8).generate(1000).digest)
+
+    def test_documents_are_cached(self) -> None:
+        self.assertIs(self.generator.generate(1000, "csv"), self.generator.generate(1000, "csv"))
+        self.assertIsNot(self.generator.generate(1000, "csv"), self.generator.generate(1000, "txt"))
+
+    def test_cache_is_bounded(self) -> None:
+        generator = SyntheticDocumentGenerator(max_cached_bytes=2500)
+        first = generator.generate(1000, index=1)
+        generator.generate(1000, index=2)
+        generator.generate(1000, index=3)
+        self.assertIsNot(first, generator.generate(1000, index=1))
+        self.assertEqual(bytes(first.content), bytes(generator.generate(1000, index=1).content))
+
+    def test_entropy_controls_compressibility(self) -> None:
+        def compressed_ratio(entropy: float) -> float:
+            content = bytes(self.generator.generate(100000, "bin", entropy=entropy).content)
+            return len(zlib.compress(content)) / len(content)
+
+        self.assertLess(compressed_ratio(0.0), 0.01)
+        self.assertLess(compressed_ratio(0.25), 0.4)
+        self.assertGreater(compressed_ratio(1.0), 0.99)
+
+    def test_text_documents_are_printable(self) -> None:
+        content = bytes(self.generator.generate(5000, "txt", entropy=0.3).content)
+        self.assertLessEqual(set(content), set(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ,.;\n"))
+
+    def test_generate_document_shared_generator(self) -> None:
+        self.assertIs(generate_document(100, index=5), generate_document(100, index=5))
+
+    def test_random_bytes_without_randbytes(self) -> None:
+        self.assertEqual(b"", _random_bytes(random.Random(1), 0))
+        self.assertEqual(5, len(_random_bytes(random.Random(1), 5)))
+        # Random.randbytes is missing before Python 3.9
+        with patch.object(random.Random, "randbytes", side_effect=AttributeError, create=True):
+            document = SyntheticDocumentGenerator(seed=3).generate(3000, "pdf", entropy=0.5)
+        self.assertEqual(3000, document.size)
+        self.assertTrue(bytes(document.content).startswith(b"%PDF-1.4\n"))
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaisesRegex(Exception, "Unsupported file type 'exe'"):
+            self.generator.generate(10, "exe")
+        with self.assertRaisesRegex(Exception, "Entropy must be between 0 and 1"):
+            self.generator.generate(10, entropy=2)
+        with self.assertRaisesRegex(Exception, "Document size must not be negative"):
+            self.generator.generate(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
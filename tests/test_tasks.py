@@ -1,8 +1,14 @@
+import json
 import os
 import unittest
+from typing import Any, List
+from unittest.mock import patch
+
+import gevent  # type: ignore
 
 from appian_locust import AppianTaskSet
 from appian_locust._tasks import _Tasks
+from appian_locust.helper import ENV
 from locust import Locust, TaskSet
 
 from tests.mock_client import CustomLocust
@@ -14,6 +20,8 @@ class TestTask(unittest.TestCase):
     task_feed_resp = read_mock_file("tasks_response.json")
     task_feed_with_next = read_mock_file("tasks_response_with_next.json")
 
+    next_page_uri = "https://an-appian-instance.host.net/suite/api/feed/tempo?b=2020-03-26T11:03:17.880Z&s=pt&t=t&defaultFacets=%5Bstatus-open%5D&m=menu-tasks"
+
     def get_task_attributes(self, is_auto_acceptable: bool) -> str:
         return f"""
         {{
@@ -82,6 +90,106 @@ class TestTask(unittest.TestCase):
 
         self.assertEqual(output.form_url, "/suite/rest/a/task/latest/1/form")
 
+    def setup_task_pipeline(self) -> List[str]:
+        # Both pages of the feed, with every task auto acceptable
+        self.custom_locust.set_response(_Tasks.INITIAL_FEED_URI, 200, self.task_feed_with_next)
+        self.custom_locust.set_response(self.next_page_uri, 200, self.task_feed_resp)
+        task_ids = [entry["id"].replace("t-", "") for feed in (self.task_feed_with_next, self.task_feed_resp)
+                    for entry in json.loads(feed)["feed"]["entries"]]
+        for task_id in task_ids:
+            self.custom_locust.set_response(f"/suite/rest/a/task/latest/{task_id}/attributes", 200,
+                                            self.get_task_attributes(is_auto_acceptable=True))
+        return task_ids
+
+    def test_task_pipeline_accepts_all_tasks_in_feed_order(self) -> None:
+        task_ids = self.setup_task_pipeline()
+        fired: List[Any] = []
+
+        def listener(**kwargs: Any) -> None:
+            fired.append(kwargs)
+        ENV.events.request.add_listener(listener)
+        try:
+            forms = list(self.task_set.appian.tasks.iter_accepted_tasks(prefetch=3, accept_concurrency=2))
+        finally:
+            ENV.events.request.remove_listener(listener)
+
+        self.assertEqual(21, len(forms))
+        self.assertEqual([f"/suite/rest/a/task/latest/{task_id}/form" for task_id in task_ids], [form.form_url for form in forms])
+        accepts = [request for request in self.custom_locust.get_request_list() if request["path"].endswith("/status")]
+        self.assertEqual(21, len(accepts))
+        self.assertTrue(all(request["data"] == b"accepted" for request in accepts))
+        # Tasks of the pipeline can be looked up afterwards
+        self.assertEqual("t-1", self.task_set.appian.tasks.get_task("t-1", False)["id"])
+
+        timings = self.task_set.appian.tasks.pipeline_timings
+        self.assertEqual(2, len(timings["Page"]))
+        self.assertEqual(11, len(timings["Accept"]))
+        self.assertEqual(11, len(timings["Attributes"]))
+        metric_names = {metric["name"] for metric in fired if metric["request_type"] == "TASK_PIPELINE"}
+        self.assertEqual({"Tasks.Pipeline.Page", "Tasks.Pipeline.Attributes", "Tasks.Pipeline.Accept"}, metric_names)
+
+    def test_task_pipeline_prefetches_attributes(self) -> None:
+        task_ids = self.setup_task_pipeline()
+        pipeline = self.task_set.appian.tasks.iter_accepted_tasks(prefetch=3, accept_concurrency=1)
+        next(pipeline)
+
+        paths = [request["path"] for request in self.custom_locust.get_request_list()]
+        first_accept = paths.index(f"/suite/rest/a/task/latest/{task_ids[0]}/status")
+        self.assertLess(paths.index(f"/suite/rest/a/task/latest/{task_ids[2]}/attributes"), first_accept)
+        # Only the first task has been accepted, and the second page has not been requested yet
+        self.assertEqual(1, len([path for path in paths if path.endswith("/status")]))
+        self.assertNotIn(self.next_page_uri, paths)
+
+    def test_task_pipeline_closed_early_kills_prefetches(self) -> None:
+        task_ids = self.setup_task_pipeline()
+        tasks = self.task_set.appian.tasks
+        get_task_attributes = tasks.task_opener.get_task_attributes
+        finished: List[str] = []
+        prefetching: List[Any] = []
+
+        def slow_task_attributes(task_title: str, task_id: str) -> Any:
+            # Only the first task gets its attributes right away
+            if task_id != task_ids[0]:
+                prefetching.append(gevent.getcurrent())
+                gevent.sleep(10)
+            finished.append(task_id)
+            return get_task_attributes(task_title, task_id)
+        with patch.object(tasks.task_opener, "get_task_attributes", side_effect=slow_task_attributes):
+            pipeline = tasks.iter_accepted_tasks(prefetch=3, accept_concurrency=1)
+            next(pipeline)
+            pipeline.close()
+            gevent.sleep(0)
+
+        self.assertEqual([task_ids[0]], finished)
+        self.assertEqual(3, len(prefetching))
+        self.assertTrue(all(greenlet.dead for greenlet in prefetching))
+        paths = [request["path"] for request in self.custom_locust.get_request_list()]
+        self.assertEqual(1, len([path for path in paths if path.endswith("/status")]))
+
+    def test_task_pipeline_stops_after_max_tasks(self) -> None:
+        self.setup_task_pipeline()
+        forms = list(self.task_set.appian.tasks.iter_accepted_tasks(max_tasks=3))
+
+        self.assertEqual(3, len(forms))
+        paths = [request["path"] for request in self.custom_locust.get_request_list()]
+        self.assertEqual(3, len([path for path in paths if path.endswith("/attributes")]))
+        self.assertNotIn(self.next_page_uri, paths)
+
+    def test_task_pipeline_skips_failed_tasks(self) -> None:
+        task_ids = self.setup_task_pipeline()
+        self.custom_locust.set_response(f"/suite/rest/a/task/latest/{task_ids[1]}/attributes", 500, "{}")
+        ENV.stats.errors.clear()
+
+        forms = list(self.task_set.appian.tasks.iter_accepted_tasks())
+
+        self.assertEqual(20, len(forms))
+        self.assertNotIn(f"/suite/rest/a/task/latest/{task_ids[1]}/form", [form.form_url for form in forms])
+        self.assertIn(f'DESC: Could not get the attributes of task {task_ids[1]}', [error.method for error in ENV.stats.errors.values()])
+
+    def test_task_pipeline_invalid_arguments(self) -> None:
+        with self.assertRaisesRegex(Exception, "must be at least 1"):
+            next(self.task_set.appian.tasks.iter_accepted_tasks(prefetch=0))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+from locust import TaskSet, Locust
+from .mock_client import CustomLocust
+from appian_locust import AppianTaskSet
+from appian_locust._transactions import Transaction, business_transaction
+from appian_locust.helper import ENV
+
+import unittest
+from typing import Any, Dict, List
+
+
+class TestTransactions(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.custom_locust = CustomLocust(Locust())
+        parent_task_set = TaskSet(self.custom_locust)
+        setattr(parent_task_set, "host", "")
+        setattr(parent_task_set, "auth", ["", ""])
+        self.task_set = AppianTaskSet(parent_task_set)
+        self.task_set.host = ""
+
+        self.custom_locust.set_response("auth?appian_environment=tempo", 200, '{}')
+        self.task_set.on_start()
+        self.custom_locust.set_response("/suite/one", 200, '{"a": 1}')
+        self.custom_locust.set_response("/suite/two", 200, '{"b": 22}')
+        self.custom_locust.set_response("/suite/failed", 500, '{}')
+
+        self.requests: List[Dict[str, Any]] = []
+        ENV.events.request.add_listener(self.record)
+        self.addCleanup(ENV.events.request.remove_listener, self.record)
+
+    def tearDown(self) -> None:
+        self.task_set.on_stop()
+
+    def record(self, **kwargs: Any) -> None:
+        if kwargs["request_type"] == "TRANSACTION":
+            self.requests.append(kwargs)
+
+    def test_transaction_groups_requests(self) -> None:
+        interactor = self.task_set.appian.interactor
+        with self.task_set.appian.transaction("Submit Order") as transaction:
+            interactor.get_page("/suite/one", check_login=False)
+            interactor.post_page("/suite/two", check_login=False)
+
+        self.assertEqual(2, transaction.requests)
+        self.assertEqual(0, transaction.failed_requests)
+        self.assertEqual([], interactor.transactions)
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual("Submit Order", self.requests[0]["name"])
+        self.assertEqual(len('{"a": 1}') + len('{"b": 22}'), self.requests[0]["response_length"])
+        self.assertIsNone(self.requests[0]["exception"])
+
+    def test_requests_outside_transaction_are_not_counted(self) -> None:
+        interactor = self.task_set.appian.interactor
+        interactor.get_page("/suite/one", check_login=False)
+        with self.task_set.appian.transaction("Submit Order") as transaction:
+            interactor.get_page("/suite/two", check_login=False)
+        interactor.get_page("/suite/one", check_login=False)
+
+        self.assertEqual(1, transaction.requests)
+        self.assertEqual(len('{"b": 22}'), self.requests[0]["response_length"])
+
+    def test_nested_transactions_count_each_request(self) -> None:
+        interactor = self.task_set.appian.interactor
+        with self.task_set.appian.transaction("Order") as outer:
+            interactor.get_page("/suite/one", check_login=False)
+            with self.task_set.appian.transaction("Order.Submit") as inner:
+                interactor.get_page("/suite/two", check_login=False)
+
+        self.assertEqual(2, outer.requests)
+        self.assertEqual(1, inner.requests)
+        self.assertEqual(["Order.Submit", "Order"], [request["name"] for request in self.requests])
+
+    def test_failed_request_fails_transaction(self) -> None:
+        with self.task_set.appian.transaction("Submit Order") as transaction:
+            self.task_set.appian.interactor.get_page("/suite/failed", check_login=False)
+
+        self.assertEqual(1, transaction.failed_requests)
+        self.assertEqual("1 of the 1 requests of 'Submit Order' failed", str(self.requests[0]["exception"]))
+
+    def test_exception_fails_transaction_and_propagates(self) -> None:
+        with self.assertRaisesRegex(Exception, "Submit button not found"):
+            with self.task_set.appian.transaction("Submit Order"):
+                raise Exception("Submit button not found")
+
+        self.assertEqual("Submit button not found", str(self.requests[0]["exception"]))
+        self.assertEqual([], self.task_set.appian.interactor.transactions)
+
+    def test_decorator_finds_interactor_of_task_set(self) -> None:
+        @business_transaction("Submit Order")
+        def submit_order(task_set: AppianTaskSet) -> str:
+            task_set.appian.interactor.get_page("/suite/one", check_login=False)
+            return "submitted"
+
+        self.assertEqual("submitted", submit_order(self.task_set))
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual("Submit Order", self.requests[0]["name"])
+
+    def test_decorator_requires_interactor(self) -> None:
+        @business_transaction("Submit Order")
+        def submit_order(owner: Any) -> None:
+            pass
+
+        with self.assertRaisesRegex(Exception, "Could not find the interactor"):
+            submit_order(object())
+
+    def test_transactions_are_small(self) -> None:
+        transaction = Transaction(self.task_set.appian.interactor, "Submit Order")
+
+        self.assertFalse(hasattr(transaction, "__dict__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
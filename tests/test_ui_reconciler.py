@@ -1,4 +1,5 @@
 from appian_locust._ui_reconciler import UiReconciler
+from typing import Any, Dict
 import unittest
 
 
@@ -50,6 +51,39 @@ class TestUiReconciler(unittest.TestCase):
         self.assertEqual(new_component, reconciled_state['ui']['contents'][0]['contents'][0])
         self.assertEqual(old_unchanged_component, reconciled_state['ui']['contents'][0]['contents'][1])
 
+    def test_reconcile_only_copies_modified_path(self) -> None:
+        # Given
+        old_component = {'_cId': '12345', 'value': "This is what it used to be", 'label': "Old"}
+        unchanged_layout = {'contents': [{'_cId': '55555', 'value': "This is what it used to be"}]}
+        old_state: Dict[str, Any] = {'context': 'abc', "ui": {'#t': 'abc', 'contents': [{'contents': [old_component]}, unchanged_layout]}}
+        new_component = {'_cId': '12345', 'value': "This is what it is now"}
+        new_state = {'context': '123', "ui": {'#t': UiReconciler.COMPONENT_DELTA_TYPE, 'modifiedComponents': [new_component]}}
+
+        # When
+        reconciled_state = self.reconciler.reconcile_ui(old_state, new_state)
+
+        # Then
+        self.assertEqual({'_cId': '12345', 'value': "This is what it is now", 'label': "Old"},
+                         reconciled_state['ui']['contents'][0]['contents'][0])
+        self.assertIs(unchanged_layout, reconciled_state['ui']['contents'][1])
+        self.assertEqual("This is what it used to be", old_state['ui']['contents'][0]['contents'][0]['value'])
+        self.assertEqual('abc', old_state['context'])
+
+    def test_reconcile_reports_modified_components(self) -> None:
+        # Given
+        old_state = {'context': 'abc', "ui": {'#t': 'abc', 'contents': [{'_cId': '12345', 'value': 1, 'label': "Old"}]}}
+        new_state = {'context': '123', "ui": {'#t': UiReconciler.COMPONENT_DELTA_TYPE, 'modifiedComponents': [{'_cId': '12345', 'value': 2}]}}
+        modified_components: Dict[str, Any] = {}
+
+        # When
+        reconciled_state = self.reconciler.reconcile_ui(old_state, new_state, modified_components)
+
+        # Then
+        self.assertTrue(UiReconciler.is_delta(new_state))
+        self.assertFalse(UiReconciler.is_delta(old_state))
+        self.assertEqual({'12345': {'_cId': '12345', 'value': 2, 'label': "Old"}}, modified_components)
+        self.assertIs(modified_components['12345'], reconciled_state['ui']['contents'][0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,17 @@
 import datetime
+import importlib.util
 import json
 import unittest
 from typing import Any, List, Optional
 from unittest.mock import MagicMock, patch
 
 from appian_locust import AppianTaskSet, SailUiForm
+from appian_locust._form_memory import FORM_STATE_BUDGET, set_form_state_budget
+from appian_locust._pacing import SELECTING, TYPING, ThinkTime
+from appian_locust._sail_json import loads_sail
+from appian_locust._synthetic_documents import generate_document
 from appian_locust.uiform import PROCESS_TASK_LINK_TYPE
+from appian_locust.records_helper import get_record_link_route
 from appian_locust.helper import (ENV, find_component_by_attribute_in_dict,
                                   find_component_by_index_in_dict,
                                   find_component_by_label_and_type_dict)
@@ -95,6 +101,82 @@ class TestSailUiForm(unittest.TestCase):
             sail_form.sort_paging_grid(index=0)
         self.assertEqual(4, len(ENV.stats.errors))
 
+    def test_find_components_by_selector(self) -> None:
+        form_label = 'Top Sales Reps by Total Sales'
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+
+        record_links = sail_form.find_components(f'GridField[label="{form_label}"] > RecordLink')
+        third_record_link = sail_form.find_component(f'GridField[label="{form_label}"] > RecordLink:nth(3)')
+        self.assertEqual(10, len(record_links))
+        self.assertIs(record_links[2], third_record_link)
+        with self.assertRaisesRegex(ComponentNotFoundException, "matching 'GridField\\[label=\"Orders\"\\]'"):
+            sail_form.find_component('GridField[label="Orders"]')
+
+    def test_find_components_cached_per_state_version(self) -> None:
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+        grid = sail_form.find_component('GridField')
+        self.assertIs(grid, sail_form.find_component('GridField'))
+
+        self.custom_locust.set_response("/suite/rest/a/sites/latest/D6JMim/pages/reports/report/yS9bXA/reportlink",
+                                        200, report_form)
+        version = sail_form.state_version
+        sail_form.move_to_right_in_paging_grid(index=0)
+        self.assertEqual(version + 1, sail_form.state_version)
+        self.assertIsNot(grid, sail_form.find_component('GridField'))
+
+    def test_get_grid_data(self) -> None:
+        form_label = 'Top Sales Reps by Total Sales'
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+
+        grid_data = sail_form.get_grid_data(label=form_label)
+        self.assertEqual('$18,934.08', grid_data['Total'][0])
+        self.assertEqual(10, len(grid_data['Account Owner']))
+        self.assertIs(grid_data, sail_form.get_grid_data(label=form_label))
+        self.assertEqual(grid_data, sail_form.get_grid_data(index=0))
+
+        # Cached data is dropped once the state changes
+        self.custom_locust.set_response("/suite/rest/a/sites/latest/D6JMim/pages/reports/report/yS9bXA/reportlink",
+                                        200, report_form)
+        sail_form.move_to_right_in_paging_grid(label=form_label)
+        self.assertIsNot(grid_data, sail_form.get_grid_data(label=form_label))
+
+    def test_get_grid_data_missing_grid(self) -> None:
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+        with self.assertRaisesRegex(Exception, "Grid with label 'dummy_label'"):
+            sail_form.get_grid_data(label='dummy_label')
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    def test_get_grid_data_as_numpy(self) -> None:
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+
+        grid_data = sail_form.get_grid_data(index=0, as_numpy=True)
+        self.assertEqual((10,), grid_data['Total'].shape)
+        self.assertEqual('$18,934.08', grid_data['Total'][0])
+
+    @unittest.skipIf(importlib.util.find_spec("numpy"), "NumPy is installed")
+    def test_get_grid_data_as_numpy_not_installed(self) -> None:
+        report_form = read_mock_file("report_with_rep_sales_grid.json")
+        self.custom_locust.set_response(self.report_link_uri,
+                                        200, report_form)
+        sail_form = self.task_set.appian.reports.visit_and_get_form(self.report_name, False)
+        with self.assertRaisesRegex(Exception, "NumPy must be installed"):
+            sail_form.get_grid_data(index=0, as_numpy=True)
+
     def test_datatype_caching(self) -> None:
         body_with_types = read_mock_file("page_resp.json")
         self.custom_locust.set_response(self.report_link_uri,
@@ -301,6 +383,50 @@ class TestSailUiForm(unittest.TestCase):
             sail_form = SailUiForm(self.task_set.appian.interactor, ui, self.process_model_form_uri)
             sail_form.upload_document_to_upload_field(label, file)
 
+    def test_upload_generated_document(self) -> None:
+        label = 'my_label'
+        ui = {
+            'contents': [
+                {
+                    "label": label,
+                    "_cId": "upload_cid",
+                    "saveInto": {},
+                    "#t": "FileUploadWidget"
+                },
+            ],
+            'context': 'my_context',
+            'uuid': 'my_uuid'
+        }
+        self.custom_locust.set_response("/suite/api/tempo/file?validateExtension=false", 200, '[{"id": 123}]')
+        self.custom_locust.set_response(self.process_model_form_uri, 200, json.dumps(ui))
+        sail_form = SailUiForm(self.task_set.appian.interactor, ui, self.process_model_form_uri)
+
+        sail_form.upload_document_to_upload_field(label, generate_document(100, "txt"))
+
+        upload_request = self.custom_locust.get_request_list()[-2]
+        self.assertEqual("Document.Upload.synthetic_0.txt", upload_request['name'])
+        save_request = json.loads(self.custom_locust.get_request_list()[-1]['data'])
+        self.assertIn('123', json.dumps(save_request['updates']))
+
+    def test_click_record_link_route_is_cached_per_form_url(self) -> None:
+        ui = {
+            'contents': [{"#t": "RecordLink", "label": "My Record", "_recordRef": "my_ref"}],
+            'links': [{'rel': 'update', 'href': 'https://instance.net/suite/sites/textcolumns/page/500'}],
+            'context': 'my_context',
+            'uuid': 'my_uuid'
+        }
+        sail_form = SailUiForm(self.task_set.appian.interactor, ui, "/suite/sites/textcolumns/page/500")
+        mock_get_page = MagicMock()
+        mock_get_page.return_value.json.return_value = ui
+        setattr(self.task_set.appian.interactor, 'get_page', mock_get_page)
+
+        with patch('appian_locust.uiform.get_record_link_route', wraps=get_record_link_route) as mock_route:
+            sail_form.click_record_link("My Record").click_record_link("My Record")
+
+        mock_route.assert_called_once_with("/suite/sites/textcolumns/page/500")
+        self.assertEqual(2, mock_get_page.call_count)
+        self.assertEqual("/suite/sites/textcolumns/page/500/record/my_ref/view/summary", mock_get_page.call_args[0][0])
+
     def test_click_related_action_on_record_form(self) -> None:
         self.custom_locust.set_response('/suite/rest/a/record/latest/BE5pSw/ioBHer_bdD8Emw8hMSiA_CnpxaK0CVK61sPetEqM0lI_pHvjAsXVOlJtUo/actions/'
                                         'ioBHer_bdD8Emw8hMSiA_CnpxaA0SVKp1kzE9BURlYvkxHjzPlX0d81Hmk',
@@ -319,6 +445,19 @@ class TestSailUiForm(unittest.TestCase):
         text_component = find_component_by_attribute_in_dict('label', 'Action Type', record_instance_related_action_form.state)
         self.assertEqual(text_component.get("#t"), "TextField")
 
+    def test_embedded_forms_are_parsed_once_per_state(self) -> None:
+        sail_form = SailUiForm(self.task_set.appian.interactor, json.loads(self.record_instance_response), "/suite/rest/a/sites/latest/D6JMim")
+        with patch('appian_locust.uiform.loads_sail', wraps=loads_sail) as mock_loads_sail:
+            header_form = sail_form.get_record_header_form()
+            self.assertIs(header_form.state, sail_form.get_record_header_form().state)
+            self.assertEqual(1, mock_loads_sail.call_count)
+            sail_form.get_record_view_form()
+            self.assertEqual(2, mock_loads_sail.call_count)
+
+            sail_form.state_version += 1
+            self.assertIsNot(header_form.state, sail_form.get_record_header_form().state)
+            self.assertEqual(3, mock_loads_sail.call_count)
+
     @patch('appian_locust._interactor._Interactor.get_page')
     def test_filter_records_using_searchbox(self, mock_get_page: MagicMock) -> None:
         uri = 'suite/rest/a/sites/latest/D6JMim/pages/records/recordType/commit'
@@ -442,6 +581,91 @@ class TestSailUiForm(unittest.TestCase):
     def _unwrap_value(self, json_str: str) -> str:
         return json.loads(json_str)['updates']['#v'][0]['value']['#v']
 
+    def test_stateless_mode_keeps_context_compressed(self) -> None:
+        self.task_set.appian.set_stateless_mode()
+        self.assertEqual("stateless", self.task_set.appian.interactor.setup_request_headers()["X-Appian-Ui-State"])
+        date_state = json.loads(self.date_response)
+        test_form = self._setup_date_form()
+        other_form = self._setup_date_form()
+
+        self.assertTrue(test_form.stateless)
+        self.assertNotIn("context", test_form.state)
+        self.assertEqual(date_state["context"], test_form.context)
+        # Forms with the same context share it
+        self.assertIs(test_form._context, other_form._context)
+
+        test_form.fill_date_field('Date', datetime.date(1990, 1, 5))
+        last_request = self.custom_locust.get_request_list().pop()
+        self.assertEqual(date_state["context"], json.loads(last_request['data'])['context'])
+        self.assertEqual(date_state["context"], test_form.context)
+        self.assertNotIn("context", test_form.state)
+
+        new_state = json.loads(self.spl_response)
+        test_form._reconcile_state(new_state)
+        self.assertEqual(json.loads(self.spl_response)['context'], test_form.context)
+
+        self.task_set.appian.set_stateless_mode(False)
+        self.assertEqual("stateful", self.task_set.appian.interactor.setup_request_headers()["X-Appian-Ui-State"])
+        self.assertIn("context", self._setup_date_form().state)
+
+    def test_idle_forms_spill_their_state(self) -> None:
+        date_state = json.loads(self.date_response)
+        set_form_state_budget(1)
+        try:
+            test_form = self._setup_date_form()
+            other_form = self._setup_date_form()
+            self.assertTrue(test_form.is_spilled)
+            self.assertFalse(other_form.is_spilled)
+            spilled_footprint = test_form.footprint()
+
+            test_form.fill_date_field('Date', datetime.date(1990, 1, 5))
+            self.assertFalse(test_form.is_spilled)
+            self.assertTrue(other_form.is_spilled)
+            self.assertEqual(date_state["context"], json.loads(self.custom_locust.get_request_list().pop()['data'])['context'])
+            self.assertLess(spilled_footprint, test_form.footprint())
+            self.assertEqual(date_state, other_form.state)
+            self.assertEqual(3, FORM_STATE_BUDGET.spills)
+            self.assertEqual(2, FORM_STATE_BUDGET.rehydrations)
+        finally:
+            set_form_state_budget(None)
+
+    def test_subscriptions_fire_for_changed_components(self) -> None:
+        test_form = self._setup_date_form()
+        date_changes: List[Any] = []
+        text_changes: List[Any] = []
+        test_form.subscribe(lambda form, component: date_changes.append(component["value"]), component_id="bb2064672bcb72cefd193d1d1dadd950")
+        text_subscription = test_form.subscribe(lambda form, component: text_changes.append(component["value"]),
+                                                selector='TextField[label="Text"]')
+
+        date = {"_cId": "bb2064672bcb72cefd193d1d1dadd950", "value": "1990-01-05Z"}
+        test_form._reconcile_state({"context": {}, "ui": {"#t": "UiComponentsDelta", "modifiedComponents": [date]}})
+        self.assertEqual(["1990-01-05Z"], date_changes)
+        self.assertEqual([], text_changes)
+
+        text = {"_cId": "40872512f1f8c429e8f71ec5be9ca0b2", "value": "typed"}
+        test_form._reconcile_state({"context": {}, "ui": {"#t": "UiComponentsDelta", "modifiedComponents": [text]}})
+        self.assertEqual(["typed"], text_changes)
+
+        # A new UI changes every watched component still in the form
+        test_form.unsubscribe(text_subscription)
+        test_form._reconcile_state(json.loads(self.date_response))
+        self.assertEqual(["1990-01-05Z", {'#t': 'date'}], date_changes)
+        self.assertEqual(["typed"], text_changes)
+
+    def test_interactions_think_when_paced(self) -> None:
+        test_form = self._setup_date_form()
+        self.task_set.appian.set_pacing({TYPING: ThinkTime(1, 1, per_character=0.5), SELECTING: ThinkTime(2, 2)})
+        with patch("appian_locust._pacing.gevent.sleep") as sleep:
+            test_form.fill_text_field('Text', 'typed').fill_date_field('Date', datetime.date(1990, 1, 5))
+
+            self.task_set.appian.set_pacing(scale=0)
+            test_form.fill_text_field('Text', 'typed')
+        self.assertEqual([3.5, 2], [call[0][0] for call in sleep.call_args_list])
+
+    def test_subscribe_needs_a_component_id_or_selector(self) -> None:
+        with self.assertRaisesRegex(Exception, "Either a component id or a selector must be passed"):
+            self._setup_date_form().subscribe(lambda form, component: None)
+
     def test_fill_datefield_not_found(self) -> None:
         test_form = self._setup_date_form()
         with self.assertRaisesRegex(Exception, "Could not find the component with label 'Datey' of type 'DatePickerField'"):
@@ -0,0 +1,122 @@
+import email.parser
+import os
+import tempfile
+import unittest
+from typing import Any
+
+from requests import Request
+
+from appian_locust._upload_cache import DocumentIdReusePolicy, MultipartFileBody, UploadCache, UploadSource, hash_content
+
+
+class TestUploadCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = UploadCache(mmap_threshold=64)
+
+    def tearDown(self) -> None:
+        self.cache.clear()
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_file_is_read_once(self) -> None:
+        path = self._write("small.txt", b"hello")
+        first = self.cache.get(path)
+        second = self.cache.get(path)
+        self.assertIs(first, second)
+        self.assertEqual(b"hello", bytes(first.content))
+        self.assertEqual(hash_content(b"hello"), first.digest)
+        self.assertFalse(first.is_mapped)
+        self.assertEqual((1, 1), (self.cache.misses, self.cache.hits))
+
+    def test_identical_content_is_shared(self) -> None:
+        first = self.cache.get(self._write("a.txt", b"same"))
+        second = self.cache.get(self._write("b.txt", b"same"))
+        self.assertIs(first, second)
+        self.assertEqual(1, len(self.cache))
+
+    def test_large_files_are_memory_mapped(self) -> None:
+        content = os.urandom(256)
+        source = self.cache.get(self._write("large.bin", content))
+        self.assertTrue(source.is_mapped)
+        self.assertEqual(content, bytes(source.content))
+        self.assertEqual(256, source.size)
+
+    def test_changed_file_is_read_again(self) -> None:
+        path = self._write("changing.txt", b"before")
+        self.cache.get(path)
+        self._write("changing.txt", b"after, longer")
+        self.assertEqual(b"after, longer", bytes(self.cache.get(path).content))
+
+    def test_add_returns_cached_source(self) -> None:
+        first = self.cache.add(UploadSource("a.txt", b"content"))
+        self.assertIs(first, self.cache.add(UploadSource("b.txt", b"content")))
+
+
+class TestMultipartFileBody(unittest.TestCase):
+
+    def _parse(self, body: MultipartFileBody) -> Any:
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {body.content_type}\r\n\r\n".encode() + body.to_bytes())
+        return message.get_payload()
+
+    def test_body_is_valid_multipart(self) -> None:
+        content = os.urandom(1000)
+        body = MultipartFileBody(memoryview(content), 'my "file".zip')
+        parts = self._parse(body)
+        self.assertEqual(1, len(parts))
+        self.assertEqual('form-data; name="file"; filename="my %22file%22.zip"', parts[0]["Content-Disposition"])
+        self.assertEqual("application/zip", parts[0]["Content-Type"])
+        self.assertEqual(content, parts[0].get_payload(decode=True))
+        self.assertEqual(len(body.to_bytes()), len(body))
+
+    def test_content_is_streamed_in_slices(self) -> None:
+        content = bytes(2 * MultipartFileBody.CHUNK_SIZE + 10)
+        body = MultipartFileBody(memoryview(content), "a.bin")
+        chunks = list(body)
+        self.assertEqual(5, len(chunks))
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks[1:-1]))
+        # The body can be sent again
+        self.assertEqual(body.to_bytes(), b"".join(chunks))
+
+    def test_request_is_sent_with_content_length(self) -> None:
+        body = UploadSource("a.txt", b"content").multipart_body()
+        prepared = Request("POST", "http://localhost/suite/api/tempo/file", data=body,  # type: ignore[arg-type]
+                           headers={"Content-Type": body.content_type}).prepare()
+        self.assertEqual(str(len(body)), prepared.headers["Content-Length"])
+        self.assertNotIn("Transfer-Encoding", prepared.headers)
+        self.assertIs(body, prepared.body)
+
+    def test_body_is_built_once_per_name(self) -> None:
+        source = UploadSource("a.txt", b"content")
+        self.assertIs(source.multipart_body(), source.multipart_body("a.txt"))
+        self.assertIsNot(source.multipart_body(), source.multipart_body("b.txt"))
+
+
+class TestDocumentIdReusePolicy(unittest.TestCase):
+
+    def test_no_reuse_by_default(self) -> None:
+        policy = DocumentIdReusePolicy()
+        policy.record("digest", 1)
+        self.assertIsNone(policy.checkout("digest"))
+
+    def test_reuse_up_to_max_uses(self) -> None:
+        policy = DocumentIdReusePolicy(3)
+        self.assertIsNone(policy.checkout("digest"))
+        policy.record("digest", 1)
+        self.assertEqual([1, 1, None], [policy.checkout("digest") for _ in range(3)])
+        self.assertIsNone(policy.checkout("digest", is_encrypted=True))
+
+    def test_invalid_max_uses(self) -> None:
+        with self.assertRaisesRegex(Exception, "max_uses must be at least 1"):
+            DocumentIdReusePolicy(0)
+
+
+if __name__ == '__main__':
+    unittest.main()